@@ -141,8 +141,14 @@ def load(
 
     channels = file_.getnchannels()
     sample_rate = file_.getframerate()
-    frames = file_.getnframes()  # audio frame
+    total_frames = file_.getnframes()  # audio frame
 
+    # only read the requested frames instead of the whole file
+    frame_offset = min(max(frame_offset, 0), total_frames)
+    frames = total_frames - frame_offset
+    if num_frames != -1:
+        frames = min(max(num_frames, 0), frames)
+    file_.setpos(frame_offset)
     audio_content = file_.readframes(frames)
     file_obj.close()
 
@@ -157,8 +163,6 @@ def load(
         audio_norm = audio_as_np32
 
     waveform = np.reshape(audio_norm, (frames, channels))
-    if num_frames != -1:
-        waveform = waveform[frame_offset : frame_offset + num_frames, :]
     waveform = paddle.to_tensor(waveform)
     if channels_first:
         waveform = paddle.transpose(waveform, perm=[1, 0])
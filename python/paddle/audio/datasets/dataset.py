@@ -11,9 +11,19 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import functools
+import hashlib
+import json
+import os
+import tempfile
 from typing import List
 
 import paddle
+from paddle.framework.io_utils import (
+    _flat_tensor_entries,
+    _mmap_flat_tensor_file,
+    _write_flat_tensor_file,
+)
 
 from ..features import MFCC, LogMelSpectrogram, MelSpectrogram, Spectrogram
 
@@ -26,6 +36,83 @@ feat_funcs = {
 }
 
 
+@functools.lru_cache(maxsize=8)
+def _make_feature_extractor(feat_type, sample_rate, feat_config_items):
+    feat_func = feat_funcs[feat_type]
+    if feat_type != 'spectrogram':
+        return feat_func(sr=sample_rate, **dict(feat_config_items))
+    return feat_func(**dict(feat_config_items))
+
+
+def _get_feature_extractor(feat_type, sample_rate, feat_config):
+    """
+    Returns the feature extractor of the feature type, the recently used ones
+    are cached by the feature config and sample rate, so that the fbank and
+    DCT matrices are computed only once instead of for every sample.
+    """
+    if feat_type == 'spectrogram':
+        sample_rate = None
+    feat_config_items = tuple(sorted(feat_config.items()))
+    try:
+        hash(feat_config_items)
+    except TypeError:
+        # the feature extractor of an unhashable config is not cached
+        return _make_feature_extractor.__wrapped__(
+            feat_type, sample_rate, feat_config_items
+        )
+    return _make_feature_extractor(feat_type, sample_rate, feat_config_items)
+
+
+class _FeatureCache:
+    """
+    On-disk cache of extracted features. Features of one feature config are
+    stored in a sub directory named by the hash of the config, and the
+    feature of each audio file is a flat tensor file named by the hash of
+    the path, size and modification time of the audio file, which is
+    memory-mapped when read. Files are written to a temporary file and
+    renamed, so that the cache can be filled by multiple DataLoader workers
+    at the same time.
+    """
+
+    def __init__(self, cache_dir, feat_type, feat_config):
+        config = json.dumps(
+            {'feat_type': feat_type, 'feat_config': feat_config},
+            sort_keys=True,
+            default=repr,
+        )
+        self.cache_dir = os.path.join(
+            cache_dir,
+            f'{feat_type}-{hashlib.sha1(config.encode()).hexdigest()[:16]}',
+        )
+        os.makedirs(self.cache_dir, exist_ok=True)
+
+    def _path(self, file):
+        stat = os.stat(file)
+        key = f'{os.path.realpath(file)}:{stat.st_size}:{stat.st_mtime_ns}'
+        return os.path.join(
+            self.cache_dir, hashlib.sha1(key.encode()).hexdigest() + '.pdfeat'
+        )
+
+    def get(self, file):
+        path = self._path(file)
+        if not os.path.isfile(path):
+            return None
+        arrays, _ = _mmap_flat_tensor_file(path)
+        return arrays['feat']
+
+    def put(self, file, feat):
+        path = self._path(file)
+        entries = _flat_tensor_entries([('feat', feat.dtype, feat.shape)])
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                _write_flat_tensor_file(f, entries, [('feat', feat)])
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.remove(tmp_path)
+            raise
+
+
 class AudioClassificationDataset(paddle.io.Dataset):
     """
     Base class of audio classification dataset.
@@ -37,6 +124,8 @@ class AudioClassificationDataset(paddle.io.Dataset):
         labels: List[int],
         feat_type: str = 'raw',
         sample_rate: int = None,
+        batch_feature: bool = False,
+        feat_cache_dir: str = None,
         **kwargs,
     ):
         """
@@ -45,6 +134,17 @@ class AudioClassificationDataset(paddle.io.Dataset):
             labels (:obj:`List[int]`): Labels of audio files.
             feat_type (:obj:`str`, `optional`, defaults to `raw`):
                 It identifies the feature type that user wants to extract an audio file.
+            batch_feature (:obj:`bool`, `optional`, defaults to `False`):
+                If True, the samples are raw waveforms and the features are
+                extracted for a whole padded batch at once by `collate_fn`,
+                which should be passed to `paddle.io.DataLoader`.
+            feat_cache_dir (:obj:`str`, `optional`, defaults to `None`):
+                If set, the extracted features of each audio file are
+                cached in this directory on the first access, keyed by the
+                audio file and the feature config, and memory-mapped from
+                the cache afterwards instead of being extracted again. It
+                takes no effect if `feat_type` is `raw` or `batch_feature`
+                is True.
         """
         super().__init__()
 
@@ -58,15 +158,30 @@ class AudioClassificationDataset(paddle.io.Dataset):
 
         self.feat_type = feat_type
         self.sample_rate = sample_rate
+        self.batch_feature = batch_feature
         self.feat_config = (
             kwargs  # Pass keyword arguments to customize feature config
         )
+        self.feat_cache = None
+        if (
+            feat_cache_dir is not None
+            and feat_funcs[feat_type] is not None
+            and not batch_feature
+        ):
+            self.feat_cache = _FeatureCache(
+                feat_cache_dir, feat_type, self.feat_config
+            )
 
     def _get_data(self, input_file: str):
         raise NotImplementedError
 
     def _convert_to_record(self, idx):
         file, label = self.files[idx], self.labels[idx]
+        if self.feat_cache is not None:
+            feat = self.feat_cache.get(file)
+            if feat is not None:
+                return {'feat': paddle.to_tensor(feat), 'label': label}
+
         waveform, sample_rate = paddle.audio.load(file)
         self.sample_rate = sample_rate
 
@@ -76,20 +191,58 @@ class AudioClassificationDataset(paddle.io.Dataset):
         if len(waveform.shape) == 2:
             waveform = waveform.squeeze(0)  # 1D input
         waveform = paddle.to_tensor(waveform, dtype=paddle.float32)
-        if feat_func is not None:
+        if feat_func is not None and not self.batch_feature:
             waveform = waveform.unsqueeze(0)  # (batch_size, T)
-            if self.feat_type != 'spectrogram':
-                feature_extractor = feat_func(
-                    sr=self.sample_rate, **self.feat_config
-                )
-            else:
-                feature_extractor = feat_func(**self.feat_config)
+            feature_extractor = _get_feature_extractor(
+                self.feat_type, self.sample_rate, self.feat_config
+            )
             record['feat'] = feature_extractor(waveform).squeeze(0)
+            if self.feat_cache is not None:
+                self.feat_cache.put(file, record['feat'].numpy())
         else:
             record['feat'] = waveform
         record['label'] = label
         return record
 
+    def collate_fn(self, batch):
+        """
+        Pads the raw waveforms of a batch with zeros to the same length and
+        extracts the features of the whole batch at once, which is used as
+        `collate_fn` of `paddle.io.DataLoader` when `batch_feature` is True.
+
+        Args:
+            batch (:obj:`List[Tuple[paddle.Tensor, int]]`): A list of
+                (waveform, label) samples.
+
+        Returns:
+            Tuple[paddle.Tensor, paddle.Tensor]: The features of shape
+            (batch_size, ...) and the labels of shape (batch_size,).
+        """
+        waveforms, labels = zip(*batch)
+        max_len = max(waveform.shape[0] for waveform in waveforms)
+        waveforms = paddle.stack(
+            [
+                paddle.concat(
+                    [
+                        waveform,
+                        paddle.zeros(
+                            [max_len - waveform.shape[0]], dtype=waveform.dtype
+                        ),
+                    ]
+                )
+                if waveform.shape[0] < max_len
+                else waveform
+                for waveform in waveforms
+            ]
+        )
+        labels = paddle.to_tensor(labels, dtype='int64')
+        if feat_funcs[self.feat_type] is None:
+            return waveforms, labels
+        feature_extractor = _get_feature_extractor(
+            self.feat_type, self.sample_rate, self.feat_config
+        )
+        return feature_extractor(waveforms), labels
+
     def __getitem__(self, idx):
         record = self._convert_to_record(idx)
         return record['feat'], record['label']
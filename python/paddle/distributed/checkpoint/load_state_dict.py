@@ -17,9 +17,16 @@ import os
 from dataclasses import dataclass
 from typing import Tuple
 
+import numpy as np
+
 import paddle
 from paddle.distributed.communication.group import is_initialized
 from paddle.distributed.fleet.utils.log_util import logger
+from paddle.framework.io_utils import (
+    _is_flat_tensor_file,
+    _mmap_flat_tensor_file,
+    _read_flat_tensor_file,
+)
 
 from .metadata import LocalTensorIndex, LocalTensorMetadata
 from .utils import (
@@ -37,6 +44,46 @@ class ReadItem:
     lengths: Tuple[int]
 
 
+def load_storage_file(file_path, use_mmap=False):
+    """
+    Load the local state_dict saved in a storage file, which is either
+    pickled by paddle.save or written as a flat tensor file. If use_mmap is
+    True, the values of flat tensor file are numpy.ndarray views on the
+    memory-mapped file, which are paged in only when sliced and copied.
+    """
+    if not _is_flat_tensor_file(file_path):
+        return paddle.load(file_path)
+    if use_mmap:
+        arrays, _ = _mmap_flat_tensor_file(file_path)
+        return arrays
+    arrays, _ = _read_flat_tensor_file(file_path)
+    return {key: paddle.to_tensor(arr) for key, arr in arrays.items()}
+
+
+def slice_storage_tensor(storage_local_tensor, storage_offsets, storage_ends):
+    """
+    Slice the storage local tensor in (storage_offsets, storage_ends). For
+    memory-mapped numpy.ndarray, only the bytes of the slice are copied.
+    """
+    if isinstance(storage_local_tensor, np.ndarray):
+        chunk = storage_local_tensor[
+            tuple(
+                slice(start, end)
+                for start, end in zip(storage_offsets, storage_ends)
+            )
+        ]
+        return paddle.to_tensor(np.ascontiguousarray(chunk))
+    if len(storage_offsets) > 0:
+        # The storage_chunk_tensor and storage_local_tensor share the same memory.
+        return paddle.slice(
+            storage_local_tensor,
+            list(range(len(storage_offsets))),
+            storage_offsets,
+            storage_ends,
+        )
+    return storage_local_tensor
+
+
 def get_rank_to_files(path, state_dict, process_group, use_dist):
     accessible_files = os.listdir(path)
     metadata_files = [
@@ -455,8 +502,8 @@ def load_state_dict(
             if src_rank == paddle.distributed.get_rank():
                 if file_name not in storage_file_to_state_dict:
                     # The value in state_dict is not distributed tensor but a normal tensor.
-                    storage_file_to_state_dict[file_name] = paddle.load(
-                        os.path.join(path, file_name)
+                    storage_file_to_state_dict[file_name] = load_storage_file(
+                        os.path.join(path, file_name), use_mmap=True
                     )
                 storage_state_dict = storage_file_to_state_dict[file_name]
                 assert item.local_tensor_index.tensor_key in storage_state_dict
@@ -471,16 +518,9 @@ def load_state_dict(
                         storage_offsets, storage_lengths
                     )
                 ]
-                # The storage_chunk_tensor and storage_local_tensor share the same memory.
-                if len(storage_lengths) > 0:
-                    storage_chunk_tensor = paddle.slice(
-                        storage_local_tensor,
-                        list(range(len(storage_lengths))),
-                        storage_offsets,
-                        storage_ends,
-                    )
-                else:
-                    storage_chunk_tensor = storage_local_tensor
+                storage_chunk_tensor = slice_storage_tensor(
+                    storage_local_tensor, storage_offsets, storage_ends
+                )
             # The read item rank need to be assigned
             if item.rank == paddle.distributed.get_rank():
                 assert (
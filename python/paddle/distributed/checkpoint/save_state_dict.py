@@ -13,11 +13,19 @@
 # limitations under the License.
 
 import os
+from concurrent.futures import ThreadPoolExecutor
 from typing import List
 
+import numpy as np
+
 import paddle
+from paddle.base.data_feeder import convert_dtype
 from paddle.distributed.communication.group import is_initialized
 from paddle.distributed.fleet.utils.log_util import logger
+from paddle.framework.io_utils import (
+    _flat_tensor_entries,
+    _write_flat_tensor_file,
+)
 
 from .metadata import LocalTensorIndex, LocalTensorMetadata, Metadata
 from .utils import (
@@ -74,11 +82,58 @@ def dedup_storage_metadata(global_storage_metadata):
     return out
 
 
+def split_local_state_dict(local_state_dict, num_files):
+    """
+    Split the local state_dict into at most num_files buckets with balanced
+    byte size, greedily assign the largest tensor to the lightest bucket.
+    """
+    buckets = [[] for _ in range(num_files)]
+    bucket_nbytes = [0] * num_files
+    items = sorted(
+        local_state_dict.items(),
+        key=lambda item: -int(np.prod(item[1].shape, dtype=np.int64))
+        * item[1].element_size(),
+    )
+    for key, val in items:
+        idx = bucket_nbytes.index(min(bucket_nbytes))
+        buckets[idx].append(key)
+        bucket_nbytes[idx] += (
+            int(np.prod(val.shape, dtype=np.int64)) * val.element_size()
+        )
+    return [bucket for bucket in buckets if len(bucket) > 0]
+
+
+def write_flat_storage_file(file_path, keys, local_state_dict):
+    """
+    Stream the tensors into a flat tensor file, tensors are copied to host
+    one by one, and the file is fsynced before return.
+    """
+
+    def named_arrays():
+        for key in keys:
+            yield key, local_state_dict[key].numpy()
+
+    metas = [
+        (
+            key,
+            convert_dtype(local_state_dict[key].dtype),
+            local_state_dict[key].shape,
+        )
+        for key in keys
+    ]
+    entries = _flat_tensor_entries(metas)
+    with open(file_path, 'wb') as f:
+        _write_flat_tensor_file(f, entries, named_arrays())
+        f.flush()
+        os.fsync(f.fileno())
+
+
 def save_state_dict(
     state_dict,
     path,
     process_group=None,
     coordinator_rank=0,
+    num_io_threads=None,
 ) -> None:
     """
     Save the state_dict of model to path.
@@ -88,6 +143,7 @@ def save_state_dict(
         path(str): The directory to save state_dict.
         process_group(paddle.distributed.collective.Group): ProcessGroup to be used for cross-rank synchronization. Use the default process group which contains all cards.
         coordinator_rank(int): The rank used to save non distributed values. Rank0 is used by default.
+        num_io_threads(int, optional): If set, the local state_dict of each rank is streamed into at most num_io_threads flat tensor files (raw tensor buffers with a tensor index header) written and fsynced by a thread pool in parallel, instead of pickling the whole local state_dict into one file. None by default.
 
     Examples:
         .. code-block:: python
@@ -123,11 +179,23 @@ def save_state_dict(
             # Init the default global process group
             paddle.distributed.init_parallel_env()
 
+        if num_io_threads is not None:
+            assert (
+                isinstance(num_io_threads, int) and num_io_threads > 0
+            ), "num_io_threads should be a positive integer"
+
         unique_id = 0
         file_name = ""
         while True:
             file_name = f"{paddle.distributed.get_rank()}_{unique_id}.distcp"
-            if not os.path.exists(os.path.join(path, file_name)):
+            if not os.path.exists(
+                os.path.join(path, file_name)
+            ) and not os.path.exists(
+                os.path.join(
+                    path,
+                    f"{paddle.distributed.get_rank()}_{unique_id}_0.distcp",
+                )
+            ):
                 break
             unique_id += 1
         logger.debug(f"file_name:{file_name}")
@@ -176,6 +244,23 @@ def save_state_dict(
                 local_storage_metadata[
                     LocalTensorIndex(key, tuple(global_offset))
                 ] = file_name
+
+        # split local state_dict into several flat tensor files
+        file_keys = {}
+        if num_io_threads is not None:
+            buckets = split_local_state_dict(local_state_dict, num_io_threads)
+            key_to_file = {}
+            for i, keys in enumerate(buckets):
+                bucket_file_name = (
+                    f"{paddle.distributed.get_rank()}_{unique_id}_{i}.distcp"
+                )
+                file_keys[bucket_file_name] = keys
+                for key in keys:
+                    key_to_file[key] = bucket_file_name
+            for local_tensor_index in local_storage_metadata:
+                local_storage_metadata[local_tensor_index] = key_to_file[
+                    local_tensor_index.tensor_key
+                ]
         global_state_dict_metadata = []
         global_storage_metadata = []
         if use_dist:
@@ -197,9 +282,30 @@ def save_state_dict(
         metadata.storage_metadata = dedup_storage_metadata(
             global_storage_metadata
         )
+        logger.debug(f"local_state_dict:{local_state_dict}")
+        # TODO(pangengzheng): del the replicated tensor in local_state_dict, now different might save the replicated tensor
+        if num_io_threads is None:
+            paddle.save(local_state_dict, os.path.join(path, file_name))
+        elif len(file_keys) > 0:
+            with ThreadPoolExecutor(
+                max_workers=min(num_io_threads, len(file_keys))
+            ) as executor:
+                futures = [
+                    executor.submit(
+                        write_flat_storage_file,
+                        os.path.join(path, name),
+                        keys,
+                        local_state_dict,
+                    )
+                    for name, keys in file_keys.items()
+                ]
+                for future in futures:
+                    future.result()
+
+        # NOTE: the metadata file is written after all data files are
+        # written, as the commit marker of the checkpoint
+        if use_dist:
+            paddle.distributed.barrier(process_group)
         if coordinator_rank == paddle.distributed.get_rank():
             logger.debug(f"metadata:{metadata}")
             paddle.save(metadata, os.path.join(path, f"{unique_id}.metadata"))
-        logger.debug(f"local_state_dict:{local_state_dict}")
-        # TODO(pangengzheng): del the replicated tensor in local_state_dict, now different might save the replicated tensor
-        paddle.save(local_state_dict, os.path.join(path, file_name))
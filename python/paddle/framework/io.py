@@ -12,10 +12,13 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import atexit
 import collections
+import concurrent.futures
 import copyreg
 import os
 import pickle
+import queue
 import sys
 import threading
 import warnings
@@ -28,6 +31,7 @@ import paddle
 # deprecated module import
 from paddle import base
 from paddle.base import core
+from paddle.base.data_feeder import convert_dtype
 from paddle.base.framework import (
     EagerParamBase,
     Program,
@@ -39,27 +43,136 @@ from paddle.base.framework import (
 )
 
 from .io_utils import (
+    _flat_tensor_entries,
     _is_file_path,
+    _is_flat_tensor_file,
     _is_memory_buffer,
     _legacy_static_save,
+    _mmap_flat_tensor_file,
     _open_file_buffer,
     _pack_loaded_dict,
     _pickle_loads_mac,
+    _read_flat_tensor_file,
+    _read_flat_tensor_header,
     _unpack_saved_dict,
+    _write_flat_tensor_file,
 )
 
 __all__ = []
-async_save_queue = []
+# max number of async save tasks whose snapshot is alive, new async save
+# tasks are blocked until one of the in-flight tasks is finished
+_ASYNC_SAVE_MAX_INFLIGHT = 2
+
+
+class _AsyncSaveEngine:
+    """
+    Background engine of ``paddle.async_save``. The snapshot of the object
+    is taken in the caller by non-blocking device to pinned memory copies,
+    and a single fixed worker thread waits for the copies, writes the
+    snapshot to a temporary file and renames it to the target path. At most
+    ``max_inflight`` snapshots are alive, which bounds the pinned memory.
+    """
+
+    def __init__(self, max_inflight=_ASYNC_SAVE_MAX_INFLIGHT):
+        self._inflight = threading.BoundedSemaphore(max_inflight)
+        self._queue = queue.Queue()
+        self._futures = []
+        self._lock = threading.Lock()
+        self._thread = None
+
+    def _ensure_worker(self):
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._worker_loop)
+                self._thread.daemon = True
+                self._thread.start()
+
+    def _worker_loop(self):
+        while True:
+            snapshot, event, path, protocol, future = self._queue.get()
+            tmp_path = None
+            try:
+                if event is not None:
+                    event.synchronize()
+                if _is_file_path(path):
+                    tmp_path = f"{path}.tmp.{os.getpid()}"
+                    save(snapshot, tmp_path, protocol)
+                    fd = os.open(tmp_path, os.O_RDONLY)
+                    try:
+                        os.fsync(fd)
+                    finally:
+                        os.close(fd)
+                    os.replace(tmp_path, path)
+                else:
+                    save(snapshot, path, protocol)
+            except BaseException as e:
+                if tmp_path is not None and os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+                future.set_exception(e)
+            else:
+                future.set_result(path)
+            finally:
+                del snapshot
+                self._inflight.release()
+
+    def _snapshot(self, obj):
+        if isinstance(obj, dict):
+            return {k: self._snapshot(v) for k, v in obj.items()}
+        elif isinstance(obj, core.eager.Tensor):
+            if core.is_compiled_with_cuda():
+                return obj.pin_memory(blocking=False)
+            return obj.detach().clone()
+        return obj
+
+    def submit(self, obj, path, protocol):
+        self._inflight.acquire()
+        try:
+            snapshot = self._snapshot(obj)
+            event = None
+            place = _current_expected_place()
+            if core.is_compiled_with_cuda() and isinstance(
+                place, core.CUDAPlace
+            ):
+                # the snapshot copies are ordered before the following
+                # updates of the tensors on the current stream
+                event = paddle.device.Event(place)
+                event.record()
+        except BaseException:
+            self._inflight.release()
+            raise
+        future = concurrent.futures.Future()
+        with self._lock:
+            # failed futures are kept to be re-raised by wait()
+            self._futures = [
+                f
+                for f in self._futures
+                if not f.done() or f.exception() is not None
+            ]
+            self._futures.append(future)
+        self._ensure_worker()
+        self._queue.put((snapshot, event, path, protocol, future))
+        return future
+
+    def wait(self):
+        with self._lock:
+            futures, self._futures = self._futures, []
+        # wait for all tasks before raising the first error
+        concurrent.futures.wait(futures)
+        for future in futures:
+            if future.exception() is not None:
+                raise future.exception()
+
+
+_async_save_engine = _AsyncSaveEngine()
+atexit.register(_async_save_engine.wait)
 
 
 def clear_async_save_task_queue():
     '''
-    wait until all async save task to be done.
+    wait until all async save task to be done, the exception raised in any
+    async save task is re-raised here.
     '''
-    while len(async_save_queue) > 0:
-        task = async_save_queue.pop()
-        if task and task.is_alive():
-            task.join()
+    _async_save_engine.wait()
 
 
 def async_save(obj, path, protocol=4, sync_other_task=False, **configs):
@@ -69,6 +182,12 @@ def async_save(obj, path, protocol=4, sync_other_task=False, **configs):
         currently only support dygraph mode.
     Note:
         any argument passed through configs will be overrided by default setting.
+    Note:
+        the snapshot of ``obj`` is taken by asynchronous copies to pinned memory
+        when called, so ``obj`` can be updated after this call returns. At most
+        two async save tasks are in flight, and this call blocks until a previous
+        task is finished if the limit is reached. The file is written to a
+        temporary path first and renamed to ``path`` when finished.
     Args:
         obj(Object) : The object to be saved.
         path(str|BytesIO) : The path/buffer of the object to be saved.
@@ -77,6 +196,8 @@ def async_save(obj, path, protocol=4, sync_other_task=False, **configs):
                                  Default: 4
         sync_other_task(bool) : Determine whether to wait other async save task to be finished before this one be put in queue.
         **configs(dict, optional): compatible argument to paddle.save, but will be overrided by default setting.
+    Returns:
+        concurrent.futures.Future: The future of the async save task, whose result is ``path`` when finished.
     Examples:
         .. code-block:: python
             :name: code-example-1
@@ -100,29 +221,14 @@ def async_save(obj, path, protocol=4, sync_other_task=False, **configs):
         warnings.warn(
             "configs are not supported in async mode, will be overided by default settings."
         )
-
-    # TODO: make this part async
-    def move_state_dict_to_cpu(sd):
-        for k, v in sd.items():
-            if isinstance(v, dict):
-                move_state_dict_to_cpu(v)
-            elif isinstance(v, core.eager.Tensor):
-                sd[k] = v.pin_memory() if core.is_compiled_with_cuda() else v
-
-    if isinstance(obj, dict):
-        move_state_dict_to_cpu(obj)
-    elif isinstance(obj, core.eager.Tensor):
-        obj = obj.pin_memory() if core.is_compiled_with_cuda() else obj
-    else:
+    if not isinstance(obj, (dict, core.eager.Tensor)):
         # other types are currently not supported
         raise TypeError(
             f"currently async_save does not support this type: {type(obj)}"
         )
     if sync_other_task:
         clear_async_save_task_queue()
-    t = threading.Thread(target=save, args=(obj, path, protocol))
-    t.start()
-    async_save_queue.append(t)
+    return _async_save_engine.submit(obj, path, protocol)
 
 
 def _build_saved_state_dict(state_dict):
@@ -305,6 +411,8 @@ def _parse_load_config(configs):
         'params_filename',
         'keep_name_table',
         'return_numpy',
+        'mmap',
+        'keys',
     ]
 
     # input check
@@ -325,12 +433,18 @@ def _parse_load_config(configs):
     inner_config.params_filename = configs.get('params_filename', None)
     inner_config.keep_name_table = configs.get('keep_name_table', None)
     inner_config.return_numpy = configs.get('return_numpy', False)
+    inner_config.mmap = configs.get('mmap', False)
+    inner_config.keys = configs.get('keys', None)
 
     return inner_config
 
 
 def _parse_save_config(configs):
-    supported_configs = ['use_binary_format', 'pickle_protocol']
+    supported_configs = [
+        'use_binary_format',
+        'pickle_protocol',
+        'use_flat_format',
+    ]
 
     # input check
     for key in configs:
@@ -348,10 +462,125 @@ def _parse_save_config(configs):
     inner_config = _SaveLoadConfig()
     inner_config.use_binary_format = configs.get('use_binary_format', False)
     inner_config.pickle_protocol = configs.get('pickle_protocol', None)
+    inner_config.use_flat_format = configs.get('use_flat_format', False)
 
     return inner_config
 
 
+def _flat_save(obj, path):
+    """
+    Save a (nested) dict of Tensor and numpy.ndarray into a flat tensor
+    file, the raw buffers of tensors are written one by one, and the dict
+    structure and non-tensor values are stored in the header.
+    """
+    if not isinstance(obj, dict):
+        raise TypeError(
+            f"The flat format only supports saving dict, but received {type(obj)}."
+        )
+    metas = []
+    values = []
+
+    def build_structure(obj):
+        if isinstance(obj, dict):
+            items = []
+            for key, value in obj.items():
+                if not isinstance(key, str):
+                    raise TypeError(
+                        f"The flat format only supports str key, but received {type(key)}."
+                    )
+                items.append([key, build_structure(value)])
+            return {'dict': items}
+        elif isinstance(obj, (core.eager.Tensor, np.ndarray)):
+            name = str(len(values))
+            if isinstance(obj, np.ndarray):
+                metas.append((name, obj.dtype, obj.shape))
+                node = {'ndarray': name}
+            else:
+                metas.append((name, convert_dtype(obj.dtype), obj.shape))
+                node = {'tensor': name, 'name': obj.name}
+            values.append(obj)
+            return node
+        elif obj is None or isinstance(obj, (bool, int, float, str)):
+            return {'value': obj}
+        raise TypeError(
+            f"The flat format does not support saving value of {type(obj)}."
+        )
+
+    structure = build_structure(obj)
+
+    def named_arrays():
+        for (name, _, _), value in zip(metas, values):
+            yield name, (
+                value if isinstance(value, np.ndarray) else value.numpy()
+            )
+
+    with _open_file_buffer(path, 'wb') as f:
+        _write_flat_tensor_file(
+            f,
+            _flat_tensor_entries(metas),
+            named_arrays(),
+            extra={'structure': structure},
+        )
+
+
+def _flat_load(path, config):
+    """
+    Load the object saved in a flat tensor file. If config.keys is set, only
+    the values of these top-level keys are read. If config.mmap is set, the
+    file is memory-mapped and only the pages of loaded tensors are read.
+    """
+    if config.mmap:
+        if not _is_file_path(path):
+            raise ValueError("`mmap` is only supported when loading from file.")
+        arrays, extra = _mmap_flat_tensor_file(path)
+        items = extra['structure']['dict']
+    else:
+        with _open_file_buffer(path, 'rb') as f:
+            start = f.tell()
+            _, _, extra = _read_flat_tensor_header(f)
+            f.seek(start)
+        items = extra['structure']['dict']
+
+    if config.keys is not None:
+        keys = set(config.keys)
+        missing_keys = keys - {key for key, _ in items}
+        if len(missing_keys) > 0:
+            raise ValueError(
+                f"Keys {sorted(missing_keys)} are not found in the file: {path}."
+            )
+        items = [[key, node] for key, node in items if key in keys]
+
+    def tensor_names(node):
+        if 'dict' in node:
+            for _, child in node['dict']:
+                yield from tensor_names(child)
+        elif 'tensor' in node:
+            yield node['tensor']
+        elif 'ndarray' in node:
+            yield node['ndarray']
+
+    if not config.mmap:
+        arrays, _ = _read_flat_tensor_file(
+            path, keys=list(tensor_names({'dict': items}))
+        )
+
+    def restore(node):
+        if 'dict' in node:
+            return {key: restore(child) for key, child in node['dict']}
+        elif 'ndarray' in node:
+            return arrays[node['ndarray']]
+        elif 'tensor' in node:
+            tensor = _ndarray_to_tensor(
+                arrays[node['tensor']], config.return_numpy
+            )
+            if not config.return_numpy and node['name']:
+                tensor.name = node['name']
+            return tensor
+        return node['value']
+
+    return restore({'dict': items})
+
+
 def _pickle_save(obj, f, protocol):
     # TODO(weixin):add support for BytesIO.
     if not isinstance(protocol, int):
@@ -744,6 +973,9 @@ def save(obj, path, protocol=4, **configs):
           use_binary_format(bool): When the saved object is static graph variable, you can specify ``use_binary_for_var``.
           If True, save the file in the c++ binary format when saving a single static graph variable; otherwise, save it in pickle format.
           Default: False
+          use_flat_format(bool): When the saved object is a (nested) dict of Tensor, you can specify ``use_flat_format``.
+          If True, save the file in flat format, a header of names, dtypes, shapes and offsets followed by aligned raw
+          tensor buffers, instead of pickle format, which supports loading with ``mmap`` and ``keys``. Default: False
 
     Returns:
         None
@@ -876,8 +1108,16 @@ def save(obj, path, protocol=4, **configs):
                 type(config.use_binary_format)
             )
         )
+    if not isinstance(config.use_flat_format, bool):
+        raise TypeError(
+            "Type of `use_flat_format` should be bool, but received {}.".format(
+                type(config.use_flat_format)
+            )
+        )
 
-    if config.use_binary_format:
+    if config.use_flat_format:
+        _flat_save(obj, path)
+    elif config.use_binary_format:
         _save_binary_var(obj, path)
     else:
         # `protocol` need to be used, `pickle_protocol` is a deprecated arg.
@@ -1002,6 +1242,11 @@ def load(path, **configs):
             by default.
             (3) return_numpy(bool): If specified as True, return tensor as numpy.ndarray, otherwise return tensor as paddle.Tensor.
             Default False.
+            (4) mmap(bool): Only for file saved with ``use_flat_format=True``. If True, memory-map the file and
+            only read the loaded tensors, when ``return_numpy`` is True, the returned numpy.ndarray are read-only
+            views of the mapped file. Default False.
+            (5) keys(list[str]): Only for file saved with ``use_flat_format=True``. The top-level keys of the saved
+            dict to load, all keys are loaded if None. Default None.
 
     Returns:
         Object(Object): a target object can be used in paddle
@@ -1124,6 +1369,12 @@ def load(path, **configs):
 
     if _is_memory_buffer(path) or os.path.isfile(path):
         config = _parse_load_config(configs)
+        if _is_flat_tensor_file(path):
+            return _flat_load(path, config)
+        if config.mmap or config.keys is not None:
+            raise ValueError(
+                "`mmap` and `keys` are only supported when loading file saved with `use_flat_format=True`."
+            )
         exception_type = pickle.UnpicklingError
         try:
             with _open_file_buffer(path, 'rb') as f:
@@ -12,10 +12,12 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import json
 import logging
 import math
 import os
 import pickle
+import struct
 import sys
 from io import BytesIO
 
@@ -271,3 +273,151 @@ def _unpack_saved_dict(saved_obj, protocol):
                     saved_obj[part] = temp_saved_obj[part]
         saved_obj['UnpackBigParamInfor@@'] = unpack_infor
     return saved_obj
+
+
+# NOTE: [ flat tensor format ] A flat tensor file consists of a magic
+# number, the byte size of a json header, the json header which records
+# the dtype, shape, offset and byte size of each tensor, and the raw
+# buffers of tensors aligned to _FLAT_ALIGNMENT. Tensors can be streamed
+# into the file one by one, and each tensor can be read (or memory-mapped)
+# individually by its offset without unpickling the whole file.
+_FLAT_MAGIC = b'PDFLAT01'
+_FLAT_ALIGNMENT = 64
+
+
+def _flat_align(nbytes):
+    return (nbytes + _FLAT_ALIGNMENT - 1) // _FLAT_ALIGNMENT * _FLAT_ALIGNMENT
+
+
+def _flat_tensor_entries(metas):
+    """
+    Compute the entries of the flat tensor header from a list of
+    (name, dtype, shape), offsets are relative to the data start.
+    """
+    entries = {}
+    offset = 0
+    for name, dtype, shape in metas:
+        dtype = np.dtype(dtype)
+        nbytes = int(np.prod(shape, dtype=np.int64)) * dtype.itemsize
+        entries[name] = {
+            'dtype': dtype.str,
+            'shape': [int(d) for d in shape],
+            'offset': offset,
+            'nbytes': nbytes,
+        }
+        offset += _flat_align(nbytes)
+    return entries
+
+
+def _write_flat_tensor_file(f, entries, named_arrays, extra=None):
+    """
+    Write a flat tensor file, :attr:`named_arrays` is an iterable of
+    (name, numpy.ndarray) in the same order as :attr:`entries`, so that
+    arrays can be generated and written one by one.
+    """
+    header = json.dumps({'tensors': entries, 'extra': extra}).encode('utf-8')
+    f.write(_FLAT_MAGIC)
+    f.write(struct.pack('<Q', len(header)))
+    f.write(header)
+    written = len(_FLAT_MAGIC) + 8 + len(header)
+    data_start = _flat_align(written)
+    f.write(b'\0' * (data_start - written))
+
+    offset = 0
+    for name, array in named_arrays:
+        entry = entries[name]
+        assert (
+            entry['offset'] == offset
+        ), f"tensor {name} is not written in the order of header entries"
+        array = np.ascontiguousarray(array)
+        assert array.nbytes == entry['nbytes'], (
+            f"byte size of tensor {name} is {array.nbytes}, "
+            f"but {entry['nbytes']} in header"
+        )
+        f.write(array.reshape(-1).view(np.uint8).data)
+        padded = _flat_align(array.nbytes)
+        f.write(b'\0' * (padded - array.nbytes))
+        offset += padded
+
+
+def _is_flat_tensor_file(path_or_buffer):
+    if _is_file_path(path_or_buffer):
+        if not os.path.isfile(path_or_buffer):
+            return False
+        with open(path_or_buffer, 'rb') as f:
+            return f.read(len(_FLAT_MAGIC)) == _FLAT_MAGIC
+    pos = path_or_buffer.tell()
+    magic = path_or_buffer.read(len(_FLAT_MAGIC))
+    path_or_buffer.seek(pos)
+    return magic == _FLAT_MAGIC
+
+
+def _read_flat_tensor_header(f):
+    """
+    Read the header of a flat tensor file, return the entries, the data
+    start position relative to the beginning of file and the extra info.
+    """
+    start = f.tell()
+    magic = f.read(len(_FLAT_MAGIC))
+    if magic != _FLAT_MAGIC:
+        raise ValueError("The file is not a flat tensor file.")
+    (header_size,) = struct.unpack('<Q', f.read(8))
+    header = json.loads(f.read(header_size).decode('utf-8'))
+    data_start = _flat_align(len(_FLAT_MAGIC) + 8 + header_size)
+    f.seek(start + data_start)
+    return header['tensors'], data_start, header.get('extra', None)
+
+
+def _read_flat_tensor_file(path_or_buffer, keys=None):
+    """
+    Read tensors of :attr:`keys` (all tensors if None) in a flat tensor
+    file or buffer as numpy arrays, return a dict of name to numpy.ndarray
+    and the extra info.
+    """
+    with _open_file_buffer(path_or_buffer, 'rb') as f:
+        start = f.tell()
+        entries, data_start, extra = _read_flat_tensor_header(f)
+        if keys is None:
+            keys = list(entries.keys())
+        arrays = {}
+        for name in sorted(keys, key=lambda k: entries[k]['offset']):
+            entry = entries[name]
+            dtype = np.dtype(entry['dtype'])
+            f.seek(start + data_start + entry['offset'])
+            if _is_file_path(path_or_buffer):
+                array = np.fromfile(
+                    f, dtype=dtype, count=entry['nbytes'] // dtype.itemsize
+                )
+            else:
+                array = np.frombuffer(
+                    bytearray(f.read(entry['nbytes'])), dtype=dtype
+                )
+            arrays[name] = array.reshape(entry['shape'])
+        # move to the end of data, so that objects saved one after another
+        # in the same buffer can be read in order
+        data_size = max(
+            [e['offset'] + _flat_align(e['nbytes']) for e in entries.values()],
+            default=0,
+        )
+        f.seek(start + data_start + data_size)
+    return arrays, extra
+
+
+def _mmap_flat_tensor_file(path):
+    """
+    Memory-map a flat tensor file read-only, return a dict of name to
+    numpy.ndarray views on the mapped file and the extra info. Only the
+    pages of the accessed slices are read from disk.
+    """
+    with open(path, 'rb') as f:
+        entries, data_start, extra = _read_flat_tensor_header(f)
+    buffer = np.memmap(path, dtype=np.uint8, mode='r')
+    arrays = {}
+    for name, entry in entries.items():
+        start = data_start + entry['offset']
+        arrays[name] = (
+            buffer[start : start + entry['nbytes']]
+            .view(np.dtype(entry['dtype']))
+            .reshape(entry['shape'])
+        )
+    return arrays, extra
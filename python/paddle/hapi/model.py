@@ -291,6 +291,62 @@ def _update_input_info(inputs):
     return shapes, dtypes
 
 
+class _NpyStreamWriter:
+    """
+    Write arrays of the same dtype and trailing shape to a ``.npy`` file one
+    after another along the first axis, without holding them in memory. The
+    header is padded to a fixed length, so that it can be rewritten with the
+    final shape when the writer is closed.
+    """
+
+    _HEADER_LEN = 256
+
+    def __init__(self, path):
+        self.path = path
+        self._file = open(path, 'wb')
+        self._dtype = None
+        self._shape = None
+
+    def _write_header(self):
+        header = (
+            "{{'descr': {!r}, 'fortran_order': False, 'shape': {!r}, }}".format(
+                np.lib.format.dtype_to_descr(self._dtype), tuple(self._shape)
+            )
+        )
+        # magic string, version and header length take 10 bytes
+        header_len = self._HEADER_LEN - 10
+        assert len(header) < header_len, f"too long npy header: {header}"
+        self._file.write(b'\x93NUMPY\x01\x00')
+        self._file.write(header_len.to_bytes(2, 'little'))
+        self._file.write(header.ljust(header_len - 1).encode('latin1') + b'\n')
+
+    def write(self, array):
+        array = np.ascontiguousarray(array)
+        if array.ndim == 0:
+            array = array.reshape([1])
+        if self._dtype is None:
+            self._dtype = array.dtype
+            self._shape = [0] + list(array.shape[1:])
+            self._write_header()
+        elif array.dtype != self._dtype or list(array.shape[1:]) != list(
+            self._shape[1:]
+        ):
+            raise ValueError(
+                f"All outputs written to {self.path} should have the same "
+                f"dtype and trailing shape, expected {self._dtype} "
+                f"{self._shape[1:]}, but got {array.dtype} "
+                f"{list(array.shape[1:])}."
+            )
+        self._file.write(array.data)
+        self._shape[0] += array.shape[0]
+
+    def close(self):
+        if self._dtype is not None:
+            self._file.seek(0)
+            self._write_header()
+        self._file.close()
+
+
 class StaticGraphAdapter:
     """
 
@@ -862,14 +918,28 @@ class DynamicGraphAdapter:
         metrics = []
         for metric in self.model._metrics:
             metric_outs = metric.compute(*(to_list(outputs) + labels))
-            m = metric.update(*[to_numpy(m) for m in to_list(metric_outs)])
+            m = self._update_metric(metric, metric_outs)
             metrics.append(m)
 
-        return (
-            ([to_numpy(l) for l in losses], metrics)
-            if len(metrics) > 0
-            else [to_numpy(l) for l in losses]
-        )
+        losses = self._fetch_losses(losses)
+        return (losses, metrics) if len(metrics) > 0 else losses
+
+    def _sync_free(self):
+        return self.model._sync_free_log_freq is not None
+
+    def _update_metric(self, metric, metric_outs):
+        # metrics accumulated on device are updated by tensors directly in
+        # sync free mode, to avoid fetching the outputs every step
+        if self._sync_free() and getattr(
+            metric, '_accumulate_on_device', False
+        ):
+            return metric.update(*to_list(metric_outs))
+        return metric.update(*[to_numpy(m) for m in to_list(metric_outs)])
+
+    def _fetch_losses(self, losses):
+        if self._sync_free():
+            return [l.detach() for l in losses]
+        return [to_numpy(l) for l in losses]
 
     def eval_batch(self, inputs, labels=None):
         self.model.network.eval()
@@ -923,17 +993,22 @@ class DynamicGraphAdapter:
         for metric in self.model._metrics:
             # cut off padding value.
             metric_outs = metric.compute(*(to_list(outputs) + labels))
-            m = metric.update(*[to_numpy(m) for m in to_list(metric_outs)])
+            m = self._update_metric(metric, metric_outs)
             metrics.append(m)
 
         if self.model._loss and len(metrics):
-            return [to_numpy(l) for l in losses], metrics
+            return self._fetch_losses(losses), metrics
         elif self.model._loss:
-            return [to_numpy(l) for l in losses]
+            return self._fetch_losses(losses)
         else:
             return metrics
 
     def predict_batch(self, inputs):
+        return [to_numpy(o) for o in self._predict_outputs(inputs)]
+
+    def _predict_outputs(self, inputs):
+        """Run the network on a batch, return the output tensors without
+        fetching them to host."""
         self.model.network.eval()
         self.mode = 'test'
         inputs = [to_variable(x) for x in to_list(inputs)]
@@ -942,7 +1017,7 @@ class DynamicGraphAdapter:
         if self._nranks > 1 and isinstance(self.model._place, base.CUDAPlace):
             outputs = [_all_gather(o) for o in to_list(outputs)]
 
-        return [to_numpy(o) for o in to_list(outputs)]
+        return to_list(outputs)
 
     def parameters(self, *args, **kwargs):
         return self.model.network.parameters(*args, **kwargs)
@@ -1175,6 +1250,8 @@ class Model:
         self._is_shape_inferred = False
         self._test_dataloader = None
         self.stop_training = False
+        # log_freq of fit in sync free mode, None if not in sync free mode
+        self._sync_free_log_freq = None
 
         if not in_dynamic_mode():
             if not isinstance(inputs, (list, tuple, dict, Input)):
@@ -1770,6 +1847,7 @@ class Model:
         callbacks=None,
         accumulate_grad_batches=1,
         num_iters=None,
+        sync_free=False,
     ):
         """
 
@@ -1818,6 +1896,13 @@ class Model:
             num_iters (int|None, optional): The number of iterations to evaluate the model.
                 If None, evaluate on whole input dataset, otherwise, evaluate `num_iters` times.
                 Default: None.
+            sync_free (bool, optional): Whether to avoid synchronizing device and host
+                on every step. If True, in dynamic graph mode the losses, and the
+                metrics created with `accumulate_on_device=True`, are kept as device
+                tensors, and the losses and metrics in logs are only computed every
+                `log_freq` steps and at the end of each epoch and evaluation. Between
+                these steps callbacks see the values of the last computed step.
+                Default: False.
 
         Returns:
             None
@@ -1980,27 +2065,31 @@ class Model:
         if any(isinstance(k, EarlyStopping) for k in cbks) and not do_eval:
             warnings.warn("EarlyStopping needs validation data.")
 
-        cbks.on_begin('train')
-        for epoch in range(epochs):
-            cbks.on_epoch_begin(epoch)
-            logs = self._run_one_epoch(train_loader, cbks, 'train')
-            cbks.on_epoch_end(epoch, logs)
-
-            if do_eval and epoch % eval_freq == 0:
-                eval_steps = self._len_data_loader(eval_loader)
-                cbks.on_begin(
-                    'eval',
-                    {'steps': eval_steps, 'metrics': self._metrics_name()},
-                )
+        self._sync_free_log_freq = log_freq if sync_free else None
+        try:
+            cbks.on_begin('train')
+            for epoch in range(epochs):
+                cbks.on_epoch_begin(epoch)
+                logs = self._run_one_epoch(train_loader, cbks, 'train')
+                cbks.on_epoch_end(epoch, logs)
+
+                if do_eval and epoch % eval_freq == 0:
+                    eval_steps = self._len_data_loader(eval_loader)
+                    cbks.on_begin(
+                        'eval',
+                        {'steps': eval_steps, 'metrics': self._metrics_name()},
+                    )
 
-                eval_logs = self._run_one_epoch(eval_loader, cbks, 'eval')
+                    eval_logs = self._run_one_epoch(eval_loader, cbks, 'eval')
 
-                cbks.on_end('eval', eval_logs)
-            if self.stop_training:
-                break
+                    cbks.on_end('eval', eval_logs)
+                if self.stop_training:
+                    break
 
-        cbks.on_end('train', logs)
-        self._test_dataloader = None
+            cbks.on_end('train', logs)
+        finally:
+            self._test_dataloader = None
+            self._sync_free_log_freq = None
 
     def evaluate(
         self,
@@ -2121,6 +2210,7 @@ class Model:
         stack_outputs=False,
         verbose=1,
         callbacks=None,
+        output_dir=None,
     ):
         """
         Compute the output predictions on testing data.
@@ -2143,6 +2233,12 @@ class Model:
             verbose (int, optional): The verbosity mode, should be 0, 1, or 2. 0 = silent,
                 1 = progress bar, 2 = one line per batch. Default: 1.
             callbacks(Callback, optional): A Callback instance, Default: None.
+            output_dir (str, optional): If set, the outputs of each batch are
+                written to ``output_{i}.npy`` in this directory for the i-th output
+                field as soon as they are computed, instead of being kept in memory,
+                and the outputs are returned as read-only memory-mapped arrays of
+                these files. The outputs of all batches are concatenated along
+                the first axis, and `stack_outputs` is ignored. Default: None.
 
         Returns:
             list: output of models.
@@ -2212,6 +2308,14 @@ class Model:
 
         cbks.on_begin('predict', logs)
 
+        if output_dir is not None:
+            outputs = self._predict_to_files(
+                test_loader, cbks, logs, output_dir
+            )
+            self._test_dataloader = None
+            cbks.on_end('predict', logs)
+            return outputs
+
         outputs = []
 
         logs, outputs = self._run_one_epoch(test_loader, cbks, 'predict')
@@ -2228,6 +2332,136 @@ class Model:
         cbks.on_end('predict', logs)
         return outputs
 
+    def predict_iter(
+        self,
+        test_data,
+        batch_size=1,
+        num_workers=0,
+        verbose=1,
+        callbacks=None,
+    ):
+        """
+        Compute the output predictions on testing data batch by batch, and
+        yield the outputs of each batch as soon as they are computed, so that
+        the outputs of the whole dataset are never held in memory.
+
+        Args:
+            test_data (Dataset|DataLoader): An iterable data loader is used for
+                predict. An instance of paddle.io.Dataset or paddle.io.Dataloader
+                is recomended.
+            batch_size (int, optional): The batch size of test_data. When test_data is the
+                instance of Dataloader, this argument will be ignored. Default: 1.
+            num_workers (int, optional): The number of subprocess to load data, 0 for no subprocess
+                used and loading data in main process. When test_data is the instance of Dataloader,
+                this argument will be ignored. Default: 0.
+            verbose (int, optional): The verbosity mode, should be 0, 1, or 2. 0 = silent,
+                1 = progress bar, 2 = one line per batch. Default: 1.
+            callbacks(Callback, optional): A Callback instance, Default: None.
+
+        Yields:
+            list: The outputs of the model on a batch, a list of numpy.ndarray.
+
+        Examples:
+
+            .. code-block:: python
+
+                >>> import numpy as np
+                >>> import paddle
+                >>> from paddle.static import InputSpec
+
+                >>> class MnistDataset(paddle.vision.datasets.MNIST):
+                ...     def __getitem__(self, idx):
+                ...         img = np.reshape(self.images[idx], [1, 28, 28])
+                ...         return img
+                ...
+
+                >>> test_dataset = MnistDataset(mode='test')
+                >>> input = InputSpec([-1, 1, 28, 28], 'float32', 'image')
+                >>> model = paddle.Model(paddle.vision.models.LeNet(), input)
+                >>> model.prepare()
+                >>> num_samples = 0
+                >>> for outputs in model.predict_iter(test_dataset, batch_size=64):
+                ...     num_samples += outputs[0].shape[0]
+                >>> print(num_samples)
+                10000
+        """
+        if test_data is not None and isinstance(test_data, Dataset):
+            test_sampler = DistributedBatchSampler(
+                test_data, batch_size=batch_size
+            )
+            test_loader = DataLoader(
+                test_data,
+                batch_sampler=test_sampler,
+                places=self._place,
+                num_workers=num_workers,
+                return_list=True,
+            )
+        else:
+            test_loader = test_data
+
+        self._test_dataloader = test_loader
+
+        cbks = config_callbacks(callbacks, model=self, verbose=verbose)
+
+        test_steps = self._len_data_loader(test_loader)
+        logs = {'steps': test_steps}
+
+        cbks.on_begin('predict', logs)
+        try:
+            yield from self._predict_stream(test_loader, cbks, logs)
+        finally:
+            self._test_dataloader = None
+            cbks.on_end('predict', logs)
+
+    def _predict_stream(self, data_loader, callbacks, logs):
+        for step, data in enumerate(data_loader):
+            data = paddle.utils.flatten(data)
+            batch_size = (
+                data[0].shape()[0]
+                if callable(data[0].shape)
+                else data[0].shape[0]
+            )
+            if self._inputs is not None:
+                data = data[: len(self._inputs)]
+
+            callbacks.on_batch_begin('predict', step, logs)
+            if in_dynamic_mode():
+                with no_grad():
+                    outputs = self._adapter._predict_outputs(data)
+                if self._input_info is None:
+                    self._update_inputs()
+            else:
+                outputs = self.predict_batch(data)
+
+            logs['step'] = step
+            logs['batch_size'] = (
+                batch_size * paddle.distributed.ParallelEnv().nranks
+            )
+            callbacks.on_batch_end('predict', step, logs)
+
+            if in_dynamic_mode():
+                outputs = [to_numpy(o) for o in outputs]
+            yield outputs
+
+    def _predict_to_files(self, data_loader, callbacks, logs, output_dir):
+        os.makedirs(output_dir, exist_ok=True)
+        writers = []
+        try:
+            for outputs in self._predict_stream(data_loader, callbacks, logs):
+                if not writers:
+                    writers = [
+                        _NpyStreamWriter(
+                            os.path.join(output_dir, f'output_{i}.npy')
+                        )
+                        for i in range(len(outputs))
+                    ]
+                for writer, output in zip(writers, outputs):
+                    writer.write(output)
+        finally:
+            for writer in writers:
+                writer.close()
+        return [np.load(writer.path, mmap_mode='r') for writer in writers]
+
     def _save_inference_model(self, path):
         """
         Save inference model can be used in static or dynamic mode.
@@ -2298,6 +2532,7 @@ class Model:
         logs={},
     ):
         outputs = []
+        unlogged_outs = None
         for step, data in enumerate(data_loader):
             # Data might come from different types of data_loader and have
             # different format, as following:
@@ -2332,21 +2567,16 @@ class Model:
 
                 outs = getattr(self, mode + '_batch')(*_inputs)
 
-                if self._metrics and self._loss:
-                    metrics = [[float(l) for l in outs[0]]]
-                elif self._loss:
-                    metrics = [[float(l) for l in outs]]
+                # in sync free mode, losses and metrics are only fetched
+                # when they are logged
+                if (
+                    self._sync_free_log_freq is None
+                    or (step + 1) % self._sync_free_log_freq == 0
+                ):
+                    self._update_logs(outs, logs)
+                    unlogged_outs = None
                 else:
-                    metrics = []
-
-                # metrics
-                for metric in self._metrics:
-                    res = metric.accumulate()
-                    metrics.extend(to_list(res))
-
-                assert len(self._metrics_name()) == len(metrics)
-                for k, v in zip(self._metrics_name(), metrics):
-                    logs[k] = v
+                    unlogged_outs = outs
             else:
                 if self._inputs is not None:
                     outs = self.predict_batch(data[: len(self._inputs)])
@@ -2373,12 +2603,31 @@ class Model:
                     self.stop_training = True
                     del self.num_iters
                     break
+        if unlogged_outs is not None:
+            self._update_logs(unlogged_outs, logs)
         self._reset_metrics()
 
         if mode == 'predict':
             return logs, outputs
         return logs
 
+    def _update_logs(self, outs, logs):
+        if self._metrics and self._loss:
+            metrics = [[float(l) for l in outs[0]]]
+        elif self._loss:
+            metrics = [[float(l) for l in outs]]
+        else:
+            metrics = []
+
+        # metrics
+        for metric in self._metrics:
+            res = metric.accumulate()
+            metrics.extend(to_list(res))
+
+        assert len(self._metrics_name()) == len(metrics)
+        for k, v in zip(self._metrics_name(), metrics):
+            logs[k] = v
+
     def summary(self, input_size=None, dtype=None):
         """Prints a string summary of the network.
 
@@ -16,8 +16,10 @@
 Functions for Auto SParsity (ASP) training and inference.
 """
 
+import collections
 import copy
 import os
+from concurrent.futures import ThreadPoolExecutor
 
 import numpy as np
 
@@ -299,7 +301,9 @@ def decorate(optimizer):
     return ASPHelper.decorate(optimizer)
 
 
-def prune_model(model, n=2, m=4, mask_algo='mask_1d', with_mask=True):
+def prune_model(
+    model, n=2, m=4, mask_algo='mask_1d', with_mask=True, num_workers=1
+):
     r"""
     Pruning parameters of supported layers in :attr:`model` via
     specified mask generation function given by :attr:`mask_algo`. This
@@ -319,6 +323,8 @@ def prune_model(model, n=2, m=4, mask_algo='mask_1d', with_mask=True):
         mask_algo (string, optional): The function name to generate spase mask. Default is `mask_1d`.
                                       The vaild inputs should be one of 'mask_1d', 'mask_2d_greedy' and 'mask_2d_best'.
         with_mask (bool, optional): To prune mask Variables related to parameters or not. True is purning also, False is not. Default is True.
+        num_workers (int, optional): The number of threads to generate masks of parameters concurrently. Default is 1,
+                                     which means generating masks one by one.
     Returns:
         dictionary: A dictionary with key: `parameter name` (string) and value: its corresponding mask Variable.
     Examples:
@@ -471,6 +477,7 @@ def prune_model(model, n=2, m=4, mask_algo='mask_1d', with_mask=True):
         m=m,
         mask_algo=MaskAlgo_mapping[mask_algo],
         with_mask=with_mask,
+        num_workers=num_workers,
     )
 
 
@@ -570,6 +577,7 @@ class ASPHelper:
         m=4,
         mask_algo=MaskAlgo.MASK_1D,
         with_mask=True,
+        num_workers=1,
     ):
         r"""
         This is the implementation of `asp.prune_model`, for details please see explanation in `asp.prune_model`.
@@ -579,38 +587,49 @@ class ASPHelper:
             main_program = paddle.static.default_main_program()
 
         asp_info = cls._get_program_asp_info(main_program)
-        for param in main_program.global_block().all_parameters():
-            if ASPHelper._is_supported_layer(main_program, param.name):
-                weight_tensor = global_scope().find_var(param.name).get_tensor()
-                weight_nparray = np.array(weight_tensor)
-
-                prune_func = ASPHelper._get_prune_func_by_name(param.name)
+        params = [
+            param
+            for param in main_program.global_block().all_parameters()
+            if ASPHelper._is_supported_layer(main_program, param.name)
+        ]
+        for (
+            param,
+            weight_nparray,
+            weight_pruned_nparray,
+            weight_sparse_mask,
+        ) in ASPHelper._prune_params(
+            params,
+            lambda param: np.array(
+                global_scope().find_var(param.name).get_tensor()
+            ),
+            m,
+            n,
+            mask_algo,
+            num_workers,
+        ):
+            weight_tensor = global_scope().find_var(param.name).get_tensor()
+            weight_pruned_nparray = weight_pruned_nparray.astype(
+                weight_nparray.dtype
+            )
+            weight_tensor.set(weight_pruned_nparray, place)
 
-                weight_pruned_nparray, weight_sparse_mask = prune_func(
-                    weight_nparray, m, n, mask_algo, param.name
+            if with_mask:
+                weight_mask_param = global_scope().find_var(
+                    ASPHelper._get_mask_name(param.name)
                 )
-                weight_pruned_nparray = weight_pruned_nparray.astype(
-                    weight_nparray.dtype
-                )
-                weight_tensor.set(weight_pruned_nparray, place)
-
-                if with_mask:
-                    weight_mask_param = global_scope().find_var(
+                assert weight_mask_param is not None, (
+                    'Cannot find {} variable, please call optimizer.minimize ('
+                    'paddle.incubate.asp.decorate(optimizer).minimize(loss)'
+                    ' and initialization (exe.run(startup_program)) first!'.format(
                         ASPHelper._get_mask_name(param.name)
                     )
-                    assert weight_mask_param is not None, (
-                        'Cannot find {} variable, please call optimizer.minimize ('
-                        'paddle.incubate.asp.decorate(optimizer).minimize(loss)'
-                        ' and initialization (exe.run(startup_program)) first!'.format(
-                            ASPHelper._get_mask_name(param.name)
-                        )
-                    )
-                    weight_mask_tensor = weight_mask_param.get_tensor()
-                    weight_sparse_mask = weight_sparse_mask.astype(
-                        np.array(weight_mask_tensor).dtype
-                    )
-                    weight_mask_tensor.set(weight_sparse_mask, place)
-                asp_info.update_masks(param.name, weight_sparse_mask)
+                )
+                weight_mask_tensor = weight_mask_param.get_tensor()
+                weight_sparse_mask = weight_sparse_mask.astype(
+                    np.array(weight_mask_tensor).dtype
+                )
+                weight_mask_tensor.set(weight_sparse_mask, place)
+            asp_info.update_masks(param.name, weight_sparse_mask)
         return asp_info.masks.copy()
 
     @classmethod
@@ -622,6 +641,7 @@ class ASPHelper:
         m=4,
         mask_algo=MaskAlgo.MASK_1D,
         with_mask=True,
+        num_workers=1,
     ):
         r"""
         This is the implementation of `asp.prune_model`, for details please see explanation in `asp.prune_model`.
@@ -630,34 +650,40 @@ class ASPHelper:
             main_program = paddle.static.default_main_program()
             asp_info = cls._get_program_asp_info(main_program)
 
-            for param in layer.parameters():
-                if ASPHelper._is_supported_layer(main_program, param.name):
-                    weight_nparray = param.numpy()
-
-                    prune_func = ASPHelper._get_prune_func_by_name(param.name)
-
-                    weight_pruned_nparray, weight_sparse_mask = prune_func(
-                        weight_nparray, m, n, mask_algo, param.name
-                    )
-
-                    weight_pruned_nparray = weight_pruned_nparray.astype(
-                        weight_nparray.dtype
-                    )
-                    param.set_value(weight_pruned_nparray)
+            params = [
+                param
+                for param in layer.parameters()
+                if ASPHelper._is_supported_layer(main_program, param.name)
+            ]
+            for (
+                param,
+                weight_nparray,
+                weight_pruned_nparray,
+                weight_sparse_mask,
+            ) in ASPHelper._prune_params(
+                params,
+                lambda param: param.numpy(),
+                m,
+                n,
+                mask_algo,
+                num_workers,
+            ):
+                weight_pruned_nparray = weight_pruned_nparray.astype(
+                    weight_nparray.dtype
+                )
+                param.set_value(weight_pruned_nparray)
 
-                    if with_mask:
-                        weight_mask_param = asp_info.mask_vars.get(
-                            param.name, None
-                        )
-                        assert weight_mask_param is not None, (
-                            'Cannot find {} variable, please call asp.decorate() to'
-                            ' decorate your optimizer first!'.format(
-                                ASPHelper._get_mask_name(param.name)
-                            )
+                if with_mask:
+                    weight_mask_param = asp_info.mask_vars.get(param.name, None)
+                    assert weight_mask_param is not None, (
+                        'Cannot find {} variable, please call asp.decorate() to'
+                        ' decorate your optimizer first!'.format(
+                            ASPHelper._get_mask_name(param.name)
                         )
-                        weight_mask_param.set_value(weight_sparse_mask)
+                    )
+                    weight_mask_param.set_value(weight_sparse_mask)
 
-                    asp_info.update_masks(param.name, weight_sparse_mask)
+                asp_info.update_masks(param.name, weight_sparse_mask)
 
             return asp_info.masks.copy()
         else:
@@ -676,8 +702,55 @@ class ASPHelper:
                 m=m,
                 mask_algo=mask_algo,
                 with_mask=with_mask,
+                num_workers=num_workers,
             )
 
+    @staticmethod
+    def _prune_params(params, get_weight, m, n, mask_algo, num_workers):
+        r"""
+        Generate the pruned weights and sparse masks of :attr:`params` by their pruning functions.
+        If :attr:`num_workers` is greater than 1, the masks are generated concurrently in a thread
+        pool, and at most 2 * :attr:`num_workers` weights are pending to bound the memory usage.
+
+        Args:
+            params (list): The parameters to be pruned.
+            get_weight (function): A function which receives a parameter and returns its weight nparray.
+            m (int): m of `n:m` sparse pattern.
+            n (int): n of `n:m` sparse pattern.
+            mask_algo (MaskAlgo): The algorithm of mask generating.
+            num_workers (int): The number of threads to generate masks.
+        Returns:
+            generator: Yields (parameter, weight nparray, pruned weight nparray, sparse mask) in the order of :attr:`params`.
+        """
+
+        def prune(param, weight_nparray):
+            prune_func = ASPHelper._get_prune_func_by_name(param.name)
+            return prune_func(weight_nparray, m, n, mask_algo, param.name)
+
+        if num_workers is None or num_workers <= 1:
+            for param in params:
+                weight_nparray = get_weight(param)
+                yield (param, weight_nparray, *prune(param, weight_nparray))
+            return
+
+        pending = collections.deque()
+        with ThreadPoolExecutor(max_workers=num_workers) as executor:
+            for param in params:
+                weight_nparray = get_weight(param)
+                pending.append(
+                    (
+                        param,
+                        weight_nparray,
+                        executor.submit(prune, param, weight_nparray),
+                    )
+                )
+                if len(pending) >= 2 * num_workers:
+                    param, weight_nparray, future = pending.popleft()
+                    yield (param, weight_nparray, *future.result())
+            while pending:
+                param, weight_nparray, future = pending.popleft()
+                yield (param, weight_nparray, *future.result())
+
     @staticmethod
     def _get_mask_name(param_name):
         r"""
@@ -16,7 +16,6 @@
 Utilities of Auto SParsity (ASP).
 """
 
-import collections
 import sys
 import threading
 from enum import Enum
@@ -175,10 +174,7 @@ def check_mask_1d(mat, n, m):
     else:
         mat_flattern, shape = _reshape_1d(mat, m)
 
-    for sub_mat in mat_flattern:
-        if np.nonzero(sub_mat)[0].size > (m - n):
-            return False
-    return True
+    return not np.any(np.count_nonzero(mat_flattern, axis=1) > (m - n))
 
 
 def get_mask_1d(mat, n, m):
@@ -214,10 +210,8 @@ def get_mask_1d(mat, n, m):
 
     mask_flattern = np.ones_like(mat_flattern)
     mask = np.ones_like(mat)
-    for i in range(mat_flattern.shape[0]):
-        sub_mat = mat_flattern[i]
-        min_order_indices = np.argsort(np.absolute(sub_mat))
-        mask_flattern[i, min_order_indices[:n].tolist()] = 0
+    min_order_indices = np.argsort(np.absolute(mat_flattern), axis=1)
+    np.put_along_axis(mask_flattern, min_order_indices[:, :n], 0, axis=1)
     mask_flattern = mask_flattern.reshape(shape)
     mask[:, :] = mask_flattern[:, : mat.shape[1]]
     return mask
@@ -252,20 +246,35 @@ def _reshape_2d(mat, m):
     mat_padded = np.zeros(new_shape)
     mat_padded[: mat.shape[0], : mat.shape[1]] = mat
 
-    mat_flattern = np.empty(new_shape).reshape(-1, m * m)
-    curr_idx = 0
-    for row_start in range(0, mat_padded.shape[0], m):
-        row_end = row_start + m
-        for col_start in range(0, mat_padded.shape[1], m):
-            col_end = col_start + m
-            sub_mat = np.squeeze(
-                mat_padded[row_start:row_end, col_start:col_end].reshape(-1)
-            )
-            mat_flattern[curr_idx] = sub_mat
-            curr_idx += 1
+    # Split the padded matrix into m x m blocks in row-major order, and
+    # flatten each block in row-major order.
+    mat_flattern = (
+        mat_padded.reshape(new_shape[0] // m, m, new_shape[1] // m, m)
+        .transpose(0, 2, 1, 3)
+        .reshape(-1, m * m)
+    )
     return mat_flattern, mat_padded.shape
 
 
+def _unreshape_2d(mat_flattern, shape, m):
+    r"""
+    The inverse of `_reshape_2d`, scatter the flattened :math:`m \times m` blocks
+    back to a 2D matrix with the padded shape.
+
+    Args:
+        mat_flattern (nparray): The flattened blocks with shape (-1, :math:`m \times m`) or (-1, m, m).
+        shape (tuple): The shape of padded matrix.
+        m (int): The square root of second dimension of flattened blocks.
+    Returns:
+        nparray: The 2D matrix with shape :attr:`shape`.
+    """
+    return (
+        mat_flattern.reshape(shape[0] // m, shape[1] // m, m, m)
+        .transpose(0, 2, 1, 3)
+        .reshape(shape)
+    )
+
+
 def check_mask_2d(mat, n, m):
     r"""
     Check if every :math:`m \times m` block of the input matrix :attr:`mat` is in 2D `n:m` sparse pattern.
@@ -314,13 +323,10 @@ def check_mask_2d(mat, n, m):
           True
     """
     mat_padded, shape = _reshape_2d(mat, m)
-    for sub_mat in mat_padded:
-        sub_mask = np.absolute(np.squeeze(sub_mat.reshape(m, m))) > 0
-        if (np.sum(np.sum(sub_mask, axis=1) > (m - n)) != 0) and (
-            np.sum(np.sum(sub_mask, axis=0) > (m - n)) != 0
-        ):
-            return False
-    return True
+    sub_masks = np.absolute(mat_padded.reshape(-1, m, m)) > 0
+    row_invalid = np.any(np.sum(sub_masks, axis=2) > (m - n), axis=1)
+    col_invalid = np.any(np.sum(sub_masks, axis=1) > (m - n), axis=1)
+    return not np.any(row_invalid & col_invalid)
 
 
 def get_mask_2d_greedy(mat, n, m):
@@ -359,38 +365,26 @@ def get_mask_2d_greedy(mat, n, m):
           True
     """
     mat_padded, shape = _reshape_2d(mat, m)
-    mask_padded = np.zeros_like(mat_padded).reshape(-1, m, m)
-
-    for idx in range(len(mat_padded)):
-        sub_mat = np.absolute(np.squeeze(mat_padded[idx]))
-        sub_mask = np.squeeze(mask_padded[idx])
-
-        min_order_1d_indices = np.argsort(sub_mat)
-        min_order_2d_indices = [
-            (int(x / m), x % m) for x in min_order_1d_indices
-        ]
-        row_counter = collections.Counter()
-        col_counter = collections.Counter()
-
-        for i in range(len(min_order_1d_indices) - 1, -1, -1):
-            matrix_entry = min_order_2d_indices[i]
-            if (row_counter[matrix_entry[0]] == n) or (
-                col_counter[matrix_entry[1]] == n
-            ):
-                continue
-
-            sub_mask[matrix_entry[0], matrix_entry[1]] = 1.0
-            row_counter[matrix_entry[0]] += 1
-            col_counter[matrix_entry[1]] += 1
-
-    mask = np.empty(shape)
-    curr_idx = 0
-    for row_start in range(0, shape[0], m):
-        row_end = row_start + m
-        for col_start in range(0, shape[1], m):
-            col_end = col_start + m
-            mask[row_start:row_end, col_start:col_end] = mask_padded[curr_idx]
-            curr_idx += 1
+    mask_padded = np.zeros_like(mat_padded)
+
+    # Visit the entries of all blocks in descent order simultaneously, an
+    # entry is kept if neither its row nor its column has n entries kept.
+    min_order_indices = np.argsort(np.absolute(mat_padded), axis=1)
+    block_indices = np.arange(len(mat_padded))
+    row_counter = np.zeros((len(mat_padded), m), dtype=np.int64)
+    col_counter = np.zeros((len(mat_padded), m), dtype=np.int64)
+    for i in range(m * m - 1, -1, -1):
+        entries = min_order_indices[:, i]
+        rows = entries // m
+        cols = entries % m
+        keep = (row_counter[block_indices, rows] < n) & (
+            col_counter[block_indices, cols] < n
+        )
+        mask_padded[block_indices, entries] = keep
+        row_counter[block_indices, rows] += keep
+        col_counter[block_indices, cols] += keep
+
+    mask = _unreshape_2d(mask_padded, shape, m)
     return mask[: mat.shape[0], : mat.shape[1]]
 
 
@@ -417,7 +411,12 @@ def _compute_valid_2d_patterns(n, m):
     valid_key = f'{m}_{n}'
     if valid_key in _valid_2d_patterns:
         return _valid_2d_patterns[valid_key]
-    else:
+    # Hold the lock while computing, so that the patterns are computed only
+    # once when masks are generated in multiple threads.
+    with _valid_2d_patterns_lock:
+        if valid_key in _valid_2d_patterns:
+            return _valid_2d_patterns[valid_key]
+
         patterns = np.zeros(m)
         patterns[:n] = 1
         patterns = list(set(permutations(patterns.tolist())))
@@ -432,10 +431,7 @@ def _compute_valid_2d_patterns(n, m):
         valid_patterns = np.empty((valid.shape[0], m, m))
         valid_patterns[:] = patterns[valid[:]]
 
-        _valid_2d_patterns_lock.acquire()
         _valid_2d_patterns[valid_key] = valid_patterns
-        _valid_2d_patterns_lock.release()
-
         return valid_patterns
 
 
@@ -476,22 +472,12 @@ def get_mask_2d_best(mat, n, m):
     patterns = _compute_valid_2d_patterns(n, m)
 
     mat_flattern, shape = _reshape_2d(mat, m)
-    mask_flattern = np.ones_like(mat_flattern).reshape(-1, m, m)
     pmax = np.argmax(
         np.matmul(mat_flattern, patterns.reshape(patterns.shape[0], m * m).T),
         axis=1,
     )
 
-    mask_flattern[:] = patterns[pmax[:]]
-    mask = np.empty(shape)
-
-    curr_idx = 0
-    for row_start in range(0, shape[0], m):
-        row_end = row_start + m
-        for col_start in range(0, shape[1], m):
-            col_end = col_start + m
-            mask[row_start:row_end, col_start:col_end] = mask_flattern[curr_idx]
-            curr_idx += 1
+    mask = _unreshape_2d(patterns[pmax], shape, m)
     return mask[: mat.shape[0], : mat.shape[1]]
 
 
@@ -12,6 +12,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import collections
+import itertools
 import math
 
 import numpy as np
@@ -136,15 +138,34 @@ class BatchSampler(Sampler):
             drop_last, bool
         ), f"drop_last should be a boolean value, but got {type(drop_last)}"
         self.drop_last = drop_last
+        # batch number generated in current epoch, and batch number to
+        # skip in the next epoch when resuming from a state
+        self._num_batches = 0
+        self._resume_num_batches = 0
 
     def __iter__(self):
+        self._num_batches = getattr(self, '_resume_num_batches', 0)
+        self._resume_num_batches = 0
+        sampler_iter = iter(self.sampler)
+        if self._num_batches > 0:
+            # only skip sample indices, samples of the skipped batches
+            # are not loaded
+            collections.deque(
+                itertools.islice(
+                    sampler_iter, self._num_batches * self.batch_size
+                ),
+                maxlen=0,
+            )
+
         batch_indices = []
-        for idx in self.sampler:
+        for idx in sampler_iter:
             batch_indices.append(idx)
             if len(batch_indices) == self.batch_size:
+                self._num_batches += 1
                 yield batch_indices
                 batch_indices = []
         if not self.drop_last and len(batch_indices) > 0:
+            self._num_batches += 1
             yield batch_indices
 
     def __len__(self):
@@ -152,6 +173,36 @@ class BatchSampler(Sampler):
         num_samples += int(not self.drop_last) * (self.batch_size - 1)
         return num_samples // self.batch_size
 
+    def state_dict(self):
+        """
+        Get the iteration state of the current epoch, which contains the
+        state of :attr:`sampler` and the batch number generated in this
+        epoch.
+
+        Returns:
+            dict: the iteration state of the batch sampler.
+        """
+        state = {'num_batches': getattr(self, '_num_batches', 0)}
+        if isinstance(getattr(self, 'sampler', None), Sampler):
+            state['sampler'] = self.sampler.state_dict()
+        return state
+
+    def load_state_dict(self, state_dict):
+        """
+        Load the iteration state got from :code:`state_dict`, the next epoch
+        will generate indices in the same order as the epoch when the state
+        is got, and start from the batch after the first
+        :code:`state_dict['num_batches']` batches.
+
+        Args:
+            state_dict(dict): the iteration state of the batch sampler.
+        """
+        self._resume_num_batches = state_dict.get('num_batches', 0)
+        if 'sampler' in state_dict and isinstance(
+            getattr(self, 'sampler', None), Sampler
+        ):
+            self.sampler.load_state_dict(state_dict['sampler'])
+
 
 class _InfiniteIterableSampler:
     def __init__(self, dataset, batch_size=1):
@@ -267,8 +318,17 @@ class DistributedBatchSampler(BatchSampler):
         self.epoch = 0
         self.num_samples = int(math.ceil(len(self.dataset) * 1.0 / self.nranks))
         self.total_size = self.num_samples * self.nranks
+        # epoch used to shuffle indices in current iteration, batch number
+        # generated in current epoch, and batch number to skip in the next
+        # epoch when resuming from a state
+        self._iter_epoch = 0
+        self._num_batches = 0
+        self._resume_num_batches = 0
 
     def __iter__(self):
+        self._iter_epoch = self.epoch
+        self._num_batches = self._resume_num_batches
+        self._resume_num_batches = 0
         num_samples = len(self.dataset)
         indices = np.arange(num_samples).tolist()
         # add extra samples to make it evenly divisible
@@ -313,15 +373,18 @@ class DistributedBatchSampler(BatchSampler):
             indices = _get_indices_by_batch_size(indices)
 
         assert len(indices) == self.num_samples
-        _sample_iter = iter(indices)
+        # skip indices of batches consumed before resuming
+        _sample_iter = iter(indices[self._num_batches * self.batch_size :])
 
         batch_indices = []
         for idx in _sample_iter:
             batch_indices.append(idx)
             if len(batch_indices) == self.batch_size:
+                self._num_batches += 1
                 yield batch_indices
                 batch_indices = []
         if not self.drop_last and len(batch_indices) > 0:
+            self._num_batches += 1
             yield batch_indices
 
     def __len__(self):
@@ -367,3 +430,27 @@ class DistributedBatchSampler(BatchSampler):
                 ...     sampler.set_epoch(epoch)
         """
         self.epoch = epoch
+
+    def state_dict(self):
+        """
+        Get the iteration state of the current epoch, which contains the
+        epoch number used to shuffle indices and the batch number generated
+        in this epoch.
+
+        Returns:
+            dict: the iteration state of the batch sampler.
+        """
+        return {'epoch': self._iter_epoch, 'num_batches': self._num_batches}
+
+    def load_state_dict(self, state_dict):
+        """
+        Load the iteration state got from :code:`state_dict`, the next epoch
+        will generate indices in the same order as the epoch when the state
+        is got, and start from the batch after the first
+        :code:`state_dict['num_batches']` batches.
+
+        Args:
+            state_dict(dict): the iteration state of the batch sampler.
+        """
+        self.epoch = state_dict.get('epoch', self.epoch)
+        self._resume_num_batches = state_dict.get('num_batches', 0)
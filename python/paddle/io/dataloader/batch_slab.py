@@ -0,0 +1,226 @@
+#   Copyright (c) 2024 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import ctypes
+import numbers
+import os
+from collections.abc import Mapping, Sequence
+
+import numpy as np
+
+from ...framework import core
+from .collate import default_collate_fn
+from .flat import _flatten_batch
+
+# NOTE: [ batch slab ] In batch slab mode, each worker assembles batches
+# directly in a ring of preallocated shared memory tensors (slabs) instead
+# of stacking samples with `np.stack` and copying the stacked array into
+# a new mmap LoDTensor for each batch. The slab layout is planned once
+# from the first batch and reused for all following batches, only a small
+# `_SlabBatch` descriptor is sent through the inter-process queue. The
+# main process wraps the slab memory into LoDTensors without copying, so
+# the slab is owned by the batch handed to users, and the worker reuses
+# the slab only after all these tensors are released, which is detected
+# by the reference count of the shared memory.
+
+# NOTE: RefcountedMemoryMapAllocation keeps the reference count as an int
+# in the head of the shared memory, data is placed `mmap_alignment` bytes
+# after it, see paddle/fluid/memory/allocation/mmap_allocator.h
+_MMAP_ALIGNMENT = 64
+
+
+def _use_batch_slab():
+    return os.environ.get('FLAGS_dataloader_use_batch_slab', False) in [
+        1,
+        '1',
+        True,
+        'True',
+        'true',
+    ]
+
+
+def _shared_refcount(tensor):
+    return ctypes.c_int.from_address(tensor._ptr() - _MMAP_ALIGNMENT).value
+
+
+def _sample_leaves(sample, leaves):
+    """
+    Collect the leaf fields of a sample in the same order as
+    :code:`default_collate_fn` + :code:`_flatten_batch` place them in the
+    flattened batch. Return False if the sample contains fields which
+    cannot be assembled into a slab (str, bytes, Tensor, etc).
+    """
+    if isinstance(sample, np.ndarray):
+        leaves.append(sample)
+    elif isinstance(sample, numbers.Number):
+        leaves.append(np.asarray(sample))
+    elif isinstance(sample, (str, bytes)):
+        return False
+    elif isinstance(sample, Mapping):
+        for key in sample:
+            if not _sample_leaves(sample[key], leaves):
+                return False
+    elif isinstance(sample, Sequence):
+        for field in sample:
+            if not _sample_leaves(field, leaves):
+                return False
+    else:
+        return False
+    return True
+
+
+class _SlabBatch:
+    """
+    Descriptor of a batch assembled in a worker slab, this is the only
+    object put into the inter-process queue for the batch data.
+    """
+
+    def __init__(self, worker_id, slot, batch_size, fields):
+        self.worker_id = worker_id
+        self.slot = slot
+        self.batch_size = batch_size
+        # list of (ipc_name, size, type_idx, sample_shape)
+        self.fields = fields
+
+
+class _BatchSlabWriter:
+    """
+    Assemble batches into recycled shared memory slabs in worker process.
+
+    Args:
+        worker_id(int): id of the worker process.
+        max_slabs(int): max slab number in the ring, slabs are allocated
+            lazily when all existing slabs are still held by the main
+            process.
+    """
+
+    def __init__(self, worker_id, max_slabs):
+        self._worker_id = worker_id
+        self._max_slabs = max_slabs
+        # list of slabs, each slab is a list of LoDTensor for each field
+        self._slabs = []
+        # list of (dtype, sample_shape)
+        self._fields = None
+        self._batch_size = 0
+        self._disabled = False
+        self.structure = None
+
+    def _new_slab(self):
+        slab = []
+        for dtype, shape in self._fields:
+            tensor = core.LoDTensor()
+            tensor.set(
+                np.empty((self._batch_size, *shape), dtype=dtype),
+                core.CPUPlace(),
+            )
+            tensor._share_filename()
+            slab.append(tensor)
+        return slab
+
+    def _build_plan(self, samples):
+        leaves = []
+        if not _sample_leaves(samples[0], leaves) or len(leaves) == 0:
+            return False
+        # empty tensor cannot be shared by memory map
+        if any(leaf.size == 0 for leaf in leaves):
+            return False
+        flat_batch, structure = _flatten_batch(default_collate_fn(samples))
+        if len(flat_batch) != len(leaves):
+            return False
+
+        self._fields = [(leaf.dtype.str, leaf.shape) for leaf in leaves]
+        self._batch_size = len(samples)
+        try:
+            self._slabs.append(self._new_slab())
+        except Exception:
+            # dtype not supported by LoDTensor
+            self._fields = None
+            return False
+        self.structure = structure
+        return True
+
+    def _acquire(self):
+        # a slab is free when it is only referenced by this worker
+        for slot, slab in enumerate(self._slabs):
+            if all(_shared_refcount(tensor) == 1 for tensor in slab):
+                return slot
+        if len(self._slabs) < self._max_slabs:
+            self._slabs.append(self._new_slab())
+            return len(self._slabs) - 1
+        return None
+
+    def write(self, samples):
+        """
+        Write samples into a free slab, return a :code:`_SlabBatch` on
+        success, or None if the batch should be collated in the normal way.
+        """
+        if self._disabled or len(samples) == 0:
+            return None
+        if self._fields is None and not self._build_plan(samples):
+            self._disabled = True
+            return None
+        if len(samples) > self._batch_size:
+            return None
+
+        sample_leaves = []
+        for sample in samples:
+            leaves = []
+            if not _sample_leaves(sample, leaves) or len(leaves) != len(
+                self._fields
+            ):
+                return None
+            for leaf, (dtype, shape) in zip(leaves, self._fields):
+                if leaf.shape != shape or leaf.dtype.str != dtype:
+                    return None
+            sample_leaves.append(leaves)
+
+        slot = self._acquire()
+        if slot is None:
+            return None
+        fields = []
+        for field_idx, tensor in enumerate(self._slabs[slot]):
+            dst = np.asarray(tensor)
+            for i, leaves in enumerate(sample_leaves):
+                dst[i] = leaves[field_idx]
+            del dst
+            ipc_name, size, type_idx, _, _ = tensor._share_filename()
+            fields.append(
+                (ipc_name, size, type_idx, self._fields[field_idx][1])
+            )
+            # hold a reference for the main process until it wraps the
+            # slab, the same as paddle.incubate.multiprocessing does
+            tensor._shared_incref()
+
+        return _SlabBatch(self._worker_id, slot, len(samples), fields)
+
+    def close(self):
+        # slabs still held by the main process are unlinked when the
+        # main process releases them
+        self._slabs = []
+
+
+def _read_slab_batch(slab_batch):
+    """
+    Wrap the slab of a :code:`_SlabBatch` into LoDTensors in main process
+    without copying, the slab is released back to the worker when all
+    these LoDTensors are released.
+    """
+    tensor_list = []
+    for ipc_name, size, type_idx, shape in slab_batch.fields:
+        tensor = core.LoDTensor._new_shared_filename(
+            (ipc_name, size, type_idx, [slab_batch.batch_size, *shape], [])
+        )
+        tensor._shared_decref()
+        tensor_list.append(tensor)
+    return tensor_list
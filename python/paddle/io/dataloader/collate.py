@@ -13,6 +13,7 @@
 # limitations under the License.
 
 import numbers
+import operator
 from collections.abc import Mapping, Sequence
 
 import numpy as np
@@ -109,3 +110,306 @@ def default_convert_fn(batch):
         return [default_convert_fn(d) for d in batch]
     else:
         return batch
+
+
+# kinds of fields in a collate plan
+_FIELD_NUMBER = 0
+_FIELD_ARRAY = 1
+_FIELD_PADDED = 2
+_FIELD_TENSOR = 3
+_FIELD_RAW = 4
+
+_BUFFER_ALIGNMENT = 64
+
+
+class _PlanMismatch(Exception):
+    pass
+
+
+def _compile_getter(path):
+    if len(path) == 0:
+        return lambda sample: sample
+    if len(path) == 1:
+        return operator.itemgetter(path[0])
+
+    def _getter(sample):
+        for key in path:
+            sample = sample[key]
+        return sample
+
+    return _getter
+
+
+class _CollateField:
+    def __init__(self, path, kind, dtype=None, shape=None, py_type=None):
+        self.path = path
+        self.getter = _compile_getter(path)
+        self.kind = kind
+        self.dtype = dtype
+        self.shape = shape
+        self.py_type = py_type
+        self.index = -1
+        self.sample_nbytes = 0
+        if kind in (_FIELD_NUMBER, _FIELD_ARRAY):
+            self.sample_nbytes = int(np.prod(shape, dtype=np.int64)) * (
+                dtype.itemsize
+            )
+
+
+class _CollatePlan:
+    """
+    A flat collate plan compiled from a batch, which records each leaf
+    field of the sample by its path, with its dtype, shape and kind, and
+    a builder to restore the nested sample structure from the collated
+    fields.
+    """
+
+    def __init__(self, batch, padding_value=None):
+        self.padding_value = padding_value
+        self.fields = []
+        # (getter, length, is_sequence) of the container nodes, used to
+        # check the structure of following batches
+        self.struct_checks = []
+        self.builder = self._compile(batch[0], batch, ())
+        self.fixed_fields = [
+            f for f in self.fields if f.kind in (_FIELD_NUMBER, _FIELD_ARRAY)
+        ]
+        self.other_fields = [
+            f
+            for f in self.fields
+            if f.kind not in (_FIELD_NUMBER, _FIELD_ARRAY)
+        ]
+
+    def _add_field(self, field):
+        idx = len(self.fields)
+        field.index = idx
+        self.fields.append(field)
+        return lambda values: values[idx]
+
+    def _compile(self, sample, batch, path, in_sequence=False):
+        if isinstance(sample, np.ndarray):
+            getter = _compile_getter(path)
+            shapes = {getter(s).shape for s in batch}
+            if len(shapes) > 1 and self.padding_value is not None:
+                kind = _FIELD_PADDED
+            else:
+                kind = _FIELD_ARRAY
+            return self._add_field(
+                _CollateField(path, kind, sample.dtype, sample.shape)
+            )
+        elif isinstance(sample, (paddle.Tensor, core.eager.Tensor)):
+            return self._add_field(_CollateField(path, _FIELD_TENSOR))
+        elif isinstance(sample, numbers.Number):
+            return self._add_field(
+                _CollateField(
+                    path,
+                    _FIELD_NUMBER,
+                    np.array([sample]).dtype,
+                    (),
+                    type(sample),
+                )
+            )
+        elif isinstance(sample, (str, bytes)):
+            # NOTE: keep the same container type as default_collate_fn,
+            # which zips fields of sequence samples into tuples
+            return self._add_field(
+                _CollateField(
+                    path, _FIELD_RAW, py_type=tuple if in_sequence else list
+                )
+            )
+        elif isinstance(sample, Mapping):
+            keys = list(sample.keys())
+            children = [
+                self._compile(sample[key], batch, (*path, key)) for key in keys
+            ]
+            self.struct_checks.append((_compile_getter(path), len(keys), False))
+            return lambda values: {
+                key: child(values) for key, child in zip(keys, children)
+            }
+        elif isinstance(sample, Sequence):
+            children = [
+                self._compile(field, batch, (*path, i), True)
+                for i, field in enumerate(sample)
+            ]
+            self.struct_checks.append(
+                (_compile_getter(path), len(children), True)
+            )
+            return lambda values: [child(values) for child in children]
+
+        raise TypeError(
+            "batch data con only contains: tensor, numpy.ndarray, "
+            f"dict, list, number, but got {type(sample)}"
+        )
+
+    def _check_struct(self, batch):
+        for getter, length, is_sequence in self.struct_checks:
+            # NOTE: same as default_collate_fn, keys of dict are decided
+            # by the first sample, and all sequences should be same length
+            if is_sequence:
+                if not all(len(getter(s)) == length for s in batch):
+                    raise _PlanMismatch()
+            elif len(getter(batch[0])) != length:
+                raise _PlanMismatch()
+
+    def _pad(self, field, values):
+        if any(
+            v.dtype != field.dtype or v.ndim != len(field.shape) for v in values
+        ):
+            raise _PlanMismatch()
+        max_shape = np.max([v.shape for v in values], axis=0)
+        out = np.full(
+            (len(values), *max_shape), self.padding_value, dtype=field.dtype
+        )
+        for i, v in enumerate(values):
+            out[(i, *(slice(0, d) for d in v.shape))] = v
+        return out
+
+    def collate(self, batch):
+        self._check_struct(batch)
+        batch_size = len(batch)
+        outputs = [None] * len(self.fields)
+
+        # fixed-shape numeric fields of a batch are collated into one
+        # contiguous buffer, each field is a view at its offset
+        offsets = []
+        nbytes = 0
+        for field in self.fixed_fields:
+            offsets.append(nbytes)
+            field_nbytes = field.sample_nbytes * batch_size
+            nbytes += (
+                (field_nbytes + _BUFFER_ALIGNMENT - 1)
+                // _BUFFER_ALIGNMENT
+                * _BUFFER_ALIGNMENT
+            )
+        buffer = np.empty(max(nbytes, 1), dtype=np.uint8)
+
+        padded_fields = []
+        for field, offset in zip(self.fixed_fields, offsets):
+            values = [field.getter(s) for s in batch]
+            if field.kind == _FIELD_NUMBER:
+                py_type = field.py_type
+                if not all(type(v) is py_type for v in values):
+                    raise _PlanMismatch()
+            else:
+                dtype, shape = field.dtype, field.shape
+                if not all(
+                    type(v) is np.ndarray
+                    and v.shape == shape
+                    and v.dtype == dtype
+                    for v in values
+                ):
+                    if self.padding_value is None:
+                        raise _PlanMismatch()
+                    # fall back to padding for variable-length field
+                    outputs[field.index] = self._pad(field, values)
+                    padded_fields.append(field)
+                    continue
+            out = np.ndarray(
+                (batch_size, *field.shape),
+                dtype=field.dtype,
+                buffer=buffer,
+                offset=offset,
+            )
+            if field.kind == _FIELD_NUMBER:
+                out[...] = values
+            else:
+                np.stack(values, axis=0, out=out)
+            outputs[field.index] = out
+
+        for field in self.other_fields:
+            values = [field.getter(s) for s in batch]
+            if field.kind == _FIELD_PADDED:
+                outputs[field.index] = self._pad(field, values)
+            elif field.kind == _FIELD_TENSOR:
+                outputs[field.index] = paddle.stack(values, axis=0)
+            else:
+                outputs[field.index] = field.py_type(values)
+
+        # fields turned to padded field in this batch are collated in
+        # padded way from next batch on, the plan is only changed after
+        # the whole batch is collated
+        for field in padded_fields:
+            field.kind = _FIELD_PADDED
+        self.fixed_fields = [
+            f
+            for f in self.fixed_fields
+            if f.kind in (_FIELD_NUMBER, _FIELD_ARRAY)
+        ]
+        self.other_fields = [
+            f
+            for f in self.fields
+            if f.kind not in (_FIELD_NUMBER, _FIELD_ARRAY)
+        ]
+        return self.builder(outputs)
+
+
+class CollateEngine:
+    """
+    Batch collating function for :code:`paddle.io.DataLoader` which
+    compiles a flat collate plan from the first batch and reuses it for
+    all following batches, instead of walking each batch recursively as
+    :code:`default_collate_fn` does.
+
+    The collate plan records the path, dtype and shape of each leaf field
+    in a sample. Fixed-shape numeric fields (numbers and numpy arrays) of
+    a batch are collated into one contiguous buffer, and numpy array fields
+    with variable shapes are padded to the max shape in the batch with
+    :attr:`padding_value` if it is set. If a batch does not match the
+    compiled plan, the plan is recompiled from this batch, and
+    :code:`default_collate_fn` is used if the batch still not matches.
+
+    Args:
+        padding_value(number, optional): the value to pad variable-length
+            numpy array fields with, None for not padding and variable-length
+            fields are not supported as :code:`default_collate_fn`. Default
+            None.
+
+    Returns:
+        CollateEngine: a callable object which can be used as :attr:`collate_fn`
+            of :code:`paddle.io.DataLoader`.
+
+    Examples:
+
+        .. code-block:: python
+
+            >>> import numpy as np
+            >>> from paddle.io import DataLoader, Dataset
+            >>> from paddle.io.dataloader.collate import CollateEngine
+
+            >>> class RandomDataset(Dataset):
+            ...     def __getitem__(self, idx):
+            ...         ids = np.arange(idx % 5 + 1).astype('int64')
+            ...         return {'input_ids': ids, 'label': idx % 2}
+            ...
+            ...     def __len__(self):
+            ...         return 16
+            ...
+            >>> loader = DataLoader(
+            ...     RandomDataset(),
+            ...     batch_size=4,
+            ...     collate_fn=CollateEngine(padding_value=0),
+            ... )
+            >>> for data in loader:
+            ...     print(data['input_ids'].shape, data['label'].shape)
+            ...     break
+            [4, 4] [4]
+    """
+
+    def __init__(self, padding_value=None):
+        self._padding_value = padding_value
+        self._plan = None
+
+    def __call__(self, batch):
+        if len(batch) == 0:
+            return default_collate_fn(batch)
+        if self._plan is not None:
+            try:
+                return self._plan.collate(batch)
+            except (_PlanMismatch, KeyError, IndexError, TypeError):
+                pass
+        try:
+            self._plan = _CollatePlan(batch, self._padding_value)
+            return self._plan.collate(batch)
+        except (_PlanMismatch, KeyError, IndexError, TypeError):
+            self._plan = None
+            return default_collate_fn(batch)
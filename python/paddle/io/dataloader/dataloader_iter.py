@@ -36,8 +36,10 @@ from ..multiprocess_utils import (
     _set_SIGCHLD_handler,
 )
 from .batch_sampler import _InfiniteIterableSampler
+from .batch_slab import _SlabBatch, _read_slab_batch, _use_batch_slab
 from .collate import default_collate_fn, default_convert_fn
 from .flat import _flatten_batch, _restore_batch
+from .prefetch import _PrefetchStage
 from .worker import (
     _DatasetKind,
     _IterableDatasetStopIteration,
@@ -104,6 +106,12 @@ class _DataLoaderIterBase:
         self._worker_init_fn = loader.worker_init_fn
         self._dataset_kind = loader.dataset_kind
         self._pin_memory = loader.pin_memory
+        self._prefetch_depth = loader._prefetch_depth
+        self._prefetch_stats = loader._prefetch_stats
+        self._prefetcher = None
+        # batch number returned in current epoch, used to resume
+        # iteration from DataLoader.state_dict
+        self._num_yielded = 0
 
         self._sampler_iter = iter(self._index_sampler)
         if self._auto_collate_batch:
@@ -136,6 +144,28 @@ class _DataLoaderIterBase:
     def __len__(self):
         return len(self._batch_sampler)
 
+    def _init_prefetch(self):
+        # NOTE: prefetch stage reads batches from reader and restores
+        # batch structure in background thread, only for dynamic mode
+        if self._prefetch_depth > 0 and in_dynamic_mode():
+            self._prefetcher = _PrefetchStage(
+                self._read_next_dynamic,
+                self._prefetch_depth,
+                self._prefetch_stats,
+                _current_expected_place(),
+            )
+
+    def _shutdown_prefetch(self):
+        if self._prefetcher is not None:
+            self._prefetcher.shutdown()
+            self._prefetcher = None
+
+    def _read_next_dynamic(self):
+        data = core.eager.read_next_tensor_list(
+            self._reader.read_next_list()[0]
+        )
+        return _restore_batch(data, self._structure_infos.pop(0))
+
     def _exit_thread_expectedly(self):
         self._thread_done_event.set()
         if self._blocking_queue:
@@ -180,6 +210,7 @@ class _DataLoaderIterSingleProcess(_DataLoaderIterBase):
         )
 
         self._init_thread()
+        self._init_prefetch()
         self._shutdown = False
 
         global _loader
@@ -232,9 +263,11 @@ class _DataLoaderIterSingleProcess(_DataLoaderIterBase):
                 # read data from dataset in mini-batch
                 # with paddle.base.dygraph.guard(place=paddle.CPUPlace()):
                 # read data from dataset in mini-batch
+                start = self._prefetch_stats.start()
                 batch = self._dataset_fetcher.fetch(
                     indices, self._thread_done_event
                 )
+                self._prefetch_stats.record('fetch', start)
             except StopIteration:
                 self._exit_thread_expectedly()
                 return
@@ -266,7 +299,9 @@ class _DataLoaderIterSingleProcess(_DataLoaderIterBase):
                     break
 
                 try:
+                    start = self._prefetch_stats.start()
                     self._blocking_queue.push(array)
+                    self._prefetch_stats.record('push', start)
                 except:
                     self._exit_thread_expectedly()
 
@@ -287,10 +322,10 @@ class _DataLoaderIterSingleProcess(_DataLoaderIterBase):
             benchmark().check_if_need_record(self)
             benchmark().before_reader()
             if in_dynamic_mode():
-                data = core.eager.read_next_tensor_list(
-                    self._reader.read_next_list()[0]
-                )
-                data = _restore_batch(data, self._structure_infos.pop(0))
+                if self._prefetcher is not None:
+                    data = self._prefetcher.get()
+                else:
+                    data = self._read_next_dynamic()
             else:
                 # in static graph mode
                 if self._return_list:
@@ -310,6 +345,7 @@ class _DataLoaderIterSingleProcess(_DataLoaderIterBase):
                 else:
                     data = self._reader.read_next()
             benchmark().after_reader()
+            self._num_yielded += 1
 
             return data
         except StopIteration:
@@ -348,6 +384,7 @@ class _DataLoaderIterSingleProcess(_DataLoaderIterBase):
                 # blocking queue read may hang and _thread_done_event
                 # cannot be checked
                 self._shutdown_thread()
+                self._shutdown_prefetch()
             finally:
                 self._shutdown = True
 
@@ -392,7 +429,11 @@ class _DataLoaderIterMultiProcess(_DataLoaderIterBase):
         # see _try_put_indices
         self._thread_lock = threading.Lock()
 
-        self._base_seed = np.random.randint(low=0, high=sys.maxsize)
+        if loader._resume_base_seed is not None:
+            self._base_seed = loader._resume_base_seed
+            loader._resume_base_seed = None
+        else:
+            self._base_seed = np.random.randint(low=0, high=sys.maxsize)
 
         # Note(zhangbo): shm_buffer_size is used for MemoryMapAllocationPool.
         # MemoryMapAllocationPool is used to cache and reuse shm, thus reducing munmap in dataloader.
@@ -417,12 +458,32 @@ class _DataLoaderIterMultiProcess(_DataLoaderIterBase):
             (self._worker_shm_buffer_size) * 2 * self._num_workers
         )
 
+        # NOTE: [ batch slab ] batch slab mode assembles batches directly
+        # in recycled shared memory slabs in workers, which is only
+        # supported with default_collate_fn in automatic batching mode,
+        # see paddle/io/dataloader/batch_slab.py for more details
+        self._use_batch_slab = (
+            _use_batch_slab()
+            and self._use_shared_memory
+            and self._auto_collate_batch
+            and loader.collate_fn is None
+        )
+        # slabs are held by batches cached for reordering, batches in
+        # blocking queue and batches used by users, so each worker may
+        # need up to about twice of _outstanding_capacity slabs, which
+        # are allocated lazily
+        self._max_slabs = 2 * self._outstanding_capacity + 2
+
         # init workers and indices queues and put 2 indices in each indices queue
         self._init_workers()
         for _ in range(self._outstanding_capacity):
             self._try_put_indices()
 
         self._init_thread()
+        # NOTE: in persistent workers mode, blocking queue is drained and
+        # reused among epochs in _reset, prefetch stage is not supported
+        if not self._persistent_workers:
+            self._init_prefetch()
         self._shutdown = False
 
     def _init_workers(self):
@@ -463,6 +524,8 @@ class _DataLoaderIterMultiProcess(_DataLoaderIterBase):
                     self._use_shared_memory,
                     self._base_seed,
                     self._worker_shm_buffer_size,
+                    self._use_batch_slab,
+                    self._max_slabs,
                 ),
             )
             worker.daemon = True
@@ -548,6 +611,7 @@ class _DataLoaderIterMultiProcess(_DataLoaderIterBase):
         self._send_idx = 0
         self._rcvd_idx = 0
         self._batches_outstanding = 0
+        self._num_yielded = 0
         self._task_infos = {}
         self._structure_infos = []
 
@@ -586,6 +650,7 @@ class _DataLoaderIterMultiProcess(_DataLoaderIterBase):
                     for q in self._indices_queues:
                         q.cancel_join_thread()
                         q.close()
+                self._shutdown_prefetch()
             finally:
                 core._erase_process_pids(id(self))
                 self._shutdown = True
@@ -629,8 +694,10 @@ class _DataLoaderIterMultiProcess(_DataLoaderIterBase):
                                     slot = tmp
                                 array.append(slot)
 
+                        start = self._prefetch_stats.start()
                         if not self._blocking_queue.push(array):
                             self._blocking_queue.close()
+                        self._prefetch_stats.record('push', start)
                     except Exception as e:
                         self._exit_thread_unexpectedly()
                         raise e
@@ -689,7 +756,9 @@ class _DataLoaderIterMultiProcess(_DataLoaderIterBase):
                 #    exception handling.
                 # 2. if get data timeout and check workers all alive, continue to
                 #    get data again
+                start = self._prefetch_stats.start()
                 data = self._data_queue.get(timeout=self._timeout)
+                self._prefetch_stats.record('fetch', start)
             except Exception as e:
                 # check if thread done event set when waiting data
                 if self._thread_done_event.is_set():
@@ -750,6 +819,11 @@ class _DataLoaderIterMultiProcess(_DataLoaderIterBase):
                     self._exit_thread_unexpectedly()
                     batch.reraise()
 
+                # wrap slab as soon as received, the slab is held by
+                # the wrapped tensors until they are released
+                if isinstance(batch, _SlabBatch):
+                    batch = _read_slab_batch(batch)
+
                 if idx == self._rcvd_idx:
                     if idx in self._task_infos:
                         del self._task_infos[idx]
@@ -821,10 +895,10 @@ class _DataLoaderIterMultiProcess(_DataLoaderIterBase):
                     self._blocking_queue.close()
 
             if in_dynamic_mode():
-                data = core.eager.read_next_tensor_list(
-                    self._reader.read_next_list()[0]
-                )
-                data = _restore_batch(data, self._structure_infos.pop(0))
+                if self._prefetcher is not None:
+                    data = self._prefetcher.get()
+                else:
+                    data = self._read_next_dynamic()
             else:
                 if self._return_list:
                     data = self._reader.read_next_list()
@@ -844,6 +918,7 @@ class _DataLoaderIterMultiProcess(_DataLoaderIterBase):
                     data = self._reader.read_next()
             self._on_output_batch()
             benchmark().after_reader()
+            self._num_yielded += 1
             return data
         except StopIteration:
             if not self._persistent_workers:
@@ -0,0 +1,158 @@
+#   Copyright (c) 2024 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import queue
+import sys
+import threading
+import time
+
+from paddle.base.framework import _set_expected_place
+
+from ...framework import core
+from ..multiprocess_utils import MP_STATUS_CHECK_INTERVAL
+
+# pipeline stages which stall time is recorded
+# fetch: waiting for batch from dataset (single-process) or workers
+# push: blocking on pushing batch into blocking queue
+# restore: waiting for batch from reader in prefetch stage
+# output: training loop waiting for prefetched batch
+_PIPELINE_STAGES = ('fetch', 'push', 'restore', 'output')
+
+
+class _PrefetchStats:
+    """
+    Stall time statistics of each DataLoader pipeline stage, accumulated
+    among all epochs of a DataLoader. Nothing is timed if not enabled.
+    """
+
+    def __init__(self, enabled=False):
+        self.enabled = enabled
+        self.reset()
+
+    def reset(self):
+        self._count = dict.fromkeys(_PIPELINE_STAGES, 0)
+        self._stall_time = dict.fromkeys(_PIPELINE_STAGES, 0.0)
+
+    def start(self):
+        return time.perf_counter() if self.enabled else None
+
+    def record(self, stage, start):
+        # start is the return value of start() before the stall
+        if start is None:
+            return
+        self._count[stage] += 1
+        self._stall_time[stage] += time.perf_counter() - start
+
+    def summary(self):
+        return {
+            stage: {
+                'count': self._count[stage],
+                'stall_time': self._stall_time[stage],
+                'avg_stall_time': self._stall_time[stage]
+                / max(self._count[stage], 1),
+            }
+            for stage in _PIPELINE_STAGES
+        }
+
+
+class _StopPrefetch:
+    pass
+
+
+class _ExceptionWrapper:
+    def __init__(self, exc_info):
+        self.exc_info = exc_info
+
+    def reraise(self):
+        raise self.exc_info[1].with_traceback(self.exc_info[2])
+
+
+class _PrefetchStage:
+    """
+    Prefetch stage of DataLoader in dynamic mode, which reads batches from
+    reader, converts them to Tensors and restores the batch structure in a
+    background thread, and keeps at most :attr:`depth` ready batches, to
+    overlap batch reading and restoring (and the asynchronous host to
+    device copy in the buffered reader) with training steps.
+
+    Args:
+        read_fn(callable): function to read and restore a batch, which
+            raises StopIteration when data drained.
+        depth(int): max ready batch number.
+        stats(_PrefetchStats): stall time statistics.
+        expected_place(Place): expected place of the prefetch thread.
+    """
+
+    def __init__(self, read_fn, depth, stats, expected_place):
+        self._read_fn = read_fn
+        self._stats = stats
+        self._queue = queue.Queue(maxsize=depth)
+        self._done_event = threading.Event()
+        self._thread = threading.Thread(
+            target=self._thread_loop, args=(expected_place,)
+        )
+        self._thread.daemon = True
+        self._thread.start()
+
+    def _put(self, item):
+        while not self._done_event.is_set():
+            try:
+                self._queue.put(item, timeout=MP_STATUS_CHECK_INTERVAL)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _thread_loop(self, expected_place):
+        core.set_current_thread_name("DataloaderPrefetch_" + str(id(self)))
+        _set_expected_place(expected_place)
+
+        while not self._done_event.is_set():
+            try:
+                start = self._stats.start()
+                data = self._read_fn()
+                self._stats.record('restore', start)
+            except StopIteration:
+                self._put(_StopPrefetch())
+                return
+            except Exception:
+                if not self._done_event.is_set():
+                    self._put(_ExceptionWrapper(sys.exc_info()))
+                return
+            if not self._put(data):
+                return
+
+    def get(self):
+        start = self._stats.start()
+        data = self._queue.get()
+        self._stats.record('output', start)
+        if isinstance(data, _StopPrefetch):
+            raise StopIteration
+        if isinstance(data, _ExceptionWrapper):
+            data.reraise()
+        return data
+
+    def shutdown(self):
+        self._done_event.set()
+        # unblock the thread waiting on a full queue
+        while True:
+            try:
+                self._queue.get_nowait()
+            except queue.Empty:
+                break
+        if (
+            self._thread.is_alive()
+            and self._thread is not threading.current_thread()
+        ):
+            self._thread.join(MP_STATUS_CHECK_INTERVAL)
@@ -15,6 +15,7 @@
 import numpy as np
 
 from ...framework import core
+from ...framework.random import get_rng_state, set_rng_state
 from ...tensor import randperm
 
 
@@ -90,6 +91,28 @@ class Sampler:
     def __iter__(self):
         raise NotImplementedError
 
+    def state_dict(self):
+        """
+        Get the state of the sampler to reproduce the indices order of the
+        current epoch, which is used by :code:`paddle.io.BatchSampler` and
+        :code:`paddle.io.DataLoader` to resume iteration in the middle of an
+        epoch. Stateless samplers return an empty dict.
+
+        Returns:
+            dict: the state of the sampler.
+        """
+        return {}
+
+    def load_state_dict(self, state_dict):
+        """
+        Load the state got from :code:`state_dict`, the next epoch will
+        generate indices in the same order as the epoch when the state is got.
+
+        Args:
+            state_dict(dict): the state of the sampler.
+        """
+        pass
+
     # Not define __len__ method in this base class here for __len__
     # is not needed in same sence, e.g. paddle.io.IterableDataset
 
@@ -205,6 +228,10 @@ class RandomSampler(Sampler):
         self.replacement = replacement
         self._num_samples = num_samples
         self.generator = generator
+        # numpy random state at the beginning of the latest epoch, and
+        # the random state to resume from in the next epoch
+        self._epoch_rng_state = None
+        self._resume_rng_state = None
 
         if not isinstance(self.replacement, bool):
             raise TypeError(
@@ -239,6 +266,10 @@ class RandomSampler(Sampler):
                     return
                 yield index
         else:
+            if self._resume_rng_state is not None:
+                np.random.set_state(self._resume_rng_state)
+                self._resume_rng_state = None
+            self._epoch_rng_state = np.random.get_state()
             if self.replacement:
                 for index in np.random.choice(
                     np.arange(n), self.num_samples, replace=True
@@ -253,6 +284,19 @@ class RandomSampler(Sampler):
     def __len__(self):
         return self.num_samples
 
+    def state_dict(self):
+        if self.generator:
+            # the position of a user generator cannot be saved, resuming
+            # from an empty state would silently change the indices order
+            raise ValueError(
+                "RandomSampler with generator does not support state_dict, "
+                "since the state of the generator cannot be saved"
+            )
+        return {'rng_state': self._epoch_rng_state}
+
+    def load_state_dict(self, state_dict):
+        self._resume_rng_state = state_dict.get('rng_state', None)
+
 
 def _weighted_sample(weights, num_samples, replacement=True):
     if isinstance(weights, core.LoDTensor):
@@ -331,8 +375,14 @@ class WeightedRandomSampler(Sampler):
         self.weights = weights
         self.num_samples = num_samples
         self.replacement = replacement
+        self._epoch_rng_state = None
+        self._resume_rng_state = None
 
     def __iter__(self):
+        if self._resume_rng_state is not None:
+            np.random.set_state(self._resume_rng_state)
+            self._resume_rng_state = None
+        self._epoch_rng_state = np.random.get_state()
         idxs = _weighted_sample(
             self.weights, self.num_samples, self.replacement
         )
@@ -342,6 +392,12 @@ class WeightedRandomSampler(Sampler):
         mul = np.prod(self.weights.shape) // self.weights.shape[-1]
         return self.num_samples * mul
 
+    def state_dict(self):
+        return {'rng_state': self._epoch_rng_state}
+
+    def load_state_dict(self, state_dict):
+        self._resume_rng_state = state_dict.get('rng_state', None)
+
 
 class SubsetRandomSampler(Sampler):
     r"""
@@ -376,10 +432,24 @@ class SubsetRandomSampler(Sampler):
                 "The length of `indices` in SubsetRandomSampler should be greater than 0."
             )
         self.indices = indices
+        # paddle random state at the beginning of the latest epoch, and
+        # the random state to resume from in the next epoch
+        self._epoch_rng_state = None
+        self._resume_rng_state = None
 
     def __iter__(self):
+        if self._resume_rng_state is not None:
+            set_rng_state(self._resume_rng_state)
+            self._resume_rng_state = None
+        self._epoch_rng_state = get_rng_state()
         for i in randperm(len(self.indices)):
             yield self.indices[i]
 
     def __len__(self) -> int:
         return len(self.indices)
+
+    def state_dict(self):
+        return {'rng_state': self._epoch_rng_state}
+
+    def load_state_dict(self, state_dict):
+        self._resume_rng_state = state_dict.get('rng_state', None)
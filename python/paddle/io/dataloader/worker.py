@@ -27,6 +27,8 @@ from ..multiprocess_utils import (
     CleanupFuncRegistrar,
     _cleanup_mmap,
 )
+from .batch_slab import _BatchSlabWriter
+from .collate import default_collate_fn
 from .fetcher import _IterableDatasetFetcher, _MapDatasetFetcher
 from .flat import _flatten_batch
 
@@ -285,7 +287,10 @@ def _worker_loop(
     use_shared_memory,
     base_seed,
     shm_cahce_size=0,
+    use_batch_slab=False,
+    max_slabs=0,
 ):
+    slab_writer = None
     try:
         # NOTE: [ mmap files clear ] When the child process exits unexpectedly,
         # some shared memory objects may have been applied for but have not yet
@@ -319,12 +324,25 @@ def _worker_loop(
             seed=base_seed,
         )
 
+        # NOTE: in batch slab mode, fetcher only gathers samples, samples
+        # are assembled into shared memory slabs by slab_writer, and only
+        # batches which cannot be assembled fall back to default_collate_fn
+        if use_batch_slab:
+            slab_writer = _BatchSlabWriter(worker_id, max_slabs)
+            fetcher_collate_fn = None
+        else:
+            fetcher_collate_fn = collate_fn
+
         init_exception = None
         try:
             if init_fn is not None:
                 init_fn(worker_id)
             fetcher = _DatasetKind.create_fetcher(
-                dataset_kind, dataset, auto_collate_batch, collate_fn, drop_last
+                dataset_kind,
+                dataset,
+                auto_collate_batch,
+                fetcher_collate_fn,
+                drop_last,
             )
         except:
             init_exception = _WorkerException(worker_id)
@@ -342,7 +360,11 @@ def _worker_loop(
                 out_queue.put((data, None, None))
                 iterator_drained = False
                 fetcher = _DatasetKind.create_fetcher(
-                    dataset_kind, dataset, auto_collate_batch, collate_fn, True
+                    dataset_kind,
+                    dataset,
+                    auto_collate_batch,
+                    fetcher_collate_fn,
+                    True,
                 )
                 continue
 
@@ -358,6 +380,7 @@ def _worker_loop(
                 continue
 
             idx, indices = data
+            slab_batch = None
             try:
                 if init_exception is not None:
                     batch = init_exception
@@ -370,6 +393,10 @@ def _worker_loop(
                     #       to make sure tensor will be operated only on CPU
                     with paddle.base.dygraph.guard(place=paddle.CPUPlace()):
                         batch = fetcher.fetch(indices)
+                        if slab_writer is not None:
+                            slab_batch = slab_writer.write(batch)
+                            if slab_batch is None:
+                                batch = default_collate_fn(batch)
             except Exception as e:
                 if (
                     isinstance(e, StopIteration)
@@ -382,6 +409,9 @@ def _worker_loop(
             else:
                 if isinstance(batch, _WorkerException):
                     out_queue.put((idx, batch, None))
+                if slab_batch is not None:
+                    out_queue.put((idx, slab_batch, slab_writer.structure))
+                    continue
                 batch, structure = _flatten_batch(batch)
                 if use_shared_memory:
 
@@ -405,6 +435,8 @@ def _worker_loop(
     except:
         raise
     finally:
+        if slab_writer is not None:
+            slab_writer.close()
         if use_shared_memory:
             _cleanup_mmap()
     if done_event.is_set():
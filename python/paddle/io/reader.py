@@ -18,6 +18,7 @@ import multiprocessing
 import sys
 import time
 import warnings
+import weakref
 
 import paddle
 
@@ -34,6 +35,7 @@ from .dataloader.dataloader_iter import (
     _DataLoaderIterSingleProcess,
     _DatasetKind,
 )
+from .dataloader.prefetch import _PrefetchStats
 
 # NOTE: [ avoid hanging & failed quickly ]
 # These value is used in getting data from another process
@@ -43,6 +45,9 @@ USE_PINNED_MEMORY = None
 # AutoTune Flags
 USE_AUTOTUNE = False
 TUNING_STEPS = 500
+# Prefetch Flags
+PREFETCH_DEPTH = 0
+PIPELINE_STATS = False
 
 
 def set_autotune_config(use_autotune, tuning_steps=500):
@@ -52,6 +57,28 @@ def set_autotune_config(use_autotune, tuning_steps=500):
     TUNING_STEPS = tuning_steps
 
 
+def set_prefetch_config(prefetch_depth=0, pipeline_stats=False):
+    """
+    Set the depth of the prefetch stage of DataLoader created afterwards.
+    In dynamic mode, the prefetch stage reads at most :attr:`prefetch_depth`
+    batches ahead from the buffered reader, converts them to Tensors and
+    restores the batch structure in a background thread, which overlaps
+    these works and the host to device copy with training steps.
+
+    Args:
+        prefetch_depth(int, optional): max number of ready batches, 0 for
+            disabling the prefetch stage. Default 0.
+        pipeline_stats(bool, optional): whether to record the stall time
+            of the pipeline stages, see :code:`DataLoader.pipeline_stats`.
+            Default False.
+    """
+    assert prefetch_depth >= 0, "prefetch_depth should be non-negative"
+    global PREFETCH_DEPTH
+    PREFETCH_DEPTH = prefetch_depth
+    global PIPELINE_STATS
+    PIPELINE_STATS = pipeline_stats
+
+
 def use_pinned_memory(*args):
     global USE_PINNED_MEMORY
     if len(args) == 0:
@@ -305,7 +332,10 @@ class DataLoader:
             as True only when the shared memory space on your machine(e.g.
             space of '/dev/shm' on Linux operating sysytem) is large enough.
             Shared memory will only be enabled in multi-process mode(num_workers
-            > 0). Default True.
+            > 0). If environment variable ``FLAGS_dataloader_use_batch_slab``
+            is set and :attr:`collate_fn` is None, workers assemble batches
+            directly in recycled shared memory slabs to avoid stacking and
+            copying each batch twice. Default True.
         timeout(int, optional): the timeout value for getting data form output queue
             of subprocesses. Default 0.
         worker_init_fn(callable, optional): init function which will be called with
@@ -494,6 +524,13 @@ class DataLoader:
 
         self._persistent_workers = persistent_workers
         self._iterator = None
+        self._prefetch_depth = PREFETCH_DEPTH
+        self._prefetch_stats = _PrefetchStats(PIPELINE_STATS)
+        # the latest iterator to get iteration state from, and the state
+        # to resume the next iteration from
+        self._last_iterator = None
+        self._resume_num_yielded = 0
+        self._resume_base_seed = None
         self.num_workers = AuToTune(self).__call__()
 
     def __len__(self):
@@ -507,15 +544,123 @@ class DataLoader:
 
     def __iter__(self):
         if self.num_workers == 0:
-            return _DataLoaderIterSingleProcess(self)
+            iterator = _DataLoaderIterSingleProcess(self)
         elif self._persistent_workers:
             if self._iterator is None:
                 self._iterator = _DataLoaderIterMultiProcess(self)
             else:
                 self._iterator._reset()
-            return self._iterator
+            iterator = self._iterator
         else:
-            return _DataLoaderIterMultiProcess(self)
+            iterator = _DataLoaderIterMultiProcess(self)
+        iterator._num_yielded += self._resume_num_yielded
+        self._resume_num_yielded = 0
+        self._last_iterator = weakref.ref(iterator)
+        return iterator
 
     def __call__(self):
         return self.__iter__()
+
+    def state_dict(self):
+        """
+        Get the iteration state of the DataLoader, which can be used to
+        resume iteration from the next batch of the current epoch with
+        :code:`load_state_dict` after restarting, without iterating the
+        consumed batches again.
+
+        The state contains the state of :attr:`batch_sampler` (random state
+        and epoch to reproduce the indices order of this epoch), the batch
+        number returned in this epoch, and the base random seed of workers.
+        Batches prefetched by workers but not returned yet are not consumed,
+        they will be loaded again after resuming.
+
+        Returns:
+            dict: the iteration state of the DataLoader.
+
+        Examples:
+
+            .. code-block:: python
+
+                >>> import numpy as np
+                >>> from paddle.io import Dataset, DataLoader
+
+                >>> class RandomDataset(Dataset):
+                ...     def __getitem__(self, idx):
+                ...         return np.array([idx]).astype('int64')
+                ...
+                ...     def __len__(self):
+                ...         return 10
+                ...
+                >>> loader = DataLoader(RandomDataset(), batch_size=2, shuffle=True)
+                >>> for i, data in enumerate(loader):
+                ...     if i == 2:
+                ...         state = loader.state_dict()
+                ...         break
+                >>> new_loader = DataLoader(RandomDataset(), batch_size=2, shuffle=True)
+                >>> new_loader.load_state_dict(state)
+                >>> print(len(list(new_loader)))
+                2
+        """
+        iterator = (
+            self._last_iterator() if self._last_iterator is not None else None
+        )
+        if iterator is not None:
+            num_yielded = iterator._num_yielded
+            base_seed = getattr(iterator, '_base_seed', None)
+        else:
+            num_yielded = self._resume_num_yielded
+            base_seed = self._resume_base_seed
+
+        state = {'num_yielded': num_yielded, 'base_seed': base_seed}
+        if self.auto_collate_batch and hasattr(
+            self.batch_sampler, 'state_dict'
+        ):
+            sampler_state = self.batch_sampler.state_dict()
+            # batch sampler may generate batches prefetched by DataLoader,
+            # only batches returned are consumed
+            sampler_state['num_batches'] = num_yielded
+            state['batch_sampler'] = sampler_state
+        return state
+
+    def load_state_dict(self, state_dict):
+        """
+        Load the iteration state got from :code:`state_dict`, the next
+        iteration of the DataLoader will start from the batch following the
+        last returned batch when the state is got.
+
+        Args:
+            state_dict(dict): the iteration state of the DataLoader.
+        """
+        if 'batch_sampler' not in state_dict:
+            raise ValueError(
+                "Only DataLoader with batch_sampler supports resuming "
+                "iteration from a state"
+            )
+        if not hasattr(self.batch_sampler, 'load_state_dict'):
+            raise ValueError(
+                f"batch_sampler {type(self.batch_sampler)} does not support "
+                "load_state_dict"
+            )
+        self.batch_sampler.load_state_dict(state_dict['batch_sampler'])
+        self._resume_num_yielded = state_dict.get('num_yielded', 0)
+        self._resume_base_seed = state_dict.get('base_seed', None)
+        self._last_iterator = None
+
+    def pipeline_stats(self):
+        """
+        Get the stall time statistics of each stage of the data loading
+        pipeline, accumulated among all epochs. Stall time is only recorded
+        if ``pipeline_stats`` is enabled by :code:`set_prefetch_config`
+        before the DataLoader is created, otherwise all counts are 0.
+        Stages are:
+
+        - ``fetch``: reader thread waiting for batch from dataset or workers.
+        - ``push``: reader thread blocking on pushing batch to buffered reader.
+        - ``restore``: prefetch stage waiting for batch from buffered reader.
+        - ``output``: training loop waiting for batch from prefetch stage.
+
+        Returns:
+            dict: mapping stage name to a dict of ``count``, ``stall_time``
+                and ``avg_stall_time`` (in seconds).
+        """
+        return self._prefetch_stats.summary()
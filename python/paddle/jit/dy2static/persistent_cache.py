@@ -0,0 +1,288 @@
+# Copyright (c) 2024 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import hashlib
+import os
+import pickle
+
+import paddle
+from paddle.base import core, framework
+from paddle.base.dygraph.base import switch_to_static_graph
+from paddle.framework import use_pir_api
+from paddle.utils import map_structure
+from paddle.utils.environments import StringEnvironmentVariable
+
+from . import logging_utils
+from .function_spec import get_buffers, get_parameters
+
+__all__ = []
+
+# The directory of the persistent program cache, the persistent program cache
+# is disabled if it is empty. Only the programs of the functions with a key
+# set by set_persistent_cache_key are saved to the persistent program cache.
+ENV_PERSISTENT_CACHE_DIR = StringEnvironmentVariable(
+    "JIT_PERSISTENT_CACHE_DIR", ""
+)
+
+# The attribute of a function to specify its identity in the persistent cache
+# key, such as the functions generated by SOT.
+PERSISTENT_CACHE_KEY_ATTR = "__jst_persistent_cache_key"
+
+_PERSISTENT_CACHE_SUFFIX = ".pdcache"
+
+
+class _VariableRef:
+    def __init__(self, name):
+        self.name = name
+
+
+class _ClassInstanceRef:
+    pass
+
+
+def set_persistent_cache_key(function, key):
+    """
+    Opt in the function to the persistent program cache with the key. The
+    program of the function traced by ``paddle.jit.to_static`` is saved to
+    and loaded from the directory of ``JIT_PERSISTENT_CACHE_DIR``.
+
+    NOTE: The key is the version of the function, it should be changed once
+    the behavior of the function changes, including the code of the function,
+    the sublayers and the functions it calls, and the attributes and configs
+    it depends on, which are not detected by the persistent program cache.
+
+    Args:
+        function (callable): The function, or the ``forward`` of a Layer.
+        key (str): The version of the function.
+    """
+    if not isinstance(key, str):
+        raise TypeError(
+            f"The persistent cache key should be str, but got {type(key)}."
+        )
+    function = getattr(function, "__func__", function)
+    setattr(function, PERSISTENT_CACHE_KEY_ATTR, key)
+
+
+def _function_fingerprint(function):
+    """
+    Returns the identity of the function in the persistent cache key, or None
+    if the function is not opted in to the persistent cache.
+    """
+    function = getattr(function, "__func__", function)
+    key = getattr(function, PERSISTENT_CACHE_KEY_ATTR, None)
+    if key is None:
+        return None
+    return "{}.{}:{}".format(
+        getattr(function, "__module__", None),
+        getattr(function, "__qualname__", None),
+        key,
+    )
+
+
+def _is_stable_value(value):
+    """
+    Whether the value has the same repr across processes.
+    """
+    if value is None or isinstance(
+        value, (bool, int, float, str, paddle.static.InputSpec)
+    ):
+        return True
+    if isinstance(value, (list, tuple)):
+        return all(_is_stable_value(v) for v in value)
+    if isinstance(value, dict):
+        return all(
+            isinstance(k, str) and _is_stable_value(v) for k, v in value.items()
+        )
+    return False
+
+
+def persistent_cache_key(cache_key):
+    """
+    Returns the key of the CacheKey in the persistent cache, which consists of
+    the key of the function, the input specs, the build options and the
+    version of Paddle, or None if the program is not persistable.
+    """
+    if not ENV_PERSISTENT_CACHE_DIR.get() or use_pir_api():
+        return None
+    fingerprint = _function_fingerprint(
+        cache_key.function_spec.dygraph_function
+    )
+    if fingerprint is None:
+        return None
+
+    specs = [
+        cache_key.input_args_with_spec,
+        cache_key.input_kwargs_with_spec,
+        cache_key._spec_names_id,
+        cache_key._pir_flags,
+        cache_key.kwargs.get("is_train", False),
+        cache_key.kwargs.get("with_hook", False),
+        cache_key.kwargs.get("backend", None),
+        cache_key.kwargs["build_strategy"].build_cinn_pass,
+    ]
+    if not _is_stable_value(specs):
+        return None
+
+    class_instance = cache_key.class_instance
+    tracer = framework._dygraph_tracer()
+    components = [
+        paddle.version.full_version,
+        paddle.version.commit,
+        fingerprint,
+        (
+            f"{type(class_instance).__module__}.{type(class_instance).__qualname__}"
+            if class_instance is not None
+            else ""
+        ),
+        repr(specs),
+        (f"{tracer._amp_level}, {tracer._amp_dtype}" if tracer else repr(None)),
+    ]
+    key = "\n".join(components)
+    return hashlib.sha256(key.encode("utf-8")).hexdigest()
+
+
+def _cache_file(key):
+    return os.path.join(
+        ENV_PERSISTENT_CACHE_DIR.get(), key + _PERSISTENT_CACHE_SUFFIX
+    )
+
+
+def save_concrete_program(cache_key, concrete_program):
+    """
+    Saves the serialized main program of ConcreteProgram to the persistent
+    cache, the inputs, outputs and parameters are saved by variable names.
+    """
+    key = persistent_cache_key(cache_key)
+    if key is None:
+        return
+    main_program = concrete_program.main_program
+    if hasattr(main_program, "lr_scheduler"):
+        return
+
+    def encode(obj):
+        if isinstance(obj, framework.Variable):
+            return _VariableRef(obj.name)
+        if (
+            cache_key.class_instance is not None
+            and obj is cache_key.class_instance
+        ):
+            return _ClassInstanceRef()
+        return obj
+
+    try:
+        payload = pickle.dumps(
+            {
+                "main_program": main_program.desc.serialize_to_string(),
+                "random_seed": main_program.random_seed,
+                "inputs": map_structure(encode, concrete_program.inputs),
+                "outputs": map_structure(encode, concrete_program.outputs),
+                "parameters": [p.name for p in concrete_program.parameters],
+            },
+            protocol=4,
+        )
+        os.makedirs(ENV_PERSISTENT_CACHE_DIR.get(), exist_ok=True)
+        path = _cache_file(key)
+        tmp_path = f"{path}.tmp.{os.getpid()}"
+        with open(tmp_path, "wb") as f:
+            f.write(payload)
+        os.replace(tmp_path, path)
+    except Exception as e:
+        logging_utils.warn(
+            f"Failed to save program of {cache_key} to persistent cache: {e}"
+        )
+
+
+def load_concrete_program(cache_key):
+    """
+    Loads ConcreteProgram from the persistent cache, returns None if missed or
+    the parameters of the program can not be found in the class instance.
+    """
+    key = persistent_cache_key(cache_key)
+    if key is None or not os.path.exists(_cache_file(key)):
+        return None
+    try:
+        with open(_cache_file(key), "rb") as f:
+            payload = pickle.load(f)
+    except Exception as e:
+        logging_utils.warn(
+            f"Failed to load program of {cache_key} from persistent cache: {e}"
+        )
+        return None
+
+    params = get_parameters(cache_key.class_instance, True)
+    buffers = get_buffers(cache_key.class_instance, True)
+    parameters = []
+    for name in payload["parameters"]:
+        if name in params:
+            parameters.append(params[name])
+        elif name in buffers:
+            parameters.append(buffers[name])
+        else:
+            return None
+
+    concrete_program = _restore_concrete_program(cache_key, payload, parameters)
+    if concrete_program is not None:
+        logging_utils.log(
+            1, f"Load program of {cache_key} from persistent cache {key}."
+        )
+    return concrete_program
+
+
+@switch_to_static_graph
+def _restore_concrete_program(cache_key, payload, parameters):
+    from .program_translator import ConcreteProgram
+
+    main_program = framework.Program.parse_from_string(payload["main_program"])
+    main_program.random_seed = payload["random_seed"]
+    block = main_program.global_block()
+    # NOTE: the parameter info is lost after serialization, restore it from
+    # the parameters of the class instance as Block._copy_param_info_from does.
+    for param in parameters:
+        var = block.vars.get(param.name, None)
+        if var is None or list(var.shape) != list(param.shape):
+            return None
+        if isinstance(param, framework.EagerParamBase):
+            block.vars[param.name] = framework.Parameter(
+                block=block,
+                shape=var.shape,
+                dtype=var.dtype,
+                type=var.type,
+                lod_level=var.lod_level
+                if var.type == core.VarDesc.VarType.LOD_TENSOR
+                else None,
+                trainable=param.trainable,
+                optimize_attr=param.optimize_attr,
+                regularizer=param.regularizer,
+                need_clip=param.need_clip,
+                name=var.name,
+            )
+
+    def decode(obj):
+        if isinstance(obj, _VariableRef):
+            return block.var(obj.name)
+        if isinstance(obj, _ClassInstanceRef):
+            return cache_key.class_instance
+        return obj
+
+    return ConcreteProgram(
+        inputs=map_structure(decode, payload["inputs"]),
+        outputs=map_structure(decode, payload["outputs"]),
+        parameters=parameters,
+        function=cache_key.function_spec.dygraph_function,
+        main_program=main_program,
+        startup_program=framework.Program(),
+        **cache_key.kwargs,
+    )
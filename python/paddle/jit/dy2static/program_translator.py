@@ -50,6 +50,7 @@ from .origin_info import (
     update_op_callstack_with_origin_info,
 )
 from .partial_program import PartialProgramLayerHook
+from .persistent_cache import load_concrete_program, save_concrete_program
 from .pir_partial_program import (
     PartialProgramLayerHook as PirPartialProgramLayerHook,
 )
@@ -1559,13 +1560,16 @@ class ProgramCache:
                     **cache_key.kwargs,
                 )
             else:
-                concrete_program = ConcreteProgram.from_func_spec(
-                    func_spec=cache_key.function_spec,
-                    input_spec=cache_key.input_args_with_spec,
-                    input_kwargs_spec=cache_key.input_kwargs_with_spec,
-                    class_instance=cache_key.class_instance,
-                    **cache_key.kwargs,
-                )
+                concrete_program = load_concrete_program(cache_key)
+                if concrete_program is None:
+                    concrete_program = ConcreteProgram.from_func_spec(
+                        func_spec=cache_key.function_spec,
+                        input_spec=cache_key.input_args_with_spec,
+                        input_kwargs_spec=cache_key.input_kwargs_with_spec,
+                        class_instance=cache_key.class_instance,
+                        **cache_key.kwargs,
+                    )
+                    save_concrete_program(cache_key, concrete_program)
         except Exception as e:
             if enable_fallback:
                 warnings.warn(
@@ -17,11 +17,13 @@ from __future__ import annotations
 import gc
 import traceback
 import types
-from typing import List, Tuple
+from typing import Hashable, List, Tuple
 
 from ...profiler import EventGuard, event_register
 from ...psdb import NO_FALLBACK_CODES
 from ...utils import (
+    ENV_SOT_CACHE_POLICY,
+    ENV_SOT_MAX_CACHE_SIZE,
     BreakGraphError,
     FallbackError,
     InnerError,
@@ -31,7 +33,7 @@ from ...utils import (
     log_do,
 )
 from ..custom_code import CustomCode
-from .guard import Guard
+from .guard import Guard, get_sub_guards
 from .opcode_executor import OpcodeExecutor, OpcodeExecutorBase
 
 GuardedFunction = Tuple[CustomCode, Guard]
@@ -42,23 +44,53 @@ dummy_guard.expr = "lambda frame: True"
 dummy_guard.lambda_expr = "lambda frame: True"
 
 
+class CacheStats:
+    """
+    Hit statistics of the cache entries of a code object.
+
+    Attributes:
+        hits (int): The count of lookups that hit a cache entry.
+        misses (int): The count of lookups that missed all cache entries and triggered a translation.
+        evictions (int): The count of cache entries evicted by LRU policy.
+        fallbacks (int): The count of lookups that fell back to eager because the cache is full.
+    """
+
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.fallbacks = 0
+
+    def __repr__(self):
+        return (
+            f"CacheStats(hits={self.hits}, misses={self.misses}, "
+            f"evictions={self.evictions}, fallbacks={self.fallbacks})"
+        )
+
+
 @Singleton
 class OpcodeExecutorCache:
     """
     A singleton class that implements a cache for translated instructions.
     This cache is used to store previously translated instructions along with their corresponding guard functions.
 
+    The guarded functions of a code object are kept in most recently used order. When the number of them
+    reaches ``SOT_MAX_CACHE_SIZE``, the least recently used one is evicted if ``SOT_CACHE_POLICY`` is "lru",
+    or the code object falls back to eager if it is "fallback".
+
     Attributes:
         cache (dict): A dictionary that maps code objects to tuples of a cache getter function and a list of guarded functions.
+        stats (dict): A dictionary that maps code objects to their CacheStats.
         translate_count (int): The count of how many instructions have been translated. It is used to test whether the cache hits.
     """
 
-    MAX_CACHE_SIZE = 20
     cache: dict[types.CodeType, GuardedFunctions]
+    stats: dict[types.CodeType, CacheStats]
     translate_count: int
 
     def __init__(self):
         self.cache = {}
+        self.stats = {}
         self.translate_count = 0
 
     def clear(self):
@@ -66,6 +98,7 @@ class OpcodeExecutorCache:
         Clears the cache and resets the translate count.
         """
         self.cache.clear()
+        self.stats.clear()
         self.translate_count = 0
 
     def __call__(self, frame: types.FrameType, **kwargs) -> CustomCode:
@@ -74,10 +107,45 @@ class OpcodeExecutorCache:
             log(2, f"[Cache]: Firstly call {code}\n")
             new_custom_code, guard_fn = self.translate(frame, **kwargs)
             self.cache[code] = [(new_custom_code, guard_fn)]
+            self.stats[code] = CacheStats()
+            self.stats[code].misses += 1
             return new_custom_code
         guarded_fns = self.cache[code]
         return self.lookup(frame, guarded_fns, **kwargs)
 
+    @staticmethod
+    def check_guard(
+        guard_fn: Guard,
+        frame: types.FrameType,
+        sub_guard_results: dict[Hashable, bool],
+    ) -> bool:
+        """
+        Checks the guard function by its sub guards. The result of each sub guard is recorded in
+        sub_guard_results, so that the same sub guard shared by the guard functions of other
+        cache entries is evaluated only once in a lookup.
+
+        Args:
+            guard_fn (Guard): The guard function to be checked.
+            frame (types.FrameType): The frame to be checked.
+            sub_guard_results (dict[Hashable, bool]): The results of sub guards evaluated in this lookup.
+
+        Returns:
+            bool: Whether the guard function is passed.
+        """
+        sub_guards = get_sub_guards(guard_fn)
+        if sub_guards is None:
+            return guard_fn(frame)
+        for key, sub_guard in sub_guards:
+            result = sub_guard_results.get(key)
+            if result is None:
+                # the error of a sub guard is raised to the caller, the same
+                # as the error of the guard function
+                result = bool(sub_guard(frame))
+                sub_guard_results[key] = result
+            if not result:
+                return False
+        return True
+
     @event_register("lookup")
     def lookup(
         self, frame: types.FrameType, guarded_fns: GuardedFunctions, **kwargs
@@ -92,20 +160,33 @@ class OpcodeExecutorCache:
         Returns:
             CustomCode | None: The custom code object if a matching guard function is found, otherwise None.
         """
+        stats = self.stats.setdefault(frame.f_code, CacheStats())
+        # results of the sub guards shared among guarded functions
+        sub_guard_results = {}
 
-        if len(guarded_fns) >= self.MAX_CACHE_SIZE:
-            log(2, "[Cache]: Exceed max cache size, skip it\n")
-            return CustomCode(None, False)
-
-        for custom_code, guard_fn in guarded_fns:
+        for index, (custom_code, guard_fn) in enumerate(guarded_fns):
+            # the most recently used entry is checked by its fused guard
+            # function for the fast path of cache hit, so is the last entry
+            # if there is no result of sub guards to share
+            use_sub_guards = index > 0 and (
+                sub_guard_results or index < len(guarded_fns) - 1
+            )
             try:
                 with EventGuard("try guard"):
-                    guard_result = guard_fn(frame)
+                    if use_sub_guards:
+                        guard_result = self.check_guard(
+                            guard_fn, frame, sub_guard_results
+                        )
+                    else:
+                        guard_result = guard_fn(frame)
                 if guard_result:
                     log(
                         2,
                         f"[Cache]: Cache hit, Guard is \n{getattr(guard_fn, 'expr', 'None')}\n",
                     )
+                    if index > 0:
+                        guarded_fns.insert(0, guarded_fns.pop(index))
+                    stats.hits += 1
                     return custom_code
                 else:
                     log_do(
@@ -125,8 +206,20 @@ class OpcodeExecutorCache:
                 continue
 
         log(2, "[Cache]: all guards missed\n")
+        if len(guarded_fns) >= ENV_SOT_MAX_CACHE_SIZE.get():
+            if ENV_SOT_CACHE_POLICY.get() == "fallback":
+                log(2, "[Cache]: Exceed max cache size, skip it\n")
+                stats.fallbacks += 1
+                return CustomCode(None, False)
+            log(
+                2,
+                "[Cache]: Exceed max cache size, evict the least recently used one\n",
+            )
+            guarded_fns.pop()
+            stats.evictions += 1
+        stats.misses += 1
         new_custom_code, guard_fn = self.translate(frame, **kwargs)
-        guarded_fns.append((new_custom_code, guard_fn))
+        guarded_fns.insert(0, (new_custom_code, guard_fn))
         return new_custom_code
 
     def translate(
@@ -14,15 +14,18 @@
 
 from __future__ import annotations
 
+import re
 import types
 import weakref
-from typing import TYPE_CHECKING, Any, Callable, TypeVar
+from typing import TYPE_CHECKING, Any, Callable, Hashable, TypeVar
 
 from ...profiler import EventGuard
 from ...utils import InnerError, current_tmp_name_records, log, log_do
 
 Guard = Callable[[types.FrameType], bool]
 
+TMP_NAME_PATTERN = re.compile(r"\b_sot_tmp_\d+\b")
+
 if TYPE_CHECKING:
     from .variables import VariableBase
 
@@ -122,11 +125,82 @@ def make_guard(stringify_guards: list[StringifyExpression]) -> Guard:
         log(3, f"[Guard]: {lambda_string}\n")
         guard.lambda_expr = lambda_string
         guard.expr = func_string
+        # NOTE: the sub guards are only used if the code object has more than
+        # one cache entry, so they are made lazily by get_sub_guards.
+        guard.stringify_guards = stringify_guards
+        guard.tmp_names = dict(current_tmp_name_records().tmp_names_record)
         assert callable(guard), "guard must be callable."
 
         return guard
 
 
+def make_sub_guards(
+    stringify_guards: list[StringifyExpression],
+    tmp_names: dict[str, str],
+) -> list[tuple[Hashable, Guard]]:
+    """
+    Make a sub guard for each StringifyExpression, keyed by its expression and
+    the identities of its free variables. The sub guards with the same key are
+    always evaluated to the same result for a frame, so they can be shared
+    among the guards of different cache entries. Each sub guard assigns the
+    tmp variables it depends on, so the common subexpressions in it are
+    evaluated only once.
+
+    Args:
+        stringify_guards: a list of StringifyExpression.
+        tmp_names: the map from the expressions to their tmp variable names.
+    """
+    tmp_exprs = {name: expr for expr, name in tmp_names.items()}
+    free_vars = {}
+    func_string = ""
+    for i, str_expr in enumerate(stringify_guards):
+        used_names = {str_expr.expr}
+        for name in reversed(tmp_exprs):
+            if name in used_names:
+                used_names.update(TMP_NAME_PATTERN.findall(tmp_exprs[name]))
+        func_string += f"def sub_guard_{i}(frame):\n"
+        for name, expr in tmp_exprs.items():
+            if name in used_names:
+                func_string += f"    {name} = {expr}\n"
+        func_string += f"    return {str_expr.expr}\n"
+        free_vars = union_free_vars(free_vars, str_expr.free_vars)
+    exec(func_string, free_vars)
+
+    keys = [
+        (
+            str_expr.debug_expr,
+            tuple(
+                sorted(
+                    (name, id(value))
+                    for name, value in str_expr.free_vars.items()
+                )
+            ),
+        )
+        for str_expr in stringify_guards
+    ]
+    return list(
+        zip(
+            keys,
+            [free_vars[f"sub_guard_{i}"] for i in range(len(stringify_guards))],
+        )
+    )
+
+
+def get_sub_guards(guard: Guard) -> list[tuple[Hashable, Guard]] | None:
+    """
+    Get the sub guards of a guard made by make_guard, they are made at the
+    first call. Return None if the guard has no sub guards.
+
+    Args:
+        guard: the guard made by make_guard.
+    """
+    sub_guards = getattr(guard, "sub_guards", None)
+    if sub_guards is None and hasattr(guard, "stringify_guards"):
+        sub_guards = make_sub_guards(guard.stringify_guards, guard.tmp_names)
+        guard.sub_guards = sub_guards
+    return sub_guards
+
+
 def support_weak_ref(obj):
     if isinstance(obj, types.FunctionType):
         return True
@@ -21,6 +21,7 @@ import paddle
 from paddle.amp.auto_cast import amp_state
 from paddle.base.data_feeder import convert_dtype
 from paddle.framework import _dygraph_tracer
+from paddle.jit.dy2static.persistent_cache import PERSISTENT_CACHE_KEY_ATTR
 
 from ..profiler import EventGuard
 from ..utils import (
@@ -168,9 +169,16 @@ class CompileSIRCache(Cache):
         """
         build_strategy = kwargs.get("build_strategy", None)
         backend = kwargs.get("backend", None)
+        static_fn = compile_sir(context, sir_name)
+        # identify the compiled function by SIR in the persistent program cache
+        setattr(
+            static_fn,
+            PERSISTENT_CACHE_KEY_ATTR,
+            f"SIR:{context.get_sir(sir_name)}",
+        )
         return FallbackWrapper(
             paddle.jit.to_static(
-                compile_sir(context, sir_name),
+                static_fn,
                 build_strategy=build_strategy,
                 backend=backend,
                 full_graph=True,
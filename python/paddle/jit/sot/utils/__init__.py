@@ -17,7 +17,9 @@ from .envs import (  # noqa: F401
     ENV_COST_MODEL,
     ENV_MIN_GRAPH_SIZE,
     ENV_SHOW_TRACKERS,
+    ENV_SOT_CACHE_POLICY,
     ENV_SOT_LOG_LEVEL,
+    ENV_SOT_MAX_CACHE_SIZE,
     ENV_STRICT_MODE,
     cost_model_guard,
     min_graph_size_guard,
@@ -29,6 +29,10 @@ ENV_SOT_LOG_LEVEL = IntegerEnvironmentVariable("SOT_LOG_LEVEL", 0)
 ENV_STRICT_MODE = BooleanEnvironmentVariable("STRICT_MODE", False)
 ENV_SHOW_TRACKERS = StringEnvironmentVariable("SHOW_TRACKERS", "")
 ENV_CLEAN_CODE = BooleanEnvironmentVariable("CLEAN_CODE", False)
+ENV_SOT_MAX_CACHE_SIZE = IntegerEnvironmentVariable("SOT_MAX_CACHE_SIZE", 20)
+# policy when the cache entries of a code object exceed SOT_MAX_CACHE_SIZE,
+# "lru" evicts the least recently used entry, "fallback" falls back to eager
+ENV_SOT_CACHE_POLICY = StringEnvironmentVariable("SOT_CACHE_POLICY", "lru")
 
 
 @contextmanager
@@ -31,6 +31,17 @@ def _is_numpy_(var):
     return isinstance(var, (np.ndarray, np.generic))
 
 
+def _is_tensor_(var):
+    return isinstance(var, (paddle.Tensor, paddle.base.core.eager.Tensor))
+
+
+def _round_half_to_even(x):
+    # paddle.round rounds half away from zero, while numpy.rint rounds half
+    # to even.
+    tie = paddle.abs(x - paddle.trunc(x)) == 0.5
+    return paddle.where(tie, 2.0 * paddle.round(x / 2.0), paddle.round(x))
+
+
 class Metric(metaclass=abc.ABCMeta):
     r"""
     Base class for metric, encapsulates metric logic and APIs
@@ -189,6 +200,11 @@ class Accuracy(Metric):
             for computing accuracy. Default is (1,).
         name (str, optional): String name of the metric instance. Default
             is `acc`.
+        accumulate_on_device (bool, optional): Whether to keep the metric
+            states as Tensors on the device of the inputs in dynamic graph
+            mode. If True, `update` accumulates the states with Tensor
+            operations and returns Tensors without synchronizing with the
+            host, which only happens in `accumulate`. Default is False.
 
     Examples:
         .. code-block:: python
@@ -236,10 +252,18 @@ class Accuracy(Metric):
 
     """
 
-    def __init__(self, topk=(1,), name=None, *args, **kwargs):
+    def __init__(
+        self,
+        topk=(1,),
+        name=None,
+        accumulate_on_device=False,
+        *args,
+        **kwargs,
+    ):
         super().__init__(*args, **kwargs)
         self.topk = topk
         self.maxk = max(topk)
+        self._accumulate_on_device = accumulate_on_device
         self._init_name(name)
         self.reset()
 
@@ -284,8 +308,16 @@ class Accuracy(Metric):
             correct: Correct mask, a tensor with shape [batch_size, d0, ..., topk].
 
         Return:
-            Tensor: the accuracy of current step.
+            float|Tensor: the accuracy of current step, which is a Tensor
+            if `accumulate_on_device` is True.
         """
+        if (
+            self._accumulate_on_device
+            and in_dynamic_mode()
+            and _is_tensor_(correct)
+        ):
+            return self._update_on_device(correct)
+
         if isinstance(correct, (paddle.Tensor, paddle.base.core.eager.Tensor)):
             correct = np.array(correct)
         num_samples = np.prod(np.array(correct.shape[:-1]))
@@ -298,6 +330,25 @@ class Accuracy(Metric):
         accs = accs[0] if len(self.topk) == 1 else accs
         return accs
 
+    def _update_on_device(self, correct):
+        num_samples = int(np.prod(correct.shape[:-1]))
+        # num_corrects[k - 1] is the number of correct instances in top-k
+        num_corrects = paddle.cumsum(
+            paddle.cast(correct, 'int64')
+            .reshape([-1, correct.shape[-1]])
+            .sum(axis=0),
+            axis=0,
+        )
+        accs = []
+        for i, k in enumerate(self.topk):
+            self.total[i] = self.total[i] + num_corrects[k - 1]
+            self.count[i] += num_samples
+            accs.append(
+                paddle.cast(num_corrects[k - 1], 'float32') / num_samples
+            )
+        accs = accs[0] if len(self.topk) == 1 else accs
+        return accs
+
     def reset(self):
         """
         Resets all of the metric state.
@@ -342,6 +393,11 @@ class Precision(Metric):
     Args:
         name (str, optional): String name of the metric instance.
             Default is `precision`.
+        accumulate_on_device (bool, optional): Whether to keep the metric
+            states as Tensors on the device of the inputs in dynamic graph
+            mode. If True, `update` accumulates the states with Tensor
+            operations without synchronizing with the host, which only
+            happens in `accumulate`. Default is False.
 
     Examples:
         .. code-block:: python
@@ -395,11 +451,14 @@ class Precision(Metric):
             >>> model.fit(data, batch_size=16)
     """
 
-    def __init__(self, name='precision', *args, **kwargs):
+    def __init__(
+        self, name='precision', accumulate_on_device=False, *args, **kwargs
+    ):
         super().__init__(*args, **kwargs)
         self.tp = 0  # true positive
         self.fp = 0  # false positive
         self._name = name
+        self._accumulate_on_device = accumulate_on_device
 
     def update(self, preds, labels):
         """
@@ -413,6 +472,23 @@ class Precision(Metric):
                 the shape should keep the same as preds.
                 The data type is 'int32' or 'int64'.
         """
+        if (
+            self._accumulate_on_device
+            and in_dynamic_mode()
+            and _is_tensor_(preds)
+            and _is_tensor_(labels)
+        ):
+            preds = paddle.floor(preds + 0.5).reshape([-1])
+            labels = paddle.cast(labels, preds.dtype).reshape([-1])
+            positive = preds == 1
+            self.tp = self.tp + paddle.sum(
+                paddle.cast(positive & (preds == labels), 'int64')
+            )
+            self.fp = self.fp + paddle.sum(
+                paddle.cast(positive & (preds != labels), 'int64')
+            )
+            return
+
         if isinstance(preds, (paddle.Tensor, paddle.base.core.eager.Tensor)):
             preds = np.array(preds)
         elif not _is_numpy_(preds):
@@ -423,17 +499,11 @@ class Precision(Metric):
         elif not _is_numpy_(labels):
             raise ValueError("The 'labels' must be a numpy ndarray or Tensor.")
 
-        sample_num = labels.shape[0]
-        preds = np.floor(preds + 0.5).astype("int32")
-
-        for i in range(sample_num):
-            pred = preds[i]
-            label = labels[i]
-            if pred == 1:
-                if pred == label:
-                    self.tp += 1
-                else:
-                    self.fp += 1
+        preds = np.floor(preds + 0.5).astype("int32").reshape(-1)
+        labels = labels.reshape(-1)
+        positive = preds == 1
+        self.tp += int(np.sum(positive & (preds == labels)))
+        self.fp += int(np.sum(positive & (preds != labels)))
 
     def reset(self):
         """
@@ -449,8 +519,9 @@ class Precision(Metric):
         Returns:
             A scaler float: results of the calculated precision.
         """
-        ap = self.tp + self.fp
-        return float(self.tp) / ap if ap != 0 else 0.0
+        tp, fp = float(self.tp), float(self.fp)
+        ap = tp + fp
+        return tp / ap if ap != 0 else 0.0
 
     def name(self):
         """
@@ -474,6 +545,11 @@ class Recall(Metric):
     Args:
         name (str, optional): String name of the metric instance.
             Default is `recall`.
+        accumulate_on_device (bool, optional): Whether to keep the metric
+            states as Tensors on the device of the inputs in dynamic graph
+            mode. If True, `update` accumulates the states with Tensor
+            operations without synchronizing with the host, which only
+            happens in `accumulate`. Default is False.
 
     Examples:
         .. code-block:: python
@@ -527,11 +603,14 @@ class Recall(Metric):
             >>> model.fit(data, batch_size=16)
     """
 
-    def __init__(self, name='recall', *args, **kwargs):
+    def __init__(
+        self, name='recall', accumulate_on_device=False, *args, **kwargs
+    ):
         super().__init__(*args, **kwargs)
         self.tp = 0  # true positive
         self.fn = 0  # false negative
         self._name = name
+        self._accumulate_on_device = accumulate_on_device
 
     def update(self, preds, labels):
         """
@@ -545,6 +624,23 @@ class Recall(Metric):
                 the shape should keep the same as preds.
                 Shape: [batch_size, 1], Dtype: 'int32' or 'int64'.
         """
+        if (
+            self._accumulate_on_device
+            and in_dynamic_mode()
+            and _is_tensor_(preds)
+            and _is_tensor_(labels)
+        ):
+            preds = _round_half_to_even(preds).reshape([-1])
+            labels = paddle.cast(labels, preds.dtype).reshape([-1])
+            positive = labels == 1
+            self.tp = self.tp + paddle.sum(
+                paddle.cast(positive & (preds == labels), 'int64')
+            )
+            self.fn = self.fn + paddle.sum(
+                paddle.cast(positive & (preds != labels), 'int64')
+            )
+            return
+
         if isinstance(preds, (paddle.Tensor, paddle.base.core.eager.Tensor)):
             preds = np.array(preds)
         elif not _is_numpy_(preds):
@@ -555,17 +651,11 @@ class Recall(Metric):
         elif not _is_numpy_(labels):
             raise ValueError("The 'labels' must be a numpy ndarray or Tensor.")
 
-        sample_num = labels.shape[0]
-        preds = np.rint(preds).astype("int32")
-
-        for i in range(sample_num):
-            pred = preds[i]
-            label = labels[i]
-            if label == 1:
-                if pred == label:
-                    self.tp += 1
-                else:
-                    self.fn += 1
+        preds = np.rint(preds).astype("int32").reshape(-1)
+        labels = labels.reshape(-1)
+        positive = labels == 1
+        self.tp += int(np.sum(positive & (preds == labels)))
+        self.fn += int(np.sum(positive & (preds != labels)))
 
     def accumulate(self):
         """
@@ -574,8 +664,9 @@ class Recall(Metric):
         Returns:
             A scaler float: results of the calculated Recall.
         """
-        recall = self.tp + self.fn
-        return float(self.tp) / recall if recall != 0 else 0.0
+        tp, fn = float(self.tp), float(self.fn)
+        recall = tp + fn
+        return tp / recall if recall != 0 else 0.0
 
     def reset(self):
         """
@@ -595,7 +686,9 @@ class Auc(Metric):
     """
     The auc metric is for binary classification.
     Refer to https://en.wikipedia.org/wiki/Receiver_operating_characteristic#Area_under_the_curve.
-    Please notice that the auc metric is implemented with python, which may be a little bit slow.
+    The predictions are counted into `num_thresholds + 1` buckets with
+    vectorized numpy ops, and the statistics of several Auc metrics (e.g. the
+    metrics of different ranks) can be combined by :code:`merge`.
 
     The `auc` function creates four local variables, `true_positives`,
     `true_negatives`, `false_positives` and `false_negatives` that are used to
@@ -610,12 +703,9 @@ class Auc(Metric):
             'ROC' or 'PR' for the Precision-Recall-curve. Default is 'ROC'.
         num_thresholds (int): The number of thresholds to use when
             discretizing the roc curve. Default is 4095.
-            'ROC' or 'PR' for the Precision-Recall-curve. Default is 'ROC'.
         name (str, optional): String name of the metric instance. Default
             is `auc`.
 
-    "NOTE: only implement the ROC curve type via Python now."
-
     Examples:
         .. code-block:: python
             :name: code-standalone-example
@@ -706,14 +796,37 @@ class Auc(Metric):
         elif not _is_numpy_(preds):
             raise ValueError("The 'preds' must be a numpy ndarray or Tensor.")
 
-        for i, lbl in enumerate(labels):
-            value = preds[i, 1]
-            bin_idx = int(value * self._num_thresholds)
-            assert bin_idx <= self._num_thresholds
-            if lbl:
-                self._stat_pos[bin_idx] += 1.0
-            else:
-                self._stat_neg[bin_idx] += 1.0
+        labels = labels.reshape(-1) != 0
+        bin_idx = (preds[:, 1] * self._num_thresholds).astype('int64')
+        assert np.all(bin_idx <= self._num_thresholds)
+
+        _num_pred_buckets = self._num_thresholds + 1
+        self._stat_pos += np.bincount(
+            bin_idx[labels], minlength=_num_pred_buckets
+        )
+        self._stat_neg += np.bincount(
+            bin_idx[~labels], minlength=_num_pred_buckets
+        )
+
+    def merge(self, other):
+        """
+        Merge the statistics of another Auc metric into this one, which can
+        be used to reduce the metrics updated on different ranks.
+
+        Args:
+            other (Auc): The Auc metric with the same `num_thresholds`.
+        """
+        if not isinstance(other, Auc):
+            raise TypeError(
+                f"The 'other' must be an Auc metric, but got {type(other)}."
+            )
+        if other._num_thresholds != self._num_thresholds:
+            raise ValueError(
+                "Can not merge Auc metrics with different num_thresholds, "
+                f"{self._num_thresholds} vs {other._num_thresholds}."
+            )
+        self._stat_pos += other._stat_pos
+        self._stat_neg += other._stat_neg
 
     @staticmethod
     def trapezoid_area(x1, x2, y1, y2):
@@ -726,24 +839,36 @@ class Auc(Metric):
         Return:
             float: the area under auc curve
         """
-        tot_pos = 0.0
-        tot_neg = 0.0
-        auc = 0.0
-
-        idx = self._num_thresholds
-        while idx >= 0:
-            tot_pos_prev = tot_pos
-            tot_neg_prev = tot_neg
-            tot_pos += self._stat_pos[idx]
-            tot_neg += self._stat_neg[idx]
-            auc += self.trapezoid_area(
-                tot_neg, tot_neg_prev, tot_pos, tot_pos_prev
+        # Accumulate the buckets from the highest threshold to the lowest.
+        stat_pos = self._stat_pos[::-1]
+        stat_neg = self._stat_neg[::-1]
+        tot_pos = np.cumsum(stat_pos)
+        tot_neg = np.cumsum(stat_neg)
+        tot_pos_prev = tot_pos - stat_pos
+
+        if tot_pos[-1] <= 0.0:
+            return 0.0
+
+        if self._curve == 'PR':
+            # The precision is undefined at the thresholds without any
+            # predictions above them, and is 1 at recall 0 by convention.
+            valid = (tot_pos + tot_neg) > 0
+            recall = np.concatenate([[0.0], tot_pos[valid] / tot_pos[-1]])
+            precision = np.concatenate(
+                [[1.0], tot_pos[valid] / (tot_pos[valid] + tot_neg[valid])]
+            )
+            return float(
+                np.sum(
+                    self.trapezoid_area(
+                        recall[1:], recall[:-1], precision[1:], precision[:-1]
+                    )
+                )
             )
-            idx -= 1
 
-        return (
-            auc / tot_pos / tot_neg if tot_pos > 0.0 and tot_neg > 0.0 else 0.0
-        )
+        if tot_neg[-1] <= 0.0:
+            return 0.0
+        auc = np.sum(stat_neg * (tot_pos + tot_pos_prev) / 2.0)
+        return float(auc / tot_pos[-1] / tot_neg[-1])
 
     def reset(self):
         """
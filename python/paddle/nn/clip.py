@@ -31,6 +31,8 @@ from paddle.framework import (
 )
 from paddle.tensor.layer_function_generator import templatedoc
 
+from .utils.flat_parameters import _get_flat_storage_view
+
 __all__ = []
 
 
@@ -250,6 +252,59 @@ def _squared_l2_norm(x):
     return out
 
 
+def _group_grads_to_clip(params_grads, by_shape=False):
+    """
+    Group the indices of gradients to clip in params_grads by dtype, place
+    and optionally shape. Gradients in a group are clipped through a flat
+    tensor, and the indices of the other gradients are returned separately.
+    """
+    groups = {}
+    others = []
+    for i, (p, g) in enumerate(params_grads):
+        if g is None or getattr(p, 'need_clip', True) is False:
+            continue
+        if g.is_dense() and not g.is_dist():
+            # gradients in the same storage of flatten_parameters are
+            # grouped together to clip through the view of its flat gradient
+            storage = getattr(p, '_flat_parameter_storage', None)
+            key = (g.dtype, str(g.place), id(storage))
+            if by_shape:
+                key += (tuple(g.shape),)
+            groups.setdefault(key, []).append(i)
+        else:
+            others.append(i)
+    return list(groups.values()), others
+
+
+def _flatten_tensors(tensors, params=None):
+    """
+    Copy the tensors into a new flat tensor with one op, the tensors are not
+    changed. If the tensors are the gradients of params, and views of the
+    flat gradient of paddle.nn.utils.flatten_parameters, return the view of
+    the flat gradient instead.
+    """
+    if params is not None:
+        flat = _get_flat_storage_view(params, tensors)
+        if flat is not None:
+            return flat
+    return paddle.concat([t.reshape([-1]) for t in tensors])
+
+
+def _unflatten_tensor(flat, tensors):
+    """
+    Return the views of the flat tensor in the shapes of the tensors.
+    """
+    outs = []
+    offset = 0
+    for t in tensors:
+        numel = t._numel()
+        out = flat._slice(offset, offset + numel)
+        out.get_tensor()._set_dims(t.shape)
+        outs.append(out)
+        offset += numel
+    return outs
+
+
 class BaseErrorClipAttr:
     def __str__(self):
         raise NotImplementedError()
@@ -397,6 +452,8 @@ class ClipGradByValue(ClipGradBase):
         max (float): The maximum value to clip by.
         min (float, optional): The minimum value to clip by. if not set by user, it will be set to ``-max``
             automatically. In this case, ``max`` must be greater than :math:`0`.
+        use_multi_tensor (bool, optional): Whether to clip the gradients of the same dtype through
+            one flat tensor in dynamic graph mode, instead of one by one. Default is False.
 
     Examples:
         .. code-block:: python
@@ -415,26 +472,43 @@ class ClipGradByValue(ClipGradBase):
             >>> sdg.step()
     """
 
-    def __init__(self, max, min=None):
+    def __init__(self, max, min=None, use_multi_tensor=False):
         super().__init__()
         if min is None:
             assert max > 0.0
             min = -max
         self.max = float(max)
         self.min = float(min)
+        self.use_multi_tensor = use_multi_tensor
 
     def __str__(self):
         return f"Clip Gradient By Value, min = {self.min:f}, max={self.max:f}"
 
     @imperative_base.no_grad()
     def _dygraph_clip(self, params_grads):
+        new_grads = {}
+        if self.use_multi_tensor:
+            groups, _ = _group_grads_to_clip(params_grads)
+            for indices in groups:
+                params = [params_grads[i][0] for i in indices]
+                grads = [params_grads[i][1] for i in indices]
+                flat = paddle.clip(
+                    x=_flatten_tensors(grads, params),
+                    min=self.min,
+                    max=self.max,
+                )
+                new_grads.update(zip(indices, _unflatten_tensor(flat, grads)))
+
         params_and_grads = []
-        for p, g in params_grads:
+        for i, (p, g) in enumerate(params_grads):
             if g is None:
                 continue
             if getattr(p, 'need_clip', True) is False:
                 params_and_grads.append((p, g))
                 continue
+            if i in new_grads:
+                params_and_grads.append((p, new_grads[i]))
+                continue
             new_grad = paddle.clip(x=g, min=self.min, max=self.max)
             params_and_grads.append((p, new_grad))
         return params_and_grads
@@ -502,6 +576,8 @@ class ClipGradByNorm(ClipGradBase):
 
     Args:
         clip_norm(float): The maximum norm value.
+        use_multi_tensor (bool, optional): Whether to clip the gradients of the same dtype and shape
+            through one flat tensor in dynamic graph mode, instead of one by one. Default is False.
 
     Examples:
         .. code-block:: python
@@ -520,22 +596,50 @@ class ClipGradByNorm(ClipGradBase):
             >>> sdg.step()
     """
 
-    def __init__(self, clip_norm):
+    def __init__(self, clip_norm, use_multi_tensor=False):
         super().__init__()
         self.clip_norm = float(clip_norm)
+        self.use_multi_tensor = use_multi_tensor
 
     def __str__(self):
         return "Gradient Clip By Norm, clip_norm=%f" % self.clip_norm
 
     @imperative_base.no_grad()
     def _dygraph_clip(self, params_grads):
+        new_grads = {}
+        if self.use_multi_tensor:
+            groups, _ = _group_grads_to_clip(params_grads, by_shape=True)
+            for indices in groups:
+                params = [params_grads[i][0] for i in indices]
+                grads = [params_grads[i][1] for i in indices]
+                if grads[0]._numel() == 0:
+                    continue
+                # each row of the flat tensor is a gradient
+                flat = _flatten_tensors(grads, params).reshape([len(grads), -1])
+                norm = paddle.linalg.norm(
+                    flat
+                    if flat.dtype == paddle.float64
+                    else flat.astype('float32'),
+                    p=2,
+                    axis=1,
+                    keepdim=True,
+                )
+                scale = self.clip_norm / paddle.clip(norm, min=self.clip_norm)
+                flat = paddle.multiply(flat, scale.astype(flat.dtype))
+                new_grads.update(
+                    zip(indices, _unflatten_tensor(flat.reshape([-1]), grads))
+                )
+
         params_and_grads = []
-        for p, g in params_grads:
+        for i, (p, g) in enumerate(params_grads):
             if g is None:
                 continue
             if getattr(p, 'need_clip', True) is False:
                 params_and_grads.append((p, g))
                 continue
+            if i in new_grads:
+                params_and_grads.append((p, new_grads[i]))
+                continue
             new_grad = clip_by_norm(x=g, max_norm=self.clip_norm)
             params_and_grads.append((p, new_grad))
         return params_and_grads
@@ -629,6 +733,9 @@ class ClipGradByGlobalNorm(ClipGradBase):
         clip_norm (float): The maximum norm value.
         group_name (str, optional): The group name for this clip. Default value is ``default_group``.
         auto_skip_clip (bool, optional): skip clipping gradient. Default value is ``False``.
+        use_multi_tensor (bool, optional): Whether to compute the norm of and scale the gradients of
+            the same dtype through one flat tensor in dynamic graph mode, instead of one by one.
+            Default value is ``False``.
 
     Examples:
         .. code-block:: python
@@ -648,13 +755,18 @@ class ClipGradByGlobalNorm(ClipGradBase):
     """
 
     def __init__(
-        self, clip_norm, group_name="default_group", auto_skip_clip=False
+        self,
+        clip_norm,
+        group_name="default_group",
+        auto_skip_clip=False,
+        use_multi_tensor=False,
     ):
         super().__init__()
         self.clip_norm = float(clip_norm)
         self.group_name = group_name
         assert isinstance(auto_skip_clip, bool)
         self.auto_skip_clip = auto_skip_clip
+        self.use_multi_tensor = use_multi_tensor
         # TODO(zhiqiu): Now, in dygraph mode async_add_n is always used.
         # However, in static mode, it is only used in auto_parallel mode
         # by setting self._async_add_n to True. The reason is that there
@@ -673,7 +785,26 @@ class ClipGradByGlobalNorm(ClipGradBase):
         sum_square_list = []
         sum_square_list_fp16 = []
         sum_square_list_fp32 = []
-        for p, g in params_grads:
+        sum_squares = []
+        # (indices, gradients, flat gradient) of the groups of gradients
+        flat_groups = []
+        params_grads_to_norm = params_grads
+        if self.use_multi_tensor and self._pp_mesh is None:
+            groups, others = _group_grads_to_clip(params_grads)
+            for indices in groups:
+                params = [params_grads[i][0] for i in indices]
+                grads = [params_grads[i][1] for i in indices]
+                flat = _flatten_tensors(grads, params)
+                flat_groups.append((indices, grads, flat))
+                # NOTE: the sum of squares of a float16 group may overflow in
+                # float16, so it is computed in float32
+                if flat.dtype in [paddle.float16, paddle.bfloat16]:
+                    sum_squares.append(_squared_l2_norm(flat.astype('float32')))
+                else:
+                    sum_squares.append(_squared_l2_norm(flat))
+            params_grads_to_norm = [params_grads[i] for i in others]
+
+        for p, g in params_grads_to_norm:
             if g is None:
                 continue
             if getattr(p, 'need_clip', True) is False:
@@ -688,7 +819,9 @@ class ClipGradByGlobalNorm(ClipGradBase):
                 merge_grad = merge_selected_rows(g)
                 merge_grad = get_tensor_from_selected_rows(merge_grad)
 
-            sum_square = _squared_l2_norm(merge_grad)
+            sum_squares.append(_squared_l2_norm(merge_grad))
+
+        for sum_square in sum_squares:
             if (
                 sum_square.dtype == core.VarDesc.VarType.FP16
                 or sum_square.dtype == core.VarDesc.VarType.BF16
@@ -787,12 +920,26 @@ class ClipGradByGlobalNorm(ClipGradBase):
             need_clip = True
             clip_var = paddle.divide(x=max_global_norm, y=global_norm_var)
 
-        for p, g in params_grads:
+        new_grads = {}
+        if need_clip:
+            for indices, grads, flat in flat_groups:
+                clip_input = (
+                    clip_var.astype(flat.dtype)
+                    if clip_var.dtype != flat.dtype
+                    else clip_var
+                )
+                flat = paddle.multiply(flat, clip_input)
+                new_grads.update(zip(indices, _unflatten_tensor(flat, grads)))
+
+        for i, (p, g) in enumerate(params_grads):
             if g is None:
                 continue
             if getattr(p, 'need_clip', True) is False:
                 params_and_grads.append((p, g))
                 continue
+            if i in new_grads:
+                params_and_grads.append((p, new_grads[i]))
+                continue
             # TODO(wangxi): use inplace elementwise_mul
             if need_clip:
                 clip_input = (
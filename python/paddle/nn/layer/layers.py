@@ -1378,9 +1378,9 @@ class Layer:
                 >>> linear.clear_gradients()
 
         """
-        for p in self.parameters():
-            if p.trainable:
-                p.clear_gradient()
+        from paddle.nn.utils.flat_parameters import _clear_gradients
+
+        _clear_gradients([p for p in self.parameters() if p.trainable])
 
     def _build_once(self, *args, **kwargs):
         pass
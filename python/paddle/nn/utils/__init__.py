@@ -14,6 +14,7 @@
 
 from .clip_grad_norm_ import clip_grad_norm_
 from .clip_grad_value_ import clip_grad_value_
+from .flat_parameters import flatten_parameters
 from .spectral_norm_hook import spectral_norm
 from .transform_parameters import (
     _stride_column,  # noqa: F401
@@ -30,4 +31,5 @@ __all__ = [
     'vector_to_parameters',
     'clip_grad_norm_',
     'clip_grad_value_',
+    'flatten_parameters',
 ]
@@ -0,0 +1,252 @@
+# Copyright (c) 2024 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import paddle
+from paddle import _legacy_C_ops
+from paddle.base import core, framework
+from paddle.base.framework import dygraph_only
+
+__all__ = []
+
+
+class FlatParameterStorage:
+    """
+    The contiguous storage of parameters with the same dtype and place. The
+    parameters are views of the flat tensor :attr:`param` of the storage, in
+    the order of :attr:`params`, and their gradients are views of the flat
+    tensor :attr:`grad` once they are set to zero.
+
+    It is created by :ref:`api_paddle_nn_utils_flatten_parameters`.
+    """
+
+    def __init__(self, params):
+        self.params = list(params)
+        self._index = {id(p): i for i, p in enumerate(self.params)}
+        self._offsets = [0]
+        for p in self.params:
+            self._offsets.append(self._offsets[-1] + p._numel())
+
+        dtype = self.params[0].dtype
+        with paddle.no_grad():
+            # the flat parameter, whose slices are the parameters
+            self.param = paddle.empty([self._offsets[-1]], dtype=dtype)
+            _legacy_C_ops.coalesce_tensor(
+                self.params,
+                self.params,
+                self.param,
+                "copy_data",
+                True,
+                "use_align",
+                False,
+                "dtype",
+                dtype,
+            )
+            # the flat gradient, whose slices are the gradients
+            self.grad = paddle.zeros([self._offsets[-1]], dtype=dtype)
+            for i, p in enumerate(self.params):
+                if p.grad is not None and p.grad._is_initialized():
+                    self._grad_view(i).copy_(p.grad, False)
+                p._flat_parameter_storage = self
+        self._bind_grads(range(len(self.params)))
+
+    def _grad_view(self, i):
+        grad = self.grad._slice(self._offsets[i], self._offsets[i + 1])
+        grad.get_tensor()._set_dims(self.params[i].shape)
+        return grad
+
+    def _bind_grads(self, indices):
+        # only the parameters which have received gradients are bound, the
+        # gradients of the unused parameters stay None, so that they are not
+        # updated by the optimizer, e.g. by weight decay.
+        # each gradient is a new view, so that releasing the gradient by
+        # Tensor.clear_gradient(False) does not release other views
+        for i in indices:
+            param = self.params[i]
+            if not param.stop_gradient and param.grad is not None:
+                param._copy_gradient_from(self._grad_view(i))
+
+    @paddle.autograd.no_grad()
+    def zero_grad(self):
+        """
+        Set the gradients of all parameters of the storage to zero with one
+        op, the gradients become views of :attr:`grad`. The gradients of the
+        parameters without gradient stay None.
+        """
+        self.grad.zero_()
+        # gradients created by backward, or replaced, e.g. by
+        # Tensor.clear_gradient, become views of the flat gradient
+        self._bind_grads(range(len(self.params)))
+
+    def _view(self, params, grads=None):
+        begin = self._index.get(id(params[0]), None)
+        if begin is None or begin + len(params) > len(self.params):
+            return None
+        end = begin + len(params)
+        for p, member in zip(params, self.params[begin:end]):
+            if p is not member:
+                return None
+        flat = self.param if grads is None else self.grad
+        for tensor in params if grads is None else grads:
+            if tensor is None or not flat._is_shared_buffer_with(tensor):
+                return None
+        return flat._slice(self._offsets[begin], self._offsets[end])
+
+
+def _get_flat_storage_view(params, grads=None):
+    """
+    If params are consecutive parameters of a FlatParameterStorage, return
+    the view of its flat parameter covering params, or the view of its flat
+    gradient if grads of params are given. Return None if params, or grads,
+    are not views of the storage.
+    """
+    if len(params) == 0:
+        return None
+    storage = getattr(params[0], '_flat_parameter_storage', None)
+    if storage is None:
+        return None
+    return storage._view(params, grads)
+
+
+def _split_by_flat_storage(params):
+    """
+    Split params into lists of consecutive parameters of the same
+    FlatParameterStorage, in the order of the storage, and one list of the
+    parameters in no storage.
+    """
+    others = []
+    storages = {}
+    for p in params:
+        storage = getattr(p, '_flat_parameter_storage', None)
+        if storage is None:
+            others.append(p)
+        else:
+            storages.setdefault(id(storage), (storage, []))[1].append(p)
+
+    splits = [others] if others else []
+    for storage, members in storages.values():
+        members.sort(key=lambda p: storage._index[id(p)])
+        split = [members[0]]
+        for p in members[1:]:
+            if storage._index[id(p)] != storage._index[id(split[-1])] + 1:
+                splits.append(split)
+                split = []
+            split.append(p)
+        splits.append(split)
+    return splits
+
+
+def _clear_gradients(params, set_to_zero=True):
+    """
+    Clear the gradients of params. The gradients of the parameters in a
+    FlatParameterStorage are set to zero in place, with one op if all
+    parameters of the storage are in params.
+    """
+    storages = {}
+    for p in params:
+        storage = getattr(p, '_flat_parameter_storage', None)
+        if storage is None:
+            p.clear_gradient(set_to_zero)
+        else:
+            storages.setdefault(id(storage), (storage, []))[1].append(p)
+
+    for storage, members in storages.values():
+        if len(members) == len(storage.params):
+            storage.zero_grad()
+            continue
+        indices = [storage._index[id(p)] for p in members]
+        with paddle.no_grad():
+            for i in indices:
+                storage._grad_view(i).zero_()
+        storage._bind_grads(indices)
+
+
+@dygraph_only
+def flatten_parameters(layer, include_sublayers=True):
+    """
+    Move the parameters of a layer and their gradients into contiguous flat
+    storages, one for each dtype, so that all parameters and all gradients of
+    a dtype are views of one tensor respectively. It only works in dynamic
+    graph mode.
+
+    The gradients of the parameters become views of the flat gradient after
+    they are created by backward and set to zero, and stay views during
+    training. The flat gradient is set to zero with one op by
+    :ref:`api_paddle_optimizer_Optimizer` ``clear_grad`` and
+    :ref:`api_paddle_nn_Layer` ``clear_gradients``. The gradients are always
+    set to zero in place, even if ``set_to_zero`` is False, while the
+    gradients of the parameters never used stay None, so that they are not
+    updated by the optimizer. The optimizers and
+    gradient clips with ``use_multi_tensor=True`` use the flat tensors
+    directly instead of copying the parameters and gradients into flat
+    tensors of their own, and the parameters in ``state_dict`` are the views.
+
+    Parameters not on the current place, sparse or distributed parameters,
+    empty parameters, and float16 or bfloat16 parameters on CPU are not moved.
+    Operations which re-allocate parameters, such as ``Layer.to`` or
+    ``paddle.amp.decorate``, should be done before.
+
+    Args:
+        layer (Layer): The layer whose parameters to flatten.
+        include_sublayers (bool, optional): Whether to flatten the parameters
+            of the sublayers. Default: True.
+
+    Returns:
+        list[FlatParameterStorage], the storages, whose ``param`` and ``grad``
+        attributes are the flat parameter and the flat gradient, and
+        ``params`` attribute is the list of parameters in the storage.
+
+    Examples:
+        .. code-block:: python
+
+            >>> import paddle
+
+            >>> model = paddle.nn.Sequential(
+            ...     paddle.nn.Linear(10, 10),
+            ...     paddle.nn.ReLU(),
+            ...     paddle.nn.Linear(10, 1),
+            ... )
+            >>> storages = paddle.nn.utils.flatten_parameters(model)
+            >>> print(storages[0].param.shape)
+            [121]
+            >>> sgd = paddle.optimizer.SGD(
+            ...     learning_rate=0.1,
+            ...     parameters=model.parameters(),
+            ...     use_multi_tensor=True,
+            ... )
+            >>> for _ in range(2):
+            ...     loss = model(paddle.rand([4, 10])).mean()
+            ...     loss.backward()
+            ...     sgd.step()
+            ...     sgd.clear_grad()
+    """
+    place = framework._current_expected_place()
+    groups = {}
+    for p in layer.parameters(include_sublayers=include_sublayers):
+        if getattr(p, '_flat_parameter_storage', None) is not None:
+            continue
+        if (
+            not p.is_dense()
+            or p.is_dist()
+            or p._numel() == 0
+            or not p.place._equals(place)
+        ):
+            continue
+        # NOTE: coalesce_tensor has no float16 kernel on CPU
+        if p.place.is_cpu_place() and p.dtype in [
+            core.VarDesc.VarType.FP16,
+            core.VarDesc.VarType.BF16,
+        ]:
+            continue
+        groups.setdefault(p.dtype, []).append(p)
+    return [FlatParameterStorage(params) for params in groups.values()]
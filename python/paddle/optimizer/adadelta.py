@@ -66,6 +66,8 @@ class Adadelta(Optimizer):
         name (str, optional): The default value is None. Normally there is no need for user
                 to set this property. For more information, please refer to
                 :ref:`api_guide_Name` .
+        use_multi_tensor (bool, optional): Whether to use multi-tensor strategy to update all parameters at once.
+            It only takes effect in dynamic graph mode. Default is false.
 
     Examples:
         .. code-block:: python
@@ -118,6 +120,7 @@ class Adadelta(Optimizer):
         weight_decay=None,
         grad_clip=None,
         name=None,
+        use_multi_tensor=False,
     ):
         if learning_rate is None:
             raise ValueError("learning_rate is not set.")
@@ -135,6 +138,7 @@ class Adadelta(Optimizer):
         self._multi_precision = False
         self._master_weights = {}
         self.type = "adadelta"
+        self._use_multi_tensor = use_multi_tensor
         self._epsilon = epsilon
         self._rho = rho
         self._default_dict = {
@@ -66,6 +66,8 @@ class Adagrad(Optimizer):
             The default value is None.
         initial_accumulator_value (float, optional): Initial value for moment accumulator.
             The default value is 0.0.
+        use_multi_tensor (bool, optional): Whether to use multi-tensor strategy to update all parameters at once.
+            It only takes effect in dynamic graph mode. Default is false.
 
     Examples:
         .. code-block:: python
@@ -115,6 +117,7 @@ class Adagrad(Optimizer):
         grad_clip=None,
         name=None,
         initial_accumulator_value=0.0,
+        use_multi_tensor=False,
     ):
         assert learning_rate is not None
         assert epsilon is not None
@@ -126,6 +129,7 @@ class Adagrad(Optimizer):
             name=name,
         )
         self.type = "adagrad"
+        self._use_multi_tensor = use_multi_tensor
         self._epsilon = epsilon
         self._multi_precision = False
         self._master_weights = {}
@@ -79,6 +79,8 @@ class Adamax(Optimizer):
         name (str, optional): Normally there is no need for user to set this property.
             For more information, please refer to :ref:`api_guide_Name`.
             The default value is None.
+        use_multi_tensor (bool, optional): Whether to use multi-tensor strategy to update all parameters at once.
+            It only takes effect in dynamic graph mode. Default is false.
 
     **Notes**:
         **Currently, Adamax doesn't support sparse parameter optimization.**
@@ -146,6 +148,7 @@ class Adamax(Optimizer):
         weight_decay=None,
         grad_clip=None,
         name=None,
+        use_multi_tensor=False,
     ):
         assert learning_rate is not None
         assert beta1 is not None
@@ -165,6 +168,7 @@ class Adamax(Optimizer):
             name=name,
         )
         self.type = "adamax"
+        self._use_multi_tensor = use_multi_tensor
         self._beta1 = beta1
         self._beta2 = beta2
         self._epsilon = epsilon
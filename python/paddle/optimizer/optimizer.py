@@ -20,7 +20,7 @@ import numpy as np
 
 import paddle
 import paddle.autograd as imperative_base
-from paddle import _C_ops
+from paddle import _C_ops, _legacy_C_ops
 from paddle._pir_ops import parameter, set_parameter
 from paddle.base import core
 from paddle.base.framework import (
@@ -39,6 +39,11 @@ from ..base import framework, unique_name
 from ..base.backward import _get_no_grad_set_name, append_backward
 from ..base.framework import Parameter
 from ..base.layer_helper import LayerHelper
+from ..nn.utils.flat_parameters import (
+    _clear_gradients,
+    _get_flat_storage_view,
+    _split_by_flat_storage,
+)
 from .lr import LRScheduler
 
 __all__ = []
@@ -47,6 +52,43 @@ g_shard_bypass_dygraph_optimizer = int(
     os.environ.get("FLAGS_shard_bypass_dygraph_optimizer", 0)
 )
 
+# Optimizers without merged kernels, which support multi tensor in dygraph
+# mode by updating the flat buffers of parameter groups.
+_FLAT_MULTI_TENSOR_OPTIMIZERS = [
+    'SGD',
+    'Adagrad',
+    'RMSProp',
+    'Adadelta',
+    'Adamax',
+    'Rprop',
+]
+
+
+class _FlatMultiTensorGroup:
+    """
+    A group of parameters with the same dtype, place, learning rate and
+    regularizer. The parameters, master weights and accumulators of the
+    group are views of flat tensors, so that the group is updated by one
+    optimizer op on the flat tensors.
+    """
+
+    def __init__(self, params, param):
+        self.params = params
+        # the flat parameter, whose slices are the parameters of the group
+        self.param = param
+        # the flat gradient, filled with the gradients of the group
+        self.grad = None
+        # the lists of the accumulators of scalars sharing a buffer, e.g. the
+        # powers of beta of the parameters
+        self.scalars = []
+
+    def unshare_scalars(self):
+        # give each accumulator of scalars its own buffer
+        for members in self.scalars:
+            for member in members:
+                member.clone()._share_buffer_to(member)
+        self.scalars = []
+
 
 @framework.static_only
 def append_backward_new(
@@ -279,6 +321,10 @@ class Optimizer:
         self._use_multi_tensor = None
 
         self._param_dict = self._create_multi_tensor_dict()
+        # NOTE: Flat Multi Tensor: groups of parameters updated through flat
+        # tensors for dygraph mode, keyed by param_group_idx.
+        # Optimizer support list: _FLAT_MULTI_TENSOR_OPTIMIZERS.
+        self._flat_multi_tensor_groups = {}
         self._auxiliary_vars = {}
         self._already_create_accumulater = set()
 
@@ -327,8 +373,13 @@ class Optimizer:
 
         '''
         state_dict = {}
+        # accumulators of flat multi tensor groups are views of the
+        # accumulators of parameters, so they are not saved
+        flat_names = self._flat_multi_tensor_names()
         for k, v in self._accumulators.items():
             for para_name, var_tmp in v.items():
+                if para_name in flat_names:
+                    continue
                 state_dict[var_tmp.name] = var_tmp
                 # save scale value for xpu
                 if core.is_compiled_with_xpu():
@@ -339,6 +390,12 @@ class Optimizer:
         if hasattr(self, "_master_weights"):
             if len(self._master_weights) != 0:
                 state_dict["master_weights"] = self._master_weights
+                if flat_names:
+                    state_dict["master_weights"] = {
+                        k: v
+                        for k, v in self._master_weights.items()
+                        if k not in flat_names
+                    }
         # global step if use lr decay
         if isinstance(self._learning_rate, LRScheduler):
             state_dict["LR_Scheduler"] = self._learning_rate.state_dict()
@@ -379,6 +436,10 @@ class Optimizer:
         if isinstance(self._learning_rate, LRScheduler):
             self._learning_rate.set_state_dict(state_dict["LR_Scheduler"])
 
+        # the loaded states are fused into new flat multi tensor groups
+        # in the next step
+        self._reset_flat_multi_tensor_groups()
+
         # NOTE: exclude learning rate scheduler's state from
         # _accumulators_holder.
         state_dict = state_dict.copy()
@@ -1152,6 +1213,13 @@ class Optimizer:
                             parameters_and_grads,
                             param_group_idx=param_group_idx,
                         )
+        elif self._use_flat_multi_tensor():
+            # the flat tensors of groups are passed to _finish_update
+            parameters_and_grads = self._append_optimize_flat_multi_tensor_op(
+                target_block,
+                parameters_and_grads,
+                param_group_idx=param_group_idx,
+            )
         else:
             if not framework.in_dygraph_mode():
                 params_grads_device_map = (
@@ -1607,7 +1675,17 @@ class Optimizer:
         """
         params_and_grads = []
         if framework.in_dygraph_mode() or in_pir_mode():
+            use_flat_multi_tensor = self._use_flat_multi_tensor()
             for param, grad in parameters_and_grads:
+                if (
+                    use_flat_multi_tensor
+                    and grad is not None
+                    and grad.is_dense()
+                ):
+                    # NOTE: dense gradients are regularized with the flat
+                    # tensors of multi tensor groups
+                    params_and_grads.append((param, grad))
+                    continue
                 new_grad = self._create_regularization_of_grad(
                     param, grad, regularization
                 )
@@ -1689,8 +1767,9 @@ class Optimizer:
                     if not p.stop_gradient:
                         param_list.append(p)
 
-        for p in param_list:
-            p.clear_gradient(set_to_zero)
+        # gradients of parameters in the storages of
+        # paddle.nn.utils.flatten_parameters are zeroed by storages
+        _clear_gradients(param_list, set_to_zero)
 
     @imperative_base.no_grad()
     def minimize(
@@ -1917,6 +1996,301 @@ class Optimizer:
         """
         pass
 
+    def _use_flat_multi_tensor(self):
+        return (
+            bool(self._use_multi_tensor)
+            and framework.in_dygraph_mode()
+            and self.__class__.__name__ in _FLAT_MULTI_TENSOR_OPTIMIZERS
+        )
+
+    def _flat_multi_tensor_names(self):
+        names = set()
+        for groups in self._flat_multi_tensor_groups.values():
+            for group in groups:
+                names.add(group.param.name)
+                if group.param.name in self._master_weights:
+                    names.add(self._master_weights[group.param.name].name)
+        return names
+
+    def _reset_flat_multi_tensor_groups(self):
+        """
+        Drop the flat multi tensor groups and their accumulators, the
+        tensors of parameters remain views of the dropped flat tensors until
+        they are fused into new groups, except that the accumulators of
+        scalars are given their own buffers.
+        """
+        names = self._flat_multi_tensor_names()
+        for accumulators in self._accumulators.values():
+            for name in names:
+                accumulators.pop(name, None)
+        for groups in self._flat_multi_tensor_groups.values():
+            for group in groups:
+                group.unshare_scalars()
+                self._master_weights.pop(group.param.name, None)
+                self._already_create_accumulater.discard(group.param.name)
+        self._flat_multi_tensor_groups = {}
+
+    def _coalesce_tensors(self, tensors, fused):
+        # copy the tensors into the flat tensor, and make them views of it
+        _legacy_C_ops.coalesce_tensor(
+            tensors,
+            tensors,
+            fused,
+            "copy_data",
+            True,
+            "use_align",
+            False,
+            "dtype",
+            fused.dtype,
+        )
+
+    def _remove_flat_multi_tensor_group(self, param_group_idx, group):
+        """
+        Remove the group, whose parameters are updated one by one afterwards.
+        The accumulators of scalars shared by the parameters are given their
+        own buffers, so that they are updated separately.
+        """
+        group.unshare_scalars()
+        names = [group.param.name]
+        master_weight = self._master_weights.pop(group.param.name, None)
+        if master_weight is not None:
+            names.append(master_weight.name)
+        for accumulators in self._accumulators.values():
+            for name in names:
+                accumulators.pop(name, None)
+        self._already_create_accumulater.discard(group.param.name)
+        self._flat_multi_tensor_groups[param_group_idx].remove(group)
+
+    def _flat_multi_tensor_scalar_states(self, param):
+        # the values of the accumulators of scalars, which are shared by the
+        # parameters of a group. NOTE: all accumulators of a parameter with
+        # one element are taken as scalars, which only splits the groups.
+        target = param
+        if self._multi_precision and self._is_dtype_fp16_or_bf16(param.dtype):
+            target = self._master_weights[param.name]
+        states = []
+        for name, accumulators in sorted(self._accumulators.items()):
+            accumulator = accumulators.get(target.name, None)
+            if accumulator is not None and accumulator._numel() == 1:
+                states.append((name, accumulator.item()))
+        return tuple(states)
+
+    def _flat_multi_tensor_group_key(self, param, grad):
+        param_lr = 1.0
+        if hasattr(param, 'optimize_attr'):
+            param_lr = param.optimize_attr['learning_rate']
+            if isinstance(param_lr, Variable):
+                param_lr = id(param_lr)
+        regularizer = getattr(param, 'regularizer', None)
+        return (
+            param.dtype,
+            grad.dtype,
+            str(param.place),
+            param_lr,
+            type(regularizer),
+            getattr(regularizer, '_coeff', id(regularizer)),
+            self._flat_multi_tensor_scalar_states(param),
+        )
+
+    def _create_flat_multi_tensor_group(self, target_block, params):
+        """
+        Fuse the parameters, master weights and accumulators of params into
+        flat tensors, params should have the same group key.
+        """
+        dtype = params[0].dtype
+        numel = sum(p._numel() for p in params)
+        param = framework.EagerParamBase(
+            shape=[numel],
+            dtype=dtype,
+            name=unique_name.generate('flat_multi_tensor_param'),
+            optimize_attr=dict(
+                getattr(params[0], 'optimize_attr', {'learning_rate': 1.0})
+            ),
+            regularizer=getattr(params[0], 'regularizer', None),
+        )
+        flat_param = _get_flat_storage_view(params)
+        if flat_param is not None:
+            # params are views of the storage of
+            # paddle.nn.utils.flatten_parameters already
+            flat_param._share_buffer_to(param)
+        else:
+            self._coalesce_tensors(params, param)
+
+        find_master = self._multi_precision and self._is_dtype_fp16_or_bf16(
+            dtype
+        )
+        targets = params
+        target = param
+        if find_master:
+            targets = [self._master_weights[p.name] for p in params]
+            target = self._create_master_weight(param)
+            self._coalesce_tensors(targets, target)
+
+        self._create_accumulators(target_block, [param])
+        group = _FlatMultiTensorGroup(params, param)
+        for accumulators in self._accumulators.values():
+            if target.name not in accumulators:
+                continue
+            fused = accumulators[target.name]
+            members = [accumulators[t.name] for t in targets]
+            if fused._numel() == numel:
+                self._coalesce_tensors(members, fused)
+            else:
+                # accumulators not in the shape of parameters, e.g. the
+                # powers of beta, are shared by the parameters of the group,
+                # whose values are the same as they have the same group key
+                fused.copy_(members[0], False)
+                for member in members:
+                    fused._share_buffer_to(member)
+                group.scalars.append(members)
+        return group
+
+    @framework.dygraph_only
+    def _append_optimize_flat_multi_tensor_op(
+        self, target_block, parameters_and_grads, param_group_idx
+    ):
+        """
+        For Flat Multi Tensor, update the dense parameters by groups with one
+        optimizer op on the flat tensors of each group, and return the
+        (parameter, gradient) pairs to pass to _finish_update.
+        """
+        if isinstance(parameters_and_grads, list):
+            params_grads = parameters_and_grads
+            self._create_accumulators(
+                target_block,
+                [p[0] for p in params_grads if not p[0].stop_gradient],
+            )
+        else:
+            params_grads = parameters_and_grads['params']
+            params_acc_dict = parameters_and_grads.copy()
+            params_acc_dict['params'] = [
+                p[0] for p in params_grads if not p[0].stop_gradient
+            ]
+            self._create_accumulators(target_block, params_acc_dict)
+        params_grads = [
+            p
+            for p in params_grads
+            if p[1] is not None and not p[0].stop_gradient
+        ]
+
+        groups = self._flat_multi_tensor_groups.get(param_group_idx, None)
+        if groups is not None and not all(
+            group.param._is_shared_buffer_with(p)
+            for group in groups
+            for p in group.params
+        ):
+            # parameters are re-allocated, e.g. casted by amp.decorate
+            self._reset_flat_multi_tensor_groups()
+            groups = None
+        if groups is None:
+            grouped_params = defaultdict(list)
+            for param, grad in params_grads:
+                # NOTE: coalesce_tensor has no float16 kernel on CPU
+                if grad.is_dense() and not (
+                    param.place.is_cpu_place()
+                    and self._is_dtype_fp16_or_bf16(param.dtype)
+                ):
+                    key = self._flat_multi_tensor_group_key(param, grad)
+                    grouped_params[key].append(param)
+            groups = [
+                self._create_flat_multi_tensor_group(target_block, split)
+                for params in grouped_params.values()
+                for split in _split_by_flat_storage(params)
+            ]
+            self._flat_multi_tensor_groups[param_group_idx] = groups
+
+        def update(param_and_grad):
+            if isinstance(parameters_and_grads, dict):
+                param_grad_dict = {
+                    k: v
+                    for k, v in parameters_and_grads.items()
+                    if k != 'params'
+                }
+                param_grad_dict['params'] = param_and_grad
+                param_and_grad = param_grad_dict
+            self._append_optimize_op(target_block, param_and_grad)
+
+        found_inf = self._get_auxiliary_var('found_inf')
+        if found_inf:
+            if isinstance(found_inf, core.eager.Tensor):
+                self._set_auxiliary_var('found_inf', True)
+        elif isinstance(found_inf, core.eager.Tensor):
+            self._set_auxiliary_var('found_inf', False)
+
+        grads = {param.name: grad for param, grad in params_grads}
+        finish_params_grads = []
+        for group in list(groups):
+            group_grads = [grads.pop(p.name, None) for p in group.params]
+            present = [g for g in group_grads if g is not None]
+            if not present:
+                continue
+            if len(present) < len(group_grads) and group.scalars:
+                # the accumulators of scalars are only updated for the
+                # parameters with gradient, so they can not be shared by the
+                # group anymore, update the parameters one by one
+                self._remove_flat_multi_tensor_group(param_group_idx, group)
+                for param, grad in zip(group.params, group_grads):
+                    if grad is not None:
+                        grads[param.name] = grad
+                continue
+            # _finish_update is called once for each group, since the
+            # accumulators of scalars are shared by the group
+            if len(present) < len(group_grads):
+                # some parameters of the group have no gradient, update the
+                # others one by one on the views of the flat tensors
+                finish_params_grads.append((group.param, present[0]))
+                if found_inf:
+                    continue
+                for param, grad in zip(group.params, group_grads):
+                    if grad is not None:
+                        grad = self._create_regularization_of_grad(
+                            param, grad, self.regularization
+                        )
+                        update((param, grad))
+                continue
+
+            # gradients in the storage of paddle.nn.utils.flatten_parameters
+            # are views of its flat gradient already
+            grad = _get_flat_storage_view(group.params, present)
+            if grad is None:
+                if group.grad is None or group.grad.dtype != present[0].dtype:
+                    group.grad = paddle.empty(
+                        [group.param._numel()], dtype=present[0].dtype
+                    )
+                if not all(
+                    group.grad._is_shared_buffer_with(g) for g in present
+                ):
+                    # gradients accumulated in place stay views of the flat
+                    # gradient, which are only gathered once
+                    self._coalesce_tensors(present, group.grad)
+                grad = group.grad
+            grad = self._create_regularization_of_grad(
+                group.param, grad, self.regularization
+            )
+            finish_params_grads.append((group.param, grad))
+            if not found_inf:
+                update((group.param, grad))
+
+        # parameters not in any group, e.g. with sparse gradients or
+        # without gradient when the groups are created, or float16
+        # parameters on CPU
+        for param, grad in params_grads:
+            if param.name not in grads:
+                continue
+            if grad.is_dense():
+                grad = self._create_regularization_of_grad(
+                    param, grad, self.regularization
+                )
+            finish_params_grads.append((param, grad))
+            if not found_inf:
+                update((param, grad))
+
+        if isinstance(parameters_and_grads, dict):
+            finish_params_grads_dict = parameters_and_grads.copy()
+            finish_params_grads_dict['params'] = finish_params_grads
+            return finish_params_grads_dict
+        return finish_params_grads
+
     def _is_dtype_fp16_or_bf16(self, dtype):
         """
         check the dtype is fp16 or the dtype is bf16
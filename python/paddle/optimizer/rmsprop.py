@@ -102,6 +102,8 @@ class RMSProp(Optimizer):
           :ref:`api_paddle_nn_ClipGradByValue` ). Default None, meaning there is no gradient clipping.
         name (str, optional): This parameter is used by developers to print debugging information.
           For details, please refer to :ref:`api_guide_Name`. Default is None.
+        use_multi_tensor (bool, optional): Whether to use multi-tensor strategy to update all parameters at once.
+            It only takes effect in dynamic graph mode. Default is false.
 
     Examples:
             .. code-block:: python
@@ -158,6 +160,7 @@ class RMSProp(Optimizer):
         weight_decay=None,
         grad_clip=None,
         name=None,
+        use_multi_tensor=False,
     ):
         if learning_rate is None:
             raise ValueError("learning_rate is not set.")
@@ -183,6 +186,7 @@ class RMSProp(Optimizer):
         )
 
         self.type = "rmsprop"
+        self._use_multi_tensor = use_multi_tensor
         self._rho = rho
         self._epsilon = epsilon
         self._momentum = momentum
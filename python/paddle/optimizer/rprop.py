@@ -78,6 +78,8 @@ class Rprop(Optimizer):
             The default value is False.
         name (str, optional): The default value is None. Normally there is no need for user to set this property.
             For more information, please refer to :ref:`api_guide_Name` .
+        use_multi_tensor (bool, optional): Whether to use multi-tensor strategy to update all parameters at once.
+            It only takes effect in dynamic graph mode. Default is false.
 
     Examples:
         .. code-block:: python
@@ -106,6 +108,7 @@ class Rprop(Optimizer):
         grad_clip=None,
         multi_precision=False,
         name=None,
+        use_multi_tensor=False,
     ):
         if learning_rate is None:
             raise ValueError("learning_rate is not set")
@@ -128,6 +131,7 @@ class Rprop(Optimizer):
             name=name,
         )
         self.type = "rprop"
+        self._use_multi_tensor = use_multi_tensor
         self._initial_learning_rate = learning_rate
         self._multi_precision = multi_precision
         self._master_weights = {}
@@ -52,6 +52,8 @@ class SGD(Optimizer):
         name (str, optional): The default value is None. Normally there is no need for user
                 to set this property. For more information, please refer to
                 :ref:`api_guide_Name` .
+        use_multi_tensor (bool, optional): Whether to use multi-tensor strategy to update all parameters at once.
+            It only takes effect in dynamic graph mode. Default is false.
 
     Examples:
         .. code-block:: python
@@ -78,6 +80,7 @@ class SGD(Optimizer):
         grad_clip=None,
         multi_precision=False,
         name=None,
+        use_multi_tensor=False,
     ):
         if learning_rate is None:
             raise ValueError("learning_rate is not set")
@@ -89,6 +92,7 @@ class SGD(Optimizer):
             name=name,
         )
         self.type = "sgd"
+        self._use_multi_tensor = use_multi_tensor
         self._multi_precision = multi_precision
         self._master_weights = {}
 
@@ -17,10 +17,14 @@ import logging
 import multiprocessing
 import random
 import sys
+import traceback
 import warnings
 from itertools import zip_longest
+from multiprocessing import resource_tracker, shared_memory
 from queue import Queue
-from threading import Thread
+from threading import Semaphore, Thread
+
+import numpy as np
 
 from paddle.base.reader import QUEUE_GET_TIMEOUT
 
@@ -399,98 +403,210 @@ class XmapEndSignal:
     pass
 
 
-def xmap_readers(mapper, reader, process_num, buffer_size, order=False):
+class _XmapErrorSignal:
+    def __init__(self, message):
+        self.message = message
+
+
+# The mapped numpy arrays smaller than this are cheaper to be pickled through
+# the multiprocessing queue than to be passed through shared memory.
+_XMAP_SHARED_MEMORY_MIN_BYTES = 1 << 16
+
+
+class _XmapSharedArray:
+    """
+    Descriptor of a numpy array copied into shared memory by a worker process,
+    the shared memory is released once the array is read by the main process.
+    """
+
+    def __init__(self, array):
+        shm = shared_memory.SharedMemory(create=True, size=array.nbytes)
+        np.ndarray(array.shape, dtype=array.dtype, buffer=shm.buf)[...] = array
+        self.name = shm.name
+        self.shape = array.shape
+        self.dtype = array.dtype.str
+        shm.close()
+
+    def get(self):
+        shm = shared_memory.SharedMemory(name=self.name)
+        try:
+            array = np.ndarray(self.shape, dtype=self.dtype, buffer=shm.buf)
+            return array.copy()
+        finally:
+            shm.close()
+            shm.unlink()
+
+
+def _xmap_to_shared_memory(obj):
+    if (
+        isinstance(obj, np.ndarray)
+        and not obj.dtype.hasobject
+        and obj.nbytes >= _XMAP_SHARED_MEMORY_MIN_BYTES
+    ):
+        return _XmapSharedArray(obj)
+    if type(obj) in (list, tuple):
+        return type(obj)(_xmap_to_shared_memory(o) for o in obj)
+    if type(obj) is dict:
+        return {k: _xmap_to_shared_memory(v) for k, v in obj.items()}
+    return obj
+
+
+def _xmap_from_shared_memory(obj):
+    if isinstance(obj, _XmapSharedArray):
+        return obj.get()
+    if type(obj) in (list, tuple):
+        return type(obj)(_xmap_from_shared_memory(o) for o in obj)
+    if type(obj) is dict:
+        return {k: _xmap_from_shared_memory(v) for k, v in obj.items()}
+    return obj
+
+
+def xmap_readers(
+    mapper,
+    reader,
+    process_num,
+    buffer_size,
+    order=False,
+    use_process=False,
+    chunk_size=1,
+):
     """
-    Use multi-threads to map samples from reader by a mapper defined by user.
+    Use multi-threads or multi-processes to map samples from reader by a
+    mapper defined by user.
 
     Args:
         mapper (callable): a function to map the data from reader.
         reader (callable): a data reader which yields the data.
-        process_num (int): thread number to handle original sample.
-        buffer_size (int): size of the queue to read data in.
+        process_num (int): thread (or process if use_process is True) number
+            to handle original sample.
+        buffer_size (int): size of the queue to read data in, counted in
+            chunks of samples.
         order (bool): whether to keep the data order from original reader.
             Default False.
+        use_process (bool): whether to map samples in worker processes
+            instead of threads, which is faster for CPU-bound mapper. The
+            mapped numpy arrays are passed back through shared memory. It
+            is not supported on Windows. Default False.
+        chunk_size (int): number of samples sent to a worker at a time, a
+            larger chunk amortizes the communication cost between workers.
+            Default 1.
 
     Returns:
         callable: a decorated reader with data mapping.
     """
-    end = XmapEndSignal()
+    if use_process and sys.platform == 'win32':
+        raise NotImplementedError(
+            "The xmap_readers method with use_process=True is not supported on windows."
+        )
+    assert chunk_size >= 1, "chunk_size should be a positive integer."
 
-    # define a worker to read samples from reader to in_queue
-    def read_worker(reader, in_queue):
-        for i in reader():
-            in_queue.put(i)
-        in_queue.put(end)
+    end = XmapEndSignal()
 
-    # define a worker to read samples from reader to in_queue with order flag
-    def order_read_worker(reader, in_queue):
+    # define a worker to read samples from reader to in_queue by chunks,
+    # each chunk is tagged with its order, and the number of chunks read but
+    # not yielded is limited by in_flight if it is not None
+    def read_worker(reader, in_queue, in_flight):
+        chunk = []
         in_order = 0
         for i in reader():
-            in_queue.put((in_order, i))
-            in_order += 1
+            chunk.append(i)
+            if len(chunk) == chunk_size:
+                if in_flight is not None:
+                    in_flight.acquire()
+                in_queue.put((in_order, chunk))
+                in_order += 1
+                chunk = []
+        if chunk:
+            if in_flight is not None:
+                in_flight.acquire()
+            in_queue.put((in_order, chunk))
         in_queue.put(end)
 
     # define a worker to handle samples from in_queue by mapper
     # and put mapped samples into out_queue
     def handle_worker(in_queue, out_queue, mapper):
-        sample = in_queue.get()
-        while not isinstance(sample, XmapEndSignal):
-            r = mapper(sample)
-            out_queue.put(r)
-            sample = in_queue.get()
-        in_queue.put(end)
-        out_queue.put(end)
-
-    # define a worker to handle samples from in_queue by mapper
-    # and put mapped samples into out_queue by order
-    def order_handle_worker(in_queue, out_queue, mapper, out_order):
-        ins = in_queue.get()
-        while not isinstance(ins, XmapEndSignal):
-            order, sample = ins
-            r = mapper(sample)
-            while order != out_order[0]:
-                pass
-            out_queue.put(r)
-            out_order[0] += 1
+        try:
             ins = in_queue.get()
+            while not isinstance(ins, XmapEndSignal):
+                order, chunk = ins
+                r = [mapper(sample) for sample in chunk]
+                if use_process:
+                    r = _xmap_to_shared_memory(r)
+                out_queue.put((order, r))
+                ins = in_queue.get()
+        except Exception:
+            out_queue.put(_XmapErrorSignal(traceback.format_exc()))
+            return
         in_queue.put(end)
         out_queue.put(end)
 
     def xreader():
-        in_queue = Queue(buffer_size)
-        out_queue = Queue(buffer_size)
-        out_order = [0]
-        # start a read worker in a thread
-        target = order_read_worker if order else read_worker
-        t = Thread(target=target, args=(reader, in_queue))
-        t.daemon = True
-        t.start()
-        # start several handle_workers
-        target = order_handle_worker if order else handle_worker
-        args = (
-            (in_queue, out_queue, mapper, out_order)
-            if order
-            else (in_queue, out_queue, mapper)
-        )
+        if use_process:
+            # The worker processes share the resource tracker of the main
+            # process, so the shared memory created by a worker is not
+            # released when the worker exits.
+            resource_tracker.ensure_running()
+            in_queue = fork_context.Queue(buffer_size)
+            out_queue = fork_context.Queue(buffer_size)
+            worker_cls = fork_context.Process
+        else:
+            in_queue = Queue(buffer_size)
+            out_queue = Queue(buffer_size)
+            worker_cls = Thread
+        # start several handle_workers, the worker processes are forked
+        # before the read worker thread is started
         workers = []
         for i in range(process_num):
-            worker = Thread(target=target, args=args)
+            worker = worker_cls(
+                target=handle_worker, args=(in_queue, out_queue, mapper)
+            )
             worker.daemon = True
             workers.append(worker)
         for w in workers:
             w.start()
+        # The chunks mapped out of order are kept in reorder_buffer until
+        # all the chunks before them are yielded, the chunks in flight are
+        # limited to buffer_size to bound reorder_buffer.
+        in_flight = (
+            Semaphore(buffer_size) if order and buffer_size > 0 else None
+        )
+        # start a read worker in a thread
+        t = Thread(target=read_worker, args=(reader, in_queue, in_flight))
+        t.daemon = True
+        t.start()
 
-        sample = out_queue.get()
-        while not isinstance(sample, XmapEndSignal):
-            yield sample
-            sample = out_queue.get()
-        finish = 1
-        while finish < process_num:
-            sample = out_queue.get()
-            if isinstance(sample, XmapEndSignal):
-                finish += 1
-            else:
-                yield sample
+        reorder_buffer = {}
+        out_order = 0
+        finish = 0
+        try:
+            while finish < process_num:
+                sample = out_queue.get()
+                if isinstance(sample, XmapEndSignal):
+                    finish += 1
+                    continue
+                if isinstance(sample, _XmapErrorSignal):
+                    raise RuntimeError(
+                        "xmap_readers failed to map samples, worker error:\n"
+                        + sample.message
+                    )
+                in_order, r = sample
+                if use_process:
+                    r = _xmap_from_shared_memory(r)
+                if not order:
+                    yield from r
+                    continue
+                reorder_buffer[in_order] = r
+                while out_order in reorder_buffer:
+                    r = reorder_buffer.pop(out_order)
+                    out_order += 1
+                    if in_flight is not None:
+                        in_flight.release()
+                    yield from r
+        finally:
+            if use_process:
+                for w in workers:
+                    if w.is_alive():
+                        w.terminate()
 
     return xreader
 
@@ -14,6 +14,8 @@
 
 import logging
 import math
+import os
+from concurrent.futures import ThreadPoolExecutor
 
 import numpy as np
 
@@ -23,6 +25,10 @@ _logger = get_logger(
     __name__, logging.INFO, fmt='%(asctime)s-%(levelname)s: %(message)s'
 )
 
+# The max number of elements of the intermediate arrays when evaluating the
+# candidate thresholds in batch.
+_KL_BATCH_ELEMENTS = 1 << 20
+
 
 def expand_quantized_bins(quantized_bins, reference_bins):
     '''
@@ -78,6 +84,57 @@ def safe_entropy(reference_distr_P, P_sum, candidate_distr_Q, Q_sum):
     return (tmp_sum1 - tmp_sum2) / P_sum
 
 
+def _kl_divergences(hist, candidates, quant_range, P_sum):
+    '''
+    Calculate the KL divergences of all candidate thresholds in batch, which
+    is equivalent to calling expand_quantized_bins and safe_entropy for every
+    candidate threshold.
+    '''
+    # The prefix sums of the hist, the non-zero bins and p * log(p), the sum
+    # of any hist slice is the difference of two prefix sums.
+    hist_prefix = np.concatenate([[0.0], np.cumsum(hist)])
+    nonzero_prefix = np.concatenate([[0], np.cumsum(hist != 0)])
+    safe_hist = np.where(hist > 0, hist, 1.0)
+    p_log_p_prefix = np.concatenate(
+        [[0.0], np.cumsum(np.where(hist > 0, hist * np.log(safe_hist), 0.0))]
+    )
+
+    # The [start, end) of merged bins for every candidate, the last merged
+    # bin ends at the candidate threshold.
+    num_merged_bins = (candidates // quant_range)[:, None]
+    quant_idx = np.arange(quant_range)[None, :]
+    starts = quant_idx * num_merged_bins
+    ends = np.where(
+        quant_idx == quant_range - 1,
+        candidates[:, None],
+        starts + num_merged_bins,
+    )
+    quantized_bins = hist_prefix[ends] - hist_prefix[starts]
+    nonzero_bins = nonzero_prefix[ends] - nonzero_prefix[starts]
+
+    # The outliers are accumulated to the last bin of reference_distr_P.
+    outliers_count = P_sum - hist_prefix[candidates]
+    last_bin = hist[candidates - 1] + outliers_count
+    reference_bins = quantized_bins.copy()
+    reference_bins[:, -1] += outliers_count
+
+    Q_sum = np.sum(np.where(nonzero_bins > 0, quantized_bins, 0.0), axis=1)
+    avg_bin_ele = quantized_bins / np.maximum(nonzero_bins, 1)
+    valid = reference_bins > 0
+    p_log_q = np.sum(
+        np.where(
+            valid,
+            reference_bins * np.log(np.where(valid, avg_bin_ele, 1.0)),
+            0.0,
+        ),
+        axis=1,
+    )
+    p_log_p = p_log_p_prefix[candidates - 1] + last_bin * np.log(last_bin)
+    return (
+        p_log_p + P_sum * np.log(Q_sum) - p_log_q - P_sum * np.log(P_sum)
+    ) / P_sum
+
+
 def cal_kl_threshold(hist, bin_width, bits):
     '''
     Using the KL-divergenc method to get the more precise threshold.
@@ -88,51 +145,27 @@ def cal_kl_threshold(hist, bin_width, bits):
         bits(int): The quantization bits.
     '''
     assert hist.ndim == 1
+    hist = np.asarray(hist, dtype=np.float64)
     hist_bins = hist.shape[0]
     starting_iter = int((hist_bins - 1) * 0.5)
     quant_range = 2 ** (bits - 1) - 1
 
-    P_sum = np.sum(np.array(hist).ravel())
+    P_sum = np.sum(hist)
     min_kl_divergence = 0
     min_kl_index = 0
-    kl_inited = False
-
-    for i in range(starting_iter, hist_bins):
-        reference_distr_P = hist[0:i].tolist()
-        outliers_count = sum(hist[i:])
-        if reference_distr_P[i - 1] == 0:
-            continue
-        reference_distr_P[i - 1] += outliers_count
-        reference_distr_bins = reference_distr_P[:]
-        candidate_distr_Q = hist[0:i].tolist()
-        num_merged_bins = int(i / quant_range)
-        candidate_distr_Q_quantized = [0] * quant_range
-        j_start = 0
-        j_end = num_merged_bins
-        for idx in range(quant_range):
-            candidate_distr_Q_quantized[idx] = sum(
-                candidate_distr_Q[j_start:j_end]
-            )
-            j_start += num_merged_bins
-            j_end += num_merged_bins
-            if (idx + 1) == quant_range - 1:
-                j_end = i
-        candidate_distr_Q = expand_quantized_bins(
-            candidate_distr_Q_quantized, reference_distr_bins
-        )
-        Q_sum = sum(candidate_distr_Q)
-        kl_divergence = safe_entropy(
-            reference_distr_P, P_sum, candidate_distr_Q, Q_sum
-        )
-        if not kl_inited:
-            min_kl_divergence = kl_divergence
-            min_kl_index = i
-            kl_inited = True
-        elif kl_divergence < min_kl_divergence:
-            min_kl_divergence = kl_divergence
-            min_kl_index = i
-        else:
-            pass
+
+    candidates = np.arange(max(starting_iter, 1), hist_bins)
+    candidates = candidates[hist[candidates - 1] != 0]
+    # Evaluate the candidates in batches to bound the memory usage when
+    # quant_range is large.
+    batch_size = max(_KL_BATCH_ELEMENTS // quant_range, 1)
+    for begin in range(0, len(candidates), batch_size):
+        batch = candidates[begin : begin + batch_size]
+        kl_divergence = _kl_divergences(hist, batch, quant_range, P_sum)
+        idx = int(np.argmin(kl_divergence))
+        if min_kl_index == 0 or kl_divergence[idx] < min_kl_divergence:
+            min_kl_divergence = kl_divergence[idx]
+            min_kl_index = int(batch[idx])
     if min_kl_index == 0:
         while starting_iter > 0:
             if hist[starting_iter] == 0:
@@ -142,3 +175,36 @@ def cal_kl_threshold(hist, bin_width, bits):
                 break
         min_kl_index = starting_iter
     return (min_kl_index + 0.5) * bin_width
+
+
+def cal_kl_thresholds(hists, bin_widths, bits, num_workers=None):
+    '''
+    Using the KL-divergenc method to get the thresholds of many tensors in
+    parallel.
+
+    Args:
+        hists(List): The hists of the tensors.
+        bin_widths(List): The bin widths for the hists.
+        bits(int): The quantization bits.
+        num_workers(int, optional): The number of threads to calculate the
+            thresholds. Default is None, which means the number of CPUs.
+
+    Returns:
+        List, the thresholds of the tensors, in the same order as hists.
+    '''
+    assert len(hists) == len(bin_widths)
+    if num_workers is None:
+        num_workers = os.cpu_count() or 1
+    num_workers = min(num_workers, len(hists))
+    if num_workers <= 1:
+        return [
+            cal_kl_threshold(hist, bin_width, bits)
+            for hist, bin_width in zip(hists, bin_widths)
+        ]
+    with ThreadPoolExecutor(max_workers=num_workers) as executor:
+        return list(
+            executor.map(
+                lambda args: cal_kl_threshold(*args, bits),
+                zip(hists, bin_widths),
+            )
+        )
@@ -31,7 +31,7 @@ from ...utils import unique_name
 from ..log_helper import get_logger
 from . import utils
 from .adaround import run_adaround
-from .cal_kl_threshold import cal_kl_threshold
+from .cal_kl_threshold import cal_kl_thresholds
 from .quant_config import (
     SUPPORT_QUANTIZATION_OP_DICT,
     ARMCPUQuantizer,
@@ -1150,6 +1150,7 @@ class PostTrainingQuantization:
                         )
             self._quantized_var_threshold[var_name] = weight_threshold
 
+        kl_var_names = []
         for var_name in self._quantized_act_var_name:
             if (var_name in self._zero_size_var_names) and (
                 var_name not in self._sampling_act_histogram
@@ -1157,15 +1158,26 @@ class PostTrainingQuantization:
                 continue
             hist, hist_edeges = self._sampling_act_histogram[var_name]
             if self._algo == "KL":
-                bin_width = hist_edeges[1] - hist_edeges[0]
-                self._quantized_var_threshold[var_name] = cal_kl_threshold(
-                    hist, bin_width, self._activation_bits
-                )
+                kl_var_names.append(var_name)
             elif self._algo == "hist":
                 self._quantized_var_threshold[
                     var_name
                 ] = self._get_hist_scaling_factor(hist, hist_edeges)
 
+        # The KL thresholds of activations are independent, calculate them
+        # in parallel.
+        if kl_var_names:
+            hists = []
+            bin_widths = []
+            for var_name in kl_var_names:
+                hist, hist_edeges = self._sampling_act_histogram[var_name]
+                hists.append(hist)
+                bin_widths.append(hist_edeges[1] - hist_edeges[0])
+            thresholds = cal_kl_thresholds(
+                hists, bin_widths, self._activation_bits
+            )
+            self._quantized_var_threshold.update(zip(kl_var_names, thresholds))
+
     def _update_program(self):
         '''
         Use QuantizationTransformPass and AddQuantDequantPass to insert
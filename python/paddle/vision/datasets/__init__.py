@@ -16,6 +16,7 @@ from .cifar import Cifar10, Cifar100
 from .flowers import Flowers
 from .folder import DatasetFolder, ImageFolder
 from .mnist import MNIST, FashionMNIST
+from .record import ImageRecordDataset, write_image_records
 from .voc2012 import VOC2012
 
 __all__ = [
@@ -27,4 +28,6 @@ __all__ = [
     'Cifar10',
     'Cifar100',
     'VOC2012',
+    'ImageRecordDataset',
+    'write_image_records',
 ]
@@ -13,6 +13,9 @@
 # limitations under the License.
 
 import os
+import pickle
+import tempfile
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 
 from PIL import Image
 
@@ -40,7 +43,137 @@ def has_valid_extension(filename, extensions):
     return filename.lower().endswith(extensions)
 
 
-def make_dataset(dir, class_to_idx, extensions, is_valid_file=None):
+_INDEX_VERSION = 1
+
+
+def _scan_dir(path, cached, is_valid_file):
+    """
+    Scan a directory, return (mtime_ns, sorted sub directory names, sorted
+    valid file names), or None if the directory cannot be read. The cached
+    entry is reused if the modification time of the directory is unchanged.
+    """
+    try:
+        mtime = os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+    if cached is not None and cached[0] == mtime:
+        return cached
+    dirnames = []
+    fnames = []
+    try:
+        with os.scandir(path) as it:
+            for entry in it:
+                try:
+                    is_dir = entry.is_dir()
+                except OSError:
+                    is_dir = False
+                if is_dir:
+                    dirnames.append(entry.name)
+                else:
+                    fnames.append(entry.name)
+    except OSError:
+        return None
+    fnames = [
+        fname
+        for fname in sorted(fnames)
+        if is_valid_file(os.path.join(path, fname))
+    ]
+    return mtime, sorted(dirnames), fnames
+
+
+def _load_index(index_file, key):
+    if index_file is None or not os.path.isfile(index_file):
+        return {}
+    try:
+        with open(index_file, 'rb') as f:
+            index = pickle.load(f)
+    except Exception:
+        return {}
+    if index.get('version') != _INDEX_VERSION or index.get('key') != key:
+        return {}
+    return index['dirs']
+
+
+def _save_index(index_file, key, dirs):
+    index_dir = os.path.dirname(os.path.abspath(index_file))
+    os.makedirs(index_dir, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=index_dir, suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            pickle.dump(
+                {'version': _INDEX_VERSION, 'key': key, 'dirs': dirs},
+                f,
+                protocol=pickle.HIGHEST_PROTOCOL,
+            )
+        os.replace(tmp_path, index_file)
+    except BaseException:
+        os.remove(tmp_path)
+        raise
+
+
+def _index_files(
+    tops, is_valid_file, num_workers=None, index_file=None, index_key=None
+):
+    """
+    Walk the directory trees of :attr:`tops` like ``os.walk`` with
+    ``followlinks=True``, scanning directories concurrently. If
+    :attr:`index_file` is given, the scanned directories are persisted in it,
+    and only the directories whose modification time changed since then are
+    scanned again.
+
+    Returns:
+        list[list[str]]: The valid file paths under each of :attr:`tops`, in
+        the same order as ``sorted(os.walk(top))`` with sorted file names.
+    """
+    cached_dirs = _load_index(index_file, index_key)
+    dirs = {}
+    top_dirs = [[] for _ in tops]
+    changed = False
+    with ThreadPoolExecutor(num_workers) as executor:
+        pending = {}
+
+        def submit(i, path):
+            future = executor.submit(
+                _scan_dir, path, cached_dirs.get(path), is_valid_file
+            )
+            pending[future] = (i, path)
+
+        for i, top in enumerate(tops):
+            submit(i, top)
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                i, path = pending.pop(future)
+                entry = future.result()
+                if entry is None:
+                    continue
+                changed = changed or entry is not cached_dirs.get(path)
+                dirs[path] = entry
+                top_dirs[i].append(path)
+                for dirname in entry[1]:
+                    submit(i, os.path.join(path, dirname))
+
+    if index_file is not None and (changed or len(dirs) != len(cached_dirs)):
+        _save_index(index_file, index_key, dirs)
+
+    return [
+        [
+            os.path.join(root, fname)
+            for root in sorted(roots)
+            for fname in dirs[root][2]
+        ]
+        for roots in top_dirs
+    ]
+
+
+def make_dataset(
+    dir,
+    class_to_idx,
+    extensions,
+    is_valid_file=None,
+    num_workers=None,
+    index_file=None,
+):
     images = []
     dir = os.path.expanduser(dir)
 
@@ -49,16 +182,29 @@ def make_dataset(dir, class_to_idx, extensions, is_valid_file=None):
         def is_valid_file(x):
             return has_valid_extension(x, extensions)
 
-    for target in sorted(class_to_idx.keys()):
-        d = os.path.join(dir, target)
-        if not os.path.isdir(d):
-            continue
-        for root, _, fnames in sorted(os.walk(d, followlinks=True)):
-            for fname in sorted(fnames):
-                path = os.path.join(root, fname)
-                if is_valid_file(path):
-                    item = (path, class_to_idx[target])
-                    images.append(item)
+    else:
+        # a custom is_valid_file cannot be checked against the index
+        index_file = None
+
+    targets = [
+        target
+        for target in sorted(class_to_idx.keys())
+        if os.path.isdir(os.path.join(dir, target))
+    ]
+    index_key = (
+        os.path.abspath(dir),
+        tuple(targets),
+        None if extensions is None else tuple(extensions),
+    )
+    paths = _index_files(
+        [os.path.join(dir, target) for target in targets],
+        is_valid_file,
+        num_workers,
+        index_file,
+        index_key,
+    )
+    for target, target_paths in zip(targets, paths):
+        images.extend((path, class_to_idx[target]) for path in target_paths)
 
     return images
 
@@ -88,6 +234,14 @@ class DatasetFolder(Dataset):
         is_valid_file (Callable, optional): A function that takes path of a file
             and check if the file is a valid file. Both :attr:`extensions` and
             :attr:`is_valid_file` should not be passed. Default: None.
+        num_workers (int, optional): The number of threads to scan the
+            directories. If None, it is decided by
+            ``concurrent.futures.ThreadPoolExecutor``. Default: None.
+        index_file (str, optional): The path of the file to persist the
+            directory index in. If the file exists, the directories whose
+            modification time is unchanged are not scanned again, which makes
+            later constructions on the same directory much faster. The index
+            is not used with a custom :attr:`is_valid_file`. Default: None.
 
     Returns:
         :ref:`api_paddle_io_Dataset`. An instance of DatasetFolder.
@@ -211,6 +365,8 @@ class DatasetFolder(Dataset):
         extensions=None,
         transform=None,
         is_valid_file=None,
+        num_workers=None,
+        index_file=None,
     ):
         self.root = root
         self.transform = transform
@@ -218,7 +374,12 @@ class DatasetFolder(Dataset):
             extensions = IMG_EXTENSIONS
         classes, class_to_idx = self._find_classes(self.root)
         samples = make_dataset(
-            self.root, class_to_idx, extensions, is_valid_file
+            self.root,
+            class_to_idx,
+            extensions,
+            is_valid_file,
+            num_workers,
+            index_file,
         )
         if len(samples) == 0:
             raise (
@@ -328,6 +489,14 @@ class ImageFolder(Dataset):
         is_valid_file (Callable, optional): A function that takes path of a file
             and check if the file is a valid file. Both :attr:`extensions` and
             :attr:`is_valid_file` should not be passed. Default: None.
+        num_workers (int, optional): The number of threads to scan the
+            directories. If None, it is decided by
+            ``concurrent.futures.ThreadPoolExecutor``. Default: None.
+        index_file (str, optional): The path of the file to persist the
+            directory index in. If the file exists, the directories whose
+            modification time is unchanged are not scanned again, which makes
+            later constructions on the same directory much faster. The index
+            is not used with a custom :attr:`is_valid_file`. Default: None.
 
     Returns:
         :ref:`api_paddle_io_Dataset`. An instance of ImageFolder.
@@ -438,12 +607,13 @@ class ImageFolder(Dataset):
         extensions=None,
         transform=None,
         is_valid_file=None,
+        num_workers=None,
+        index_file=None,
     ):
         self.root = root
         if extensions is None:
             extensions = IMG_EXTENSIONS
 
-        samples = []
         path = os.path.expanduser(root)
 
         if extensions is not None:
@@ -451,11 +621,17 @@ class ImageFolder(Dataset):
             def is_valid_file(x):
                 return has_valid_extension(x, extensions)
 
-        for root, _, fnames in sorted(os.walk(path, followlinks=True)):
-            for fname in sorted(fnames):
-                f = os.path.join(root, fname)
-                if is_valid_file(f):
-                    samples.append(f)
+        else:
+            # a custom is_valid_file cannot be checked against the index
+            index_file = None
+
+        index_key = (
+            os.path.abspath(path),
+            None if extensions is None else tuple(extensions),
+        )
+        (samples,) = _index_files(
+            [path], is_valid_file, num_workers, index_file, index_key
+        )
 
         if len(samples) == 0:
             raise (
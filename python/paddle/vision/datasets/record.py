@@ -0,0 +1,321 @@
+# Copyright (c) 2024 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import io
+import math
+import os
+
+import numpy as np
+from PIL import Image
+
+import paddle
+from paddle.io import Dataset
+from paddle.utils import try_import
+
+__all__ = []
+
+# A shard of image records is a pair of files: ``<name>.rec`` holds the
+# encoded image bytes of the records back to back, and ``<name>.idx`` is a
+# ``.npy`` file of an int64 array of shape [N, 3], whose rows are the
+# offset, byte size and label of each record in the ``.rec`` file.
+_RECORD_SUFFIX = '.rec'
+_INDEX_SUFFIX = '.idx'
+
+
+def _index_path(record_file):
+    return record_file[: -len(_RECORD_SUFFIX)] + _INDEX_SUFFIX
+
+
+def write_image_records(samples, path_prefix, samples_per_shard=10000):
+    """
+    Packs encoded images into shards of record files, which can be read by
+    :ref:`api_paddle_vision_datasets_ImageRecordDataset`. Images are stored
+    as they are encoded on disk and are not decoded.
+
+    Args:
+        samples (Iterable[tuple[str|bytes, int]]): The (image, label) pairs
+            to pack, where image is the path of an image file or its encoded
+            bytes, e.g. the ``samples`` of
+            :ref:`api_paddle_vision_datasets_DatasetFolder`.
+        path_prefix (str): The path prefix of shards, the shard files are
+            named ``<path_prefix>-<shard_id>.rec`` and
+            ``<path_prefix>-<shard_id>.idx``.
+        samples_per_shard (int, optional): The max number of samples in each
+            shard. Default: 10000.
+
+    Returns:
+        list[str]: The paths of the written record files.
+
+    Examples:
+
+        .. code-block:: python
+
+            >>> import os
+            >>> import tempfile
+            >>> import cv2
+            >>> import numpy as np
+            >>> from paddle.vision.datasets import (
+            ...     ImageRecordDataset,
+            ...     write_image_records,
+            ... )
+
+            >>> temp_dir = tempfile.TemporaryDirectory()
+            >>> samples = []
+            >>> for i in range(4):
+            ...     path = os.path.join(temp_dir.name, f'{i}.jpg')
+            ...     image = (np.random.random((32, 32, 3)) * 255).astype('uint8')
+            ...     cv2.imwrite(path, image)
+            ...     samples.append((path, i % 2))
+            >>> record_files = write_image_records(
+            ...     samples, os.path.join(temp_dir.name, 'train'), 2
+            ... )
+            >>> print(len(record_files))
+            2
+            >>> dataset = ImageRecordDataset(record_files)
+            >>> image, label = dataset[3]
+            >>> print(image.size, label)
+            (32, 32) 1
+            >>> temp_dir.cleanup()
+    """
+    assert samples_per_shard > 0, "samples_per_shard should be positive."
+    dirname = os.path.dirname(path_prefix)
+    if dirname:
+        os.makedirs(dirname, exist_ok=True)
+
+    record_files = []
+    record_f = None
+    index = []
+    offset = 0
+
+    def close_shard():
+        record_f.close()
+        with open(_index_path(record_files[-1]), 'wb') as f:
+            np.save(f, np.array(index, dtype='int64').reshape([-1, 3]))
+
+    try:
+        for image, label in samples:
+            if record_f is None or len(index) == samples_per_shard:
+                if record_f is not None:
+                    close_shard()
+                record_files.append(
+                    f'{path_prefix}-{len(record_files):05d}{_RECORD_SUFFIX}'
+                )
+                record_f = open(record_files[-1], 'wb')
+                index = []
+                offset = 0
+            if not isinstance(image, bytes):
+                with open(image, 'rb') as f:
+                    image = f.read()
+            record_f.write(image)
+            index.append((offset, len(image), int(label)))
+            offset += len(image)
+    finally:
+        if record_f is not None:
+            close_shard()
+    return record_files
+
+
+class ImageRecordDataset(Dataset):
+    """
+    Dataset of images packed into shards of record files by
+    :ref:`api_paddle_vision_datasets_write_image_records`. Each sample is
+    read from its shard by the offset in the shard index, with one memory
+    copy from a memory map or one ``pread`` call, and decoded from the
+    buffer, so no file is opened or stated for each sample.
+
+    Args:
+        record_files (list[str]): The paths of the record files.
+        transform (Callable, optional): A function/transform that takes in
+            a sample and returns a transformed version. Default: None.
+        backend (str, optional): Specifies which type of image to be returned:
+            PIL.Image or numpy.ndarray. Should be one of {'pil', 'cv2'}.
+            If this option is not set, will get backend from :ref:`paddle.vision.get_image_backend <api_paddle_vision_get_image_backend>`,
+            default backend is 'pil'. Default: None.
+        use_mmap (bool, optional): Whether to read the records from memory
+            maps of the record files, otherwise the records are read by
+            ``os.pread``. Default: True.
+        num_replicas (int, optional): If set, the shards are split among
+            :attr:`num_replicas` ranks in round robin and only the shards of
+            :attr:`rank` are used, so that each rank only reads its own
+            shards. Ranks with fewer samples repeat their first samples, so
+            that all ranks have the same number of samples. Use it with
+            :ref:`api_paddle_io_BatchSampler` instead of
+            :ref:`api_paddle_io_DistributedBatchSampler`, which would split
+            the samples again. Default: None.
+        rank (int, optional): The rank of the current process, only used
+            when :attr:`num_replicas` is set. Default: None.
+
+    Returns:
+        :ref:`api_paddle_io_Dataset`. An instance of ImageRecordDataset.
+
+    Attributes:
+        targets (list[int]): The label of each sample in the dataset.
+
+    Examples:
+
+        .. code-block:: python
+
+            >>> import os
+            >>> import tempfile
+            >>> import cv2
+            >>> import numpy as np
+            >>> import paddle
+            >>> from paddle.vision.datasets import (
+            ...     ImageRecordDataset,
+            ...     write_image_records,
+            ... )
+
+            >>> temp_dir = tempfile.TemporaryDirectory()
+            >>> samples = []
+            >>> for i in range(8):
+            ...     image = (np.random.random((32, 32, 3)) * 255).astype('uint8')
+            ...     samples.append((cv2.imencode('.png', image)[1].tobytes(), i))
+            >>> record_files = write_image_records(
+            ...     samples, os.path.join(temp_dir.name, 'train'), 2
+            ... )
+            >>> dataset = ImageRecordDataset(
+            ...     record_files, backend='cv2', num_replicas=2, rank=1
+            ... )
+            >>> print(len(dataset), dataset.targets)
+            4 [2, 3, 6, 7]
+            >>> loader = paddle.io.DataLoader(dataset, batch_size=2)
+            >>> for images, labels in loader:
+            ...     print(images.shape)
+            ...     break
+            [2, 32, 32, 3]
+            >>> temp_dir.cleanup()
+    """
+
+    def __init__(
+        self,
+        record_files,
+        transform=None,
+        backend=None,
+        use_mmap=True,
+        num_replicas=None,
+        rank=None,
+    ):
+        if backend is None:
+            backend = paddle.vision.get_image_backend()
+        if backend not in ['pil', 'cv2']:
+            raise ValueError(
+                f"Expected backend are one of ['pil', 'cv2'], but got {backend}"
+            )
+        self.backend = backend
+        self.transform = transform
+        self.use_mmap = use_mmap
+
+        if num_replicas is not None:
+            assert (
+                rank is not None and 0 <= rank < num_replicas
+            ), "rank should be in [0, num_replicas) when num_replicas is set."
+            if len(record_files) < num_replicas:
+                raise ValueError(
+                    f"Expected at least {num_replicas} record files to split "
+                    f"among {num_replicas} ranks, but got {len(record_files)}"
+                )
+            all_indexes = [np.load(_index_path(f)) for f in record_files]
+            num_samples = max(
+                sum(len(index) for index in all_indexes[r::num_replicas])
+                for r in range(num_replicas)
+            )
+            record_files = record_files[rank::num_replicas]
+            indexes = all_indexes[rank::num_replicas]
+        else:
+            indexes = [np.load(_index_path(f)) for f in record_files]
+            num_samples = sum(len(index) for index in indexes)
+
+        self.record_files = list(record_files)
+        self.index = np.concatenate(
+            [index.reshape([-1, 3]) for index in indexes]
+        )
+        self.shard_ids = np.concatenate(
+            [
+                np.full([len(index)], i, dtype='int64')
+                for i, index in enumerate(indexes)
+            ]
+        )
+        if len(self.index) == 0:
+            raise RuntimeError("Found 0 samples in the record files.")
+        if num_samples > len(self.index):
+            repeats = math.ceil(num_samples / len(self.index))
+            self.index = np.tile(self.index, [repeats, 1])[:num_samples]
+            self.shard_ids = np.tile(self.shard_ids, repeats)[:num_samples]
+        self.targets = self.index[:, 2].tolist()
+
+        # record files are opened lazily in each process, so that they are
+        # not shared by forked DataLoader workers
+        self._pid = None
+        self._shards = None
+
+    def _get_shard(self, shard_id):
+        if self._pid != os.getpid():
+            self._pid = os.getpid()
+            self._shards = {}
+        shard = self._shards.get(shard_id, None)
+        if shard is None:
+            path = self.record_files[shard_id]
+            if self.use_mmap:
+                if os.path.getsize(path) == 0:
+                    shard = np.empty([0], dtype='uint8')
+                else:
+                    shard = np.memmap(path, dtype='uint8', mode='r')
+            else:
+                shard = os.open(path, os.O_RDONLY)
+            self._shards[shard_id] = shard
+        return shard
+
+    def _read(self, idx):
+        offset, nbytes, _ = self.index[idx]
+        shard = self._get_shard(int(self.shard_ids[idx]))
+        if self.use_mmap:
+            return shard[offset : offset + nbytes].tobytes()
+        return os.pread(shard, int(nbytes), int(offset))
+
+    def _decode(self, buffer):
+        if self.backend == 'pil':
+            return Image.open(io.BytesIO(buffer)).convert('RGB')
+        cv2 = try_import('cv2')
+        image = cv2.imdecode(
+            np.frombuffer(buffer, dtype='uint8'), cv2.IMREAD_COLOR
+        )
+        return cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
+
+    def __getitem__(self, idx):
+        """
+        Args:
+            idx (int): Index
+
+        Returns:
+            tuple: (sample, target) where target is the label of the sample.
+        """
+        sample = self._decode(self._read(idx))
+        if self.transform is not None:
+            sample = self.transform(sample)
+        return sample, self.targets[idx]
+
+    def __len__(self):
+        return len(self.index)
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state['_pid'] = None
+        state['_shards'] = None
+        return state
+
+    def __del__(self):
+        shards = getattr(self, '_shards', None)
+        if shards and self._pid == os.getpid() and not self.use_mmap:
+            for fd in shards.values():
+                os.close(fd)
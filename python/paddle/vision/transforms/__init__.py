@@ -32,6 +32,9 @@ from .functional import (
 )
 from .transforms import (
     BaseTransform,
+    BatchColorJitter,
+    BatchRandomAffine,
+    BatchRandomPerspective,
     BrightnessTransform,
     CenterCrop,
     ColorJitter,
@@ -78,6 +81,9 @@ __all__ = [
     'Grayscale',
     'ToTensor',
     'RandomErasing',
+    'BatchRandomAffine',
+    'BatchRandomPerspective',
+    'BatchColorJitter',
     'to_tensor',
     'hflip',
     'vflip',
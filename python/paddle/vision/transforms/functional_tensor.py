@@ -241,9 +241,12 @@ def _affine_grid(theta, w, h, ow, oh):
         tmp = paddle.assign(np.array([0.5 * w, 0.5 * h], dtype="float32"))
 
     scaled_theta = theta.transpose((0, 2, 1)) / tmp
-    output_grid = base_grid.reshape((1, oh * ow, 3)).bmm(scaled_theta)
+    # theta of shape [N, 2, 3] gives a grid for each of N images
+    output_grid = paddle.matmul(
+        base_grid.reshape((1, oh * ow, 3)), scaled_theta
+    )
 
-    return output_grid.reshape((1, oh, ow, 2))
+    return output_grid.reshape((theta.shape[0], oh, ow, 2))
 
 
 def _grid_transform(img, grid, mode, fill):
@@ -337,6 +340,97 @@ def affine(img, matrix, interpolation="nearest", fill=None, data_format='CHW'):
     return out
 
 
+def _get_batch_affine_matrix(center, angle, translate, scale, shear):
+    # Vectorized version of _get_affine_matrix in functional.py, angle and
+    # scale are of shape [N], translate and shear are of shape [N, 2].
+    rot = np.radians(angle)
+    sx = np.radians(shear[:, 0])
+    sy = np.radians(shear[:, 1])
+
+    a = np.cos(rot - sy) / np.cos(sy)
+    b = -np.cos(rot - sy) * np.tan(sx) / np.cos(sy) - np.sin(rot)
+    c = np.sin(rot - sy) / np.cos(sy)
+    d = -np.sin(rot - sy) * np.tan(sx) / np.cos(sy) + np.cos(rot)
+
+    cx, cy = center
+    tx, ty = translate[:, 0], translate[:, 1]
+
+    zeros = np.zeros_like(a)
+    matrix = np.stack([d, -b, zeros, -c, a, zeros], axis=1)
+    matrix = matrix / scale[:, None]
+    matrix[:, 2] += matrix[:, 0] * (-cx - tx) + matrix[:, 1] * (-cy - ty) + cx
+    matrix[:, 5] += matrix[:, 3] * (-cx - tx) + matrix[:, 4] * (-cy - ty) + cy
+    return matrix
+
+
+def _prepare_batch_affine_matrix(
+    n, w, h, angle, translate, scale, shear, center=None
+):
+    angle = np.asarray(angle, dtype='float64').reshape([n])
+    translate = np.asarray(translate, dtype='float64').reshape([n, 2])
+    scale = np.asarray(scale, dtype='float64').reshape([n])
+    shear = np.asarray(shear, dtype='float64').reshape([n, 2])
+
+    center_f = [0.0, 0.0]
+    if center is not None:
+        center_f = [1.0 * (p - s * 0.5) for p, s in zip(center, [w, h])]
+    return _get_batch_affine_matrix(center_f, angle, translate, scale, shear)
+
+
+def batch_affine(
+    img,
+    angle,
+    translate,
+    scale,
+    shear,
+    interpolation="nearest",
+    fill=None,
+    center=None,
+):
+    """Affine to a batch of images with different parameters for each image,
+    by a single ``grid_sample``. It is the same as calling ``affine`` of
+    ``paddle.vision.transforms.functional`` on each image.
+
+    Args:
+        img (paddle.Tensor): Images of shape (N, C, H, W).
+        angle (list|numpy.ndarray): Rotation angles in degrees of shape (N,).
+        translate (list|numpy.ndarray): Translations of shape (N, 2).
+        scale (list|numpy.ndarray): Scales of shape (N,).
+        shear (list|numpy.ndarray): Shear angles in degrees of shape (N, 2).
+        interpolation (str, optional): Interpolation method, "nearest" or
+            "bilinear". Default: "nearest".
+        fill (int|list|tuple, optional): Pixel fill value for the area outside
+            the transformed images. If int, it is used for all channels.
+            Default: None.
+        center (2-tuple, optional): Center of rotation. Origin is the upper
+            left corner. Default is the center of the images.
+
+    Returns:
+        paddle.Tensor: Affined images.
+
+    """
+    if img.ndim != 4:
+        raise RuntimeError(
+            f'not support [ndim={img.ndim}] paddle images, should be (N, C, H, W)'
+        )
+    n, c, h, w = img.shape
+    matrix = _prepare_batch_affine_matrix(
+        n, w, h, angle, translate, scale, shear, center
+    )
+
+    dtype = img.dtype
+    if not paddle.is_floating_point(img):
+        img = img.astype(paddle.float32)
+    matrix = paddle.to_tensor(matrix, place=img.place).astype(img.dtype)
+    grid = _affine_grid(matrix.reshape((n, 2, 3)), w=w, h=h, ow=w, oh=h)
+
+    if isinstance(fill, numbers.Number):
+        fill = tuple([fill] * c)
+
+    out = _grid_transform(img, grid, mode=interpolation, fill=fill)
+    return out.astype(dtype) if out.dtype != dtype else out
+
+
 def rotate(
     img,
     angle,
@@ -492,10 +586,13 @@ def rotate(
 
 
 def _perspective_grid(img, coeffs, ow, oh, dtype):
-    theta1 = coeffs[:6].reshape([1, 2, 3])
-    tmp = paddle.tile(coeffs[6:].reshape([1, 2]), repeat_times=[2, 1])
-    dummy = paddle.ones((2, 1), dtype=dtype)
-    theta2 = paddle.concat((tmp, dummy), axis=1).unsqueeze(0)
+    # coeffs of shape [8] or [N, 8] gives a grid for each of N images
+    coeffs = coeffs.reshape([-1, 8])
+    n = coeffs.shape[0]
+    theta1 = coeffs[:, :6].reshape([n, 2, 3])
+    tmp = paddle.tile(coeffs[:, 6:].reshape([n, 1, 2]), repeat_times=[1, 2, 1])
+    dummy = paddle.ones((n, 2, 1), dtype=dtype)
+    theta2 = paddle.concat((tmp, dummy), axis=2)
 
     d = 0.5
     base_grid = paddle.ones((1, oh, ow, 3), dtype=dtype)
@@ -508,13 +605,12 @@ def _perspective_grid(img, coeffs, ow, oh, dtype):
     scaled_theta1 = theta1.transpose((0, 2, 1)) / paddle.to_tensor(
         [0.5 * ow, 0.5 * oh]
     )
-    output_grid1 = base_grid.reshape((1, oh * ow, 3)).bmm(scaled_theta1)
-    output_grid2 = base_grid.reshape((1, oh * ow, 3)).bmm(
-        theta2.transpose((0, 2, 1))
-    )
+    base_grid = base_grid.reshape((1, oh * ow, 3))
+    output_grid1 = paddle.matmul(base_grid, scaled_theta1)
+    output_grid2 = paddle.matmul(base_grid, theta2.transpose((0, 2, 1)))
 
     output_grid = output_grid1 / output_grid2 - 1.0
-    return output_grid.reshape((1, oh, ow, 2))
+    return output_grid.reshape((n, oh, ow, 2))
 
 
 def perspective(
@@ -557,6 +653,93 @@ def perspective(
     return out
 
 
+def _get_batch_perspective_coeffs(startpoints, endpoints):
+    # Vectorized version of _get_perspective_coeffs in functional.py,
+    # startpoints and endpoints are of shape [N, 4, 2].
+    n = startpoints.shape[0]
+    x, y = endpoints[..., 0], endpoints[..., 1]
+    u, v = startpoints[..., 0], startpoints[..., 1]
+    ones = np.ones_like(x)
+    zeros = np.zeros_like(x)
+
+    row_u = np.stack([x, y, ones, zeros, zeros, zeros, -u * x, -u * y], -1)
+    row_v = np.stack([zeros, zeros, zeros, x, y, ones, -v * x, -v * y], -1)
+    a_matrix = np.stack([row_u, row_v], axis=2).reshape([n, 8, 8])
+    b_matrix = startpoints.reshape([n, 8, 1])
+    return np.linalg.solve(a_matrix, b_matrix).reshape([n, 8])
+
+
+def batch_perspective(
+    img,
+    startpoints,
+    endpoints,
+    interpolation="nearest",
+    fill=None,
+    affine=None,
+):
+    """Perspective to a batch of images with different coefficients for each
+    image, by a single ``grid_sample``. It is the same as calling
+    ``perspective`` of ``paddle.vision.transforms.functional`` on each image.
+
+    Args:
+        img (paddle.Tensor): Images of shape (N, C, H, W).
+        startpoints (list|numpy.ndarray): [top-left, top-right, bottom-right,
+            bottom-left] of the original images, of shape (N, 4, 2).
+        endpoints (list|numpy.ndarray): [top-left, top-right, bottom-right,
+            bottom-left] of the transformed images, of shape (N, 4, 2).
+        interpolation (str, optional): Interpolation method, "nearest" or
+            "bilinear". Default: "nearest".
+        fill (int|list|tuple, optional): Pixel fill value for the area outside
+            the transformed images. If int, it is used for all channels.
+            Default: None.
+        affine (dict, optional): ``angle``, ``translate``, ``scale``, ``shear``
+            and optional ``center`` of ``batch_affine``. If given, the images
+            are affined before the perspective transformation, and the two
+            transformations are composed into the same ``grid_sample``.
+            Default: None.
+
+    Returns:
+        paddle.Tensor: Perspectived images.
+
+    """
+    if img.ndim != 4:
+        raise RuntimeError(
+            f'not support [ndim={img.ndim}] paddle images, should be (N, C, H, W)'
+        )
+    n, c, h, w = img.shape
+    startpoints = np.asarray(startpoints, dtype='float64').reshape([n, 4, 2])
+    endpoints = np.asarray(endpoints, dtype='float64').reshape([n, 4, 2])
+    coeffs = _get_batch_perspective_coeffs(startpoints, endpoints)
+
+    if affine is not None:
+        # both transformations map output pixels to input pixels, so the
+        # composed one is the affine matrix (moved from image center based
+        # to pixel coordinates) multiplied by the perspective matrix
+        matrix = _prepare_batch_affine_matrix(n, w, h, **affine)
+        matrix = np.concatenate(
+            [matrix, np.tile([0.0, 0.0, 1.0], [n, 1])], axis=1
+        ).reshape([n, 3, 3])
+        shift = np.array([[1.0, 0.0, 0.5 * w], [0.0, 1.0, 0.5 * h], [0, 0, 1]])
+        matrix = shift @ matrix @ np.linalg.inv(shift)
+        homography = np.concatenate([coeffs, np.ones([n, 1])], axis=1)
+        homography = matrix @ homography.reshape([n, 3, 3])
+        # the last row of affine matrix is (0, 0, 1), so the last element
+        # of the composed matrix is still 1
+        coeffs = homography.reshape([n, 9])[:, :8]
+
+    dtype = img.dtype
+    if not paddle.is_floating_point(img):
+        img = img.astype(paddle.float32)
+    coeffs = paddle.to_tensor(coeffs, place=img.place).astype(img.dtype)
+    grid = _perspective_grid(img, coeffs, ow=w, oh=h, dtype=img.dtype)
+
+    if isinstance(fill, numbers.Number):
+        fill = tuple([fill] * c)
+
+    out = _grid_transform(img, grid, mode=interpolation, fill=fill)
+    return out.astype(dtype) if out.dtype != dtype else out
+
+
 def vflip(img, data_format='CHW'):
     """Vertically flips the given paddle tensor.
 
@@ -955,3 +1138,89 @@ def adjust_hue(img, hue_factor):
         raise ValueError("channels of input should be either 1 or 3.")
 
     return img_adjusted
+
+
+def _batch_factor(factor, img):
+    return paddle.to_tensor(
+        np.asarray(factor, dtype='float32').reshape([-1, 1, 1, 1]),
+        place=img.place,
+    ).astype(img.dtype)
+
+
+def batch_adjust_color(
+    img,
+    brightness_factor=None,
+    contrast_factor=None,
+    saturation_factor=None,
+    hue_factor=None,
+):
+    """Adjusts brightness, contrast, saturation and hue of a batch of images
+    in this order, with different factors for each image. The images are
+    converted to HSV once for all images to adjust hue. Each adjustment is
+    the same as the ``adjust_*`` function of this module, except that uint8
+    images are adjusted in float32 and converted back once at the end.
+
+    Args:
+        img (paddle.Tensor): Images of shape (N, C, H, W), C should be 1 or 3.
+        brightness_factor (list|numpy.ndarray, optional): Brightness factors
+            of shape (N,). If None, brightness is not adjusted. Default: None.
+        contrast_factor (list|numpy.ndarray, optional): Contrast factors of
+            shape (N,). If None, contrast is not adjusted. Default: None.
+        saturation_factor (list|numpy.ndarray, optional): Saturation factors
+            of shape (N,). If None, saturation is not adjusted. Default: None.
+        hue_factor (list|numpy.ndarray, optional): Hue factors in
+            [-0.5, 0.5] of shape (N,). If None, hue is not adjusted.
+            Default: None.
+
+    Returns:
+        paddle.Tensor: Color adjusted images.
+
+    """
+    if img.ndim != 4:
+        raise RuntimeError(
+            f'not support [ndim={img.ndim}] paddle images, should be (N, C, H, W)'
+        )
+    channels = img.shape[1]
+    if channels not in [1, 3]:
+        raise ValueError("channels of input should be either 1 or 3.")
+
+    dtype = img.dtype
+    max_value = 1.0 if paddle.is_floating_point(img) else 255.0
+    if not paddle.is_floating_point(img):
+        img = img.astype(paddle.float32)
+
+    def gray(img):
+        if channels == 1:
+            return img
+        rgb_weights = paddle.to_tensor(
+            [0.2989, 0.5870, 0.1140], place=img.place
+        ).astype(img.dtype)
+        return (img * rgb_weights.reshape((1, -1, 1, 1))).sum(
+            axis=1, keepdim=True
+        )
+
+    def blend(img, extreme_target, factor):
+        ratio = _batch_factor(factor, img)
+        return (extreme_target + ratio * (img - extreme_target)).clip(
+            0, max_value
+        )
+
+    if brightness_factor is not None:
+        img = blend(img, paddle.zeros_like(img), brightness_factor)
+
+    if contrast_factor is not None:
+        img = blend(
+            img, gray(img).mean(axis=(1, 2, 3), keepdim=True), contrast_factor
+        )
+
+    if channels == 3 and saturation_factor is not None:
+        img = blend(img, gray(img), saturation_factor)
+
+    if channels == 3 and hue_factor is not None:
+        img_hsv = _rgb_to_hsv(img / max_value)
+        h, s, v = img_hsv.unbind(axis=-3)
+        h = h + _batch_factor(hue_factor, h).reshape([-1, 1, 1])
+        h = h - h.floor()
+        img = _hsv_to_rgb(paddle.stack([h, s, v], axis=-3)) * max_value
+
+    return img.astype(dtype) if img.dtype != dtype else img
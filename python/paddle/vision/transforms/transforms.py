@@ -22,7 +22,7 @@ import numpy as np
 
 import paddle
 
-from . import functional as F
+from . import functional as F, functional_tensor as F_t
 
 __all__ = []
 
@@ -1154,6 +1154,83 @@ class ColorJitter(BaseTransform):
         return transform(img)
 
 
+class BatchColorJitter(ColorJitter):
+    """Randomly change the brightness, contrast, saturation and hue of a batch
+    of images, with different random factors for each image.
+
+    The factors are chosen in the same way as :ref:`api_paddle_vision_transforms_ColorJitter`,
+    but the adjustments are applied in the fixed order of brightness, contrast,
+    saturation and hue, to the whole batch at once with a few tensor operations.
+    It can be used on batches after collating, e.g. on GPU, instead of on each
+    sample in DataLoader workers.
+
+    Args:
+        brightness (float, optional): How much to jitter brightness.
+            Chosen uniformly from [max(0, 1 - brightness), 1 + brightness]. Should be non negative numbers. Default: 0.
+        contrast (float, optional): How much to jitter contrast.
+            Chosen uniformly from [max(0, 1 - contrast), 1 + contrast]. Should be non negative numbers. Default: 0.
+        saturation (float, optional): How much to jitter saturation.
+            Chosen uniformly from [max(0, 1 - saturation), 1 + saturation]. Should be non negative numbers. Default: 0.
+        hue (float, optional): How much to jitter hue.
+            Chosen uniformly from [-hue, hue]. Should have 0<= hue <= 0.5. Default: 0.
+        keys (list[str]|tuple[str], optional): Same as ``BaseTransform``. Default: None.
+
+    Shape:
+        - img(Paddle.Tensor): The input images with shape (N x C x H x W).
+        - output(Paddle.Tensor): Color jittered images.
+
+    Returns:
+        A callable object of BatchColorJitter.
+
+    Examples:
+
+        .. code-block:: python
+
+            >>> import paddle
+            >>> from paddle.vision.transforms import BatchColorJitter
+
+            >>> transform = BatchColorJitter(0.4, 0.4, 0.4, 0.4)
+            >>> fake_img = paddle.rand((8, 3, 224, 224))
+            >>> fake_img = transform(fake_img)
+            >>> print(fake_img.shape)
+            [8, 3, 224, 224]
+
+    """
+
+    def __init__(
+        self, brightness=0, contrast=0, saturation=0, hue=0, keys=None
+    ):
+        super().__init__(brightness, contrast, saturation, hue, keys)
+        self.brightness_range = _check_input(brightness, 'brightness')
+        self.contrast_range = _check_input(contrast, 'contrast')
+        self.saturation_range = _check_input(saturation, 'saturation')
+        self.hue_range = _check_input(
+            hue, 'hue', center=0, bound=(-0.5, 0.5), clip_first_on_zero=False
+        )
+
+    def _get_params(self, inputs):
+        image = inputs[self.keys.index('image')]
+        n = image.shape[0]
+        params = {}
+        for name in ['brightness', 'contrast', 'saturation', 'hue']:
+            value = getattr(self, name + '_range')
+            params[name] = (
+                None
+                if value is None
+                else np.random.uniform(value[0], value[1], n)
+            )
+        return params
+
+    def _apply_image(self, img):
+        return F_t.batch_adjust_color(
+            img,
+            self.params['brightness'],
+            self.params['contrast'],
+            self.params['saturation'],
+            self.params['hue'],
+        )
+
+
 class RandomCrop(BaseTransform):
     """Crops the given CV Image at a random location.
 
@@ -1547,6 +1624,118 @@ class RandomAffine(BaseTransform):
         )
 
 
+class BatchRandomAffine(RandomAffine):
+    """Random affine transformation of a batch of images, with different
+    random parameters for each image.
+
+    The parameters are chosen in the same way as :ref:`api_paddle_vision_transforms_RandomAffine`,
+    and the whole batch is transformed by a single ``grid_sample``. It can be
+    used on batches after collating, e.g. on GPU, instead of on each sample in
+    DataLoader workers.
+
+    Args:
+        degrees (int|float|tuple): The angle interval of the random rotation.
+            If set as a number instead of sequence like (min, max), the range of degrees
+            will be (-degrees, +degrees) in clockwise order. If set 0, will not rotate.
+        translate (tuple, optional): Maximum absolute fraction for horizontal and vertical translations.
+            For example translate=(a, b), then horizontal shift is randomly sampled in the range -img_width * a < dx < img_width * a
+            and vertical shift is randomly sampled in the range -img_height * b < dy < img_height * b.
+            Default is None, will not translate.
+        scale (tuple, optional): Scaling factor interval, e.g (a, b), then scale is randomly sampled from the range a <= scale <= b.
+            Default is None, will keep original scale and not scale.
+        shear (sequence or number, optional): Range of degrees to shear, ranges from -180 to 180 in clockwise order.
+            If set as a number, a shear parallel to the x axis in the range (-shear, +shear) will be applied.
+            Else if set as a sequence of 2 values a shear parallel to the x axis in the range (shear[0], shear[1]) will be applied.
+            Else if set as a sequence of 4 values, a x-axis shear in (shear[0], shear[1]) and y-axis shear in (shear[2], shear[3]) will be applied.
+            Default is None, will not apply shear.
+        interpolation (str, optional): Interpolation method, "nearest" or "bilinear". Default: "nearest".
+        fill (int|list|tuple, optional): Pixel fill value for the area outside the transformed
+            image. If given a number, the value is used for all bands respectively.
+        center (2-tuple, optional): Optional center of rotation, (x, y).
+            Origin is the upper left corner.
+            Default is the center of the image.
+        keys (list[str]|tuple[str], optional): Same as ``BaseTransform``. Default: None.
+
+    Shape:
+        - img(Paddle.Tensor): The input images with shape (N x C x H x W).
+        - output(Paddle.Tensor): Affined images.
+
+    Returns:
+        A callable object of BatchRandomAffine.
+
+    Examples:
+
+        .. code-block:: python
+
+            >>> import paddle
+            >>> from paddle.vision.transforms import BatchRandomAffine
+
+            >>> transform = BatchRandomAffine([-90, 90], translate=[0.2, 0.2], scale=[0.5, 1.5], shear=[-10, 10])
+            >>> fake_img = paddle.randn((8, 3, 256, 300)).astype(paddle.float32)
+            >>> fake_img = transform(fake_img)
+            >>> print(fake_img.shape)
+            [8, 3, 256, 300]
+    """
+
+    def __init__(
+        self,
+        degrees,
+        translate=None,
+        scale=None,
+        shear=None,
+        interpolation='nearest',
+        fill=0,
+        center=None,
+        keys=None,
+    ):
+        super().__init__(
+            degrees, translate, scale, shear, interpolation, fill, center, keys
+        )
+        assert interpolation in [
+            'nearest',
+            'bilinear',
+        ], "BatchRandomAffine only supports nearest and bilinear interpolation."
+
+    def _get_params(self, inputs):
+        image = inputs[self.keys.index('image')]
+        n, _, h, w = image.shape
+        params = {}
+        params['angle'] = np.random.uniform(self.degrees[0], self.degrees[1], n)
+
+        translate = np.zeros([n, 2])
+        if self.translate is not None:
+            max_dx = float(self.translate[0] * w)
+            max_dy = float(self.translate[1] * h)
+            translate[:, 0] = np.random.uniform(-max_dx, max_dx, n)
+            translate[:, 1] = np.random.uniform(-max_dy, max_dy, n)
+        params['translate'] = np.trunc(translate)
+
+        if self.scale is not None:
+            params['scale'] = np.random.uniform(self.scale[0], self.scale[1], n)
+        else:
+            params['scale'] = np.ones([n])
+
+        shear = np.zeros([n, 2])
+        if self.shear is not None:
+            shear[:, 0] = np.random.uniform(self.shear[0], self.shear[1], n)
+            if len(self.shear) == 4:
+                shear[:, 1] = np.random.uniform(self.shear[2], self.shear[3], n)
+        params['shear'] = shear
+        return params
+
+    def _apply_image(self, img):
+        return F_t.batch_affine(
+            img,
+            self.params['angle'],
+            self.params['translate'],
+            self.params['scale'],
+            self.params['shear'],
+            interpolation=self.interpolation,
+            fill=self.fill,
+            center=self.center,
+        )
+
+
 class RandomRotation(BaseTransform):
     """Rotates the image by angle.
 
@@ -1785,6 +1974,111 @@ class RandomPerspective(BaseTransform):
         return img
 
 
+class BatchRandomPerspective(RandomPerspective):
+    """Random perspective transformation of a batch of images with a given
+    probability, with different random parameters for each image.
+
+    The parameters are chosen in the same way as :ref:`api_paddle_vision_transforms_RandomPerspective`,
+    and the whole batch is transformed by a single ``grid_sample``. It can be
+    used on batches after collating, e.g. on GPU, instead of on each sample in
+    DataLoader workers.
+
+    Args:
+        prob (float, optional): Probability of using transformation for each
+            image, ranges from 0 to 1, default is 0.5.
+        distortion_scale (float, optional): Degree of distortion, ranges from
+            0 to 1, default is 0.5.
+        interpolation (str, optional): Interpolation method, "nearest" or "bilinear". Default: "nearest".
+        fill (int|list|tuple, optional): Pixel fill value for the area outside the transformed
+            image. If given a number, the value is used for all bands respectively.
+        affine (BatchRandomAffine, optional): If given, the images are randomly affined by it
+            before the perspective transformation, and the two transformations are composed
+            into the same ``grid_sample``, the ``interpolation`` and ``fill`` of ``affine``
+            are ignored. Default: None.
+        keys (list[str]|tuple[str], optional): Same as ``BaseTransform``. Default: None.
+
+    Shape:
+        - img(Paddle.Tensor): The input images with shape (N x C x H x W).
+        - output(Paddle.Tensor): Perspectived images.
+
+    Returns:
+        A callable object of BatchRandomPerspective.
+
+    Examples:
+
+        .. code-block:: python
+
+            >>> import paddle
+            >>> from paddle.vision.transforms import BatchRandomAffine, BatchRandomPerspective
+
+            >>> affine = BatchRandomAffine([-30, 30], scale=[0.8, 1.2])
+            >>> transform = BatchRandomPerspective(prob=0.5, distortion_scale=0.5, affine=affine)
+            >>> fake_img = paddle.randn((8, 3, 200, 150)).astype(paddle.float32)
+            >>> fake_img = transform(fake_img)
+            >>> print(fake_img.shape)
+            [8, 3, 200, 150]
+    """
+
+    def __init__(
+        self,
+        prob=0.5,
+        distortion_scale=0.5,
+        interpolation='nearest',
+        fill=0,
+        affine=None,
+        keys=None,
+    ):
+        super().__init__(prob, distortion_scale, interpolation, fill, keys)
+        assert interpolation in [
+            'nearest',
+            'bilinear',
+        ], "BatchRandomPerspective only supports nearest and bilinear interpolation."
+        assert affine is None or isinstance(
+            affine, BatchRandomAffine
+        ), "affine should be an instance of BatchRandomAffine."
+        self.affine = affine
+
+    def _get_params(self, inputs):
+        image = inputs[self.keys.index('image')]
+        n, _, h, w = image.shape
+        max_dx = int(self.distortion_scale * (w // 2))
+        max_dy = int(self.distortion_scale * (h // 2))
+
+        # [top-left, top-right, bottom-right, bottom-left] as get_params
+        startpoints = np.array(
+            [[0, 0], [w - 1, 0], [w - 1, h - 1], [0, h - 1]], dtype='float64'
+        )
+        startpoints = np.tile(startpoints, [n, 1, 1])
+        endpoints = np.empty([n, 4, 2])
+        endpoints[:, [0, 3], 0] = np.random.uniform(0, max_dx + 1, [n, 2])
+        endpoints[:, [1, 2], 0] = np.random.uniform(w - max_dx - 1, w, [n, 2])
+        endpoints[:, [0, 1], 1] = np.random.uniform(0, max_dy + 1, [n, 2])
+        endpoints[:, [2, 3], 1] = np.random.uniform(h - max_dy - 1, h, [n, 2])
+        endpoints = np.trunc(endpoints)
+
+        # images which are not transformed keep the original corners
+        apply = np.random.random(n) < self.prob
+        params = {}
+        params['startpoints'] = startpoints
+        params['endpoints'] = np.where(
+            apply[:, None, None], endpoints, startpoints
+        )
+        if self.affine is not None:
+            params['affine'] = self.affine._get_params(inputs)
+            params['affine']['center'] = self.affine.center
+        return params
+
+    def _apply_image(self, img):
+        return F_t.batch_perspective(
+            img,
+            self.params['startpoints'],
+            self.params['endpoints'],
+            interpolation=self.interpolation,
+            fill=self.fill,
+            affine=self.params.get('affine'),
+        )
+
+
 class Grayscale(BaseTransform):
     """Converts image to grayscale.
 
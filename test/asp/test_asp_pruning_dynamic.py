@@ -54,6 +54,7 @@ class TestASPDynamicPruningBase(unittest.TestCase):
             stop_gradient=False,
         )
 
+        self.num_workers = 1
         self.set_config()
 
     def set_config(self):
@@ -73,7 +74,10 @@ class TestASPDynamicPruningBase(unittest.TestCase):
 
     def __pruning_and_checking(self, with_mask):
         paddle.incubate.asp.prune_model(
-            self.layer, mask_algo=self.mask_gen_func, with_mask=with_mask
+            self.layer,
+            mask_algo=self.mask_gen_func,
+            with_mask=with_mask,
+            num_workers=self.num_workers,
         )
 
         for param in self.layer.parameters():
@@ -113,5 +117,33 @@ class TestASPDynamicPruning2DGreedy(TestASPDynamicPruningBase):
         self.mask_check_func = paddle.incubate.asp.CheckMethod.CHECK_2D
 
 
+class TestASPDynamicPruning2DBestParallel(TestASPDynamicPruningBase):
+    def set_config(self):
+        self.mask_gen_func = 'mask_2d_best'
+        self.mask_check_func = paddle.incubate.asp.CheckMethod.CHECK_2D
+        self.num_workers = 2
+
+    def test_same_as_serial(self):
+        serial_layer = MyLayer()
+        serial_layer.set_state_dict(self.layer.state_dict())
+        masks = paddle.incubate.asp.prune_model(
+            self.layer,
+            mask_algo=self.mask_gen_func,
+            with_mask=False,
+            num_workers=self.num_workers,
+        )
+        serial_masks = paddle.incubate.asp.prune_model(
+            serial_layer, mask_algo=self.mask_gen_func, with_mask=False
+        )
+        for param, serial_param in zip(
+            self.layer.parameters(), serial_layer.parameters()
+        ):
+            np.testing.assert_array_equal(param.numpy(), serial_param.numpy())
+            if param.name in masks:
+                np.testing.assert_array_equal(
+                    masks[param.name], serial_masks[serial_param.name]
+                )
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -121,6 +121,18 @@ class TestASPUtils(unittest.TestCase):
             x = paddle.incubate.asp.get_mask_2d_best(x, 2, 4)
             self.assertTrue(paddle.incubate.asp.check_mask_2d(x, 2, 4))
 
+    def test_reshape_2d(self):
+        x = np.arange(42).reshape(6, 7)
+        x_flattern, shape = paddle.incubate.asp.utils._reshape_2d(x, 4)
+        self.assertEqual(shape, (8, 8))
+        np.testing.assert_array_equal(
+            x_flattern[1],
+            [4, 5, 6, 0, 11, 12, 13, 0, 18, 19, 20, 0, 25, 26, 27, 0],
+        )
+        x_padded = paddle.incubate.asp.utils._unreshape_2d(x_flattern, shape, 4)
+        np.testing.assert_array_equal(x_padded[:6, :7], x)
+        self.assertEqual(np.count_nonzero(x_padded[6:]), 0)
+
     def test_threadsafe_valid_2d_patterns(self):
         def get_reference(m=4, n=2):
             from itertools import permutations
@@ -28,13 +28,19 @@ def get_global_state_dict():
 class TestSaveStateDict:
     def __init__(self):
         self._ckpt_path = os.getenv("ckpt_path")
+        num_io_threads = os.getenv("num_io_threads")
+        self._num_io_threads = (
+            int(num_io_threads) if num_io_threads is not None else None
+        )
 
     def test_save_state_dict_with_one_device(self):
         global_state_dict = get_global_state_dict()
         keys = list(global_state_dict.keys())
         w1, w2 = list(global_state_dict.values())
         state_dict = dict(zip(keys, [w1, w2]))
-        save_state_dict(state_dict, self._ckpt_path)
+        save_state_dict(
+            state_dict, self._ckpt_path, num_io_threads=self._num_io_threads
+        )
 
     def test_save_state_dict_with_four_devices(self):
         global_state_dict = get_global_state_dict()
@@ -49,7 +55,9 @@ class TestSaveStateDict:
             w2, mesh2, [dist.Shard(0), dist.Replicate()]
         )
         state_dict = dict(zip(keys, [sharded_w1, sharded_w2]))
-        save_state_dict(state_dict, self._ckpt_path)
+        save_state_dict(
+            state_dict, self._ckpt_path, num_io_threads=self._num_io_threads
+        )
 
     def run_test_case(self):
         device_num = int(os.getenv("device_num"))
@@ -73,6 +73,35 @@ class TestSaveLoadStateDict(test_base.CommunicationTestDistBase):
             )
         ckpt_path.cleanup()
 
+    def test_save_load_state_dict_with_io_threads(self):
+        # save with 4 devices into flat tensor files by 2 io threads
+        ckpt_path = tempfile.TemporaryDirectory()
+        super().setUp(num_of_devices=4, timeout=120, nnode=1)
+        self.run_test_case(
+            "save_state_dict.py",
+            user_defined_envs={
+                "device_num": "4",
+                "ckpt_path": ckpt_path.name,
+                "num_io_threads": "2",
+            },
+        )
+        # load with 1, 2, 4, 8 devices
+        envs_list = test_base.gen_product_envs_list(
+            self._default_envs, self._changeable_envs
+        )
+        for envs in envs_list:
+            envs["ckpt_path"] = ckpt_path.name
+            super().setUp(
+                num_of_devices=int(envs["device_num"]),
+                timeout=180,
+                nnode=1,
+            )
+            self.run_test_case(
+                "load_state_dict.py",
+                user_defined_envs=envs,
+            )
+        ckpt_path.cleanup()
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,117 @@
+# Copyright (c) 2024 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+import numpy as np
+from dygraph_to_static_utils import (
+    Dy2StTestBase,
+    test_ast_only,
+    test_legacy_only,
+)
+
+import paddle
+from paddle.jit.dy2static.persistent_cache import (
+    ENV_PERSISTENT_CACHE_DIR,
+    _function_fingerprint,
+    set_persistent_cache_key,
+)
+from paddle.jit.dy2static.program_translator import ConcreteProgram
+from paddle.utils.environments import EnvironmentVariableGuard
+
+
+class SimpleNet(paddle.nn.Layer):
+    def __init__(self):
+        super().__init__()
+        self.linear = paddle.nn.Linear(10, 3)
+        self.norm = paddle.nn.BatchNorm1D(3)
+
+    def forward(self, x):
+        out = self.norm(self.linear(x))
+        return paddle.nn.functional.relu(out), out.mean()
+
+
+def make_closure(value):
+    def closure_fn(x):
+        return x + value
+
+    return closure_fn
+
+
+def plain_fn(x):
+    return x + 1
+
+
+class TestPersistentProgramCache(Dy2StTestBase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.data = np.random.random((4, 10)).astype('float32')
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    @test_legacy_only
+    @test_ast_only
+    def test_load_from_persistent_cache(self):
+        with EnvironmentVariableGuard(
+            ENV_PERSISTENT_CACHE_DIR, self.temp_dir.name
+        ):
+            net = SimpleNet()
+            # the function not opted in is not saved
+            paddle.jit.to_static(plain_fn)(paddle.to_tensor(self.data))
+            self.assertEqual(os.listdir(self.temp_dir.name), [])
+
+            set_persistent_cache_key(net.forward, "simple_net_v1")
+            static_net = paddle.jit.to_static(net)
+            static_net.eval()
+            x = paddle.to_tensor(self.data)
+            expected = static_net(x)
+            cache_files = os.listdir(self.temp_dir.name)
+            self.assertEqual(len(cache_files), 1)
+            self.assertTrue(cache_files[0].endswith('.pdcache'))
+
+            # simulate a warm restart, the program should not be traced again
+            static_net.forward.program_cache._caches.clear()
+            with patch.object(
+                ConcreteProgram,
+                'from_func_spec',
+                side_effect=AssertionError("program should be loaded"),
+            ):
+                out = static_net(x)
+            for o, e in zip(out, expected):
+                np.testing.assert_allclose(o.numpy(), e.numpy(), rtol=1e-05)
+
+            # different input shape misses the persistent cache
+            static_net(paddle.to_tensor(self.data[:2]))
+            self.assertEqual(len(os.listdir(self.temp_dir.name)), 2)
+
+    def test_function_fingerprint(self):
+        self.assertIsNone(_function_fingerprint(plain_fn))
+        fn_1 = make_closure(1)
+        fn_2 = make_closure(2)
+        set_persistent_cache_key(fn_1, "closure_1")
+        set_persistent_cache_key(fn_2, "closure_2")
+        self.assertIsNotNone(_function_fingerprint(fn_1))
+        self.assertNotEqual(
+            _function_fingerprint(fn_1), _function_fingerprint(fn_2)
+        )
+        with self.assertRaises(TypeError):
+            set_persistent_cache_key(plain_fn, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -85,6 +85,16 @@ class TestAudioBackends(unittest.TestCase):
             waveform = waveform.T
             np.testing.assert_array_almost_equal(wav_data, waveform)
 
+        # test backends(wave_backend) partial load
+        wav_data, sr = paddle.audio.load(
+            wave_wav_path, frame_offset=1000, num_frames=2000
+        )
+        full_data, _ = paddle.audio.load(wave_wav_path)
+        self.assertEqual(wav_data.shape, [self.num_channels, 2000])
+        np.testing.assert_array_equal(wav_data, full_data[:, 1000:3000])
+        wav_data, sr = paddle.audio.load(wave_wav_path, frame_offset=7000)
+        np.testing.assert_array_equal(wav_data, full_data[:, 7000:])
+
         current_backend = paddle.audio.backends.get_current_backend()
         self.assertTrue(
             current_backend in ["wave_backend", "soundfile", "sox_io"]
@@ -12,7 +12,10 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 import itertools
+import os
+import tempfile
 import unittest
+import unittest.mock
 
 import numpy as np
 from parameterized import parameterized
@@ -116,5 +119,97 @@ class TestAudioDatasets(unittest.TestCase):
         self.assertTrue(0 <= elem[1] <= 2)
 
 
+class TestAudioClassificationDataset(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.sr = 16000
+        self.files = []
+        for i, num_frames in enumerate([8000, 8000, 6000]):
+            path = os.path.join(self.temp_dir.name, f'{i}.wav')
+            waveform = paddle.to_tensor(
+                np.random.uniform(-0.5, 0.5, [1, num_frames]).astype('float32')
+            )
+            paddle.audio.save(path, waveform, self.sr)
+            self.files.append(path)
+        self.labels = [0, 1, 2]
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_feature_extractor_cache(self):
+        get_feature_extractor = (
+            paddle.audio.datasets.dataset._get_feature_extractor
+        )
+        mfcc = get_feature_extractor('mfcc', self.sr, {'n_mfcc': 20})
+        self.assertIs(
+            get_feature_extractor('mfcc', self.sr, {'n_mfcc': 20}), mfcc
+        )
+        self.assertIsNot(
+            get_feature_extractor('mfcc', self.sr, {'n_mfcc': 40}), mfcc
+        )
+        self.assertIsNot(
+            get_feature_extractor('mfcc', 8000, {'n_mfcc': 20}), mfcc
+        )
+
+    def test_batch_feature(self):
+        dataset = paddle.audio.datasets.dataset.AudioClassificationDataset(
+            self.files, self.labels, feat_type='melspectrogram', n_mels=32
+        )
+        batch_dataset = (
+            paddle.audio.datasets.dataset.AudioClassificationDataset(
+                self.files,
+                self.labels,
+                feat_type='melspectrogram',
+                batch_feature=True,
+                n_mels=32,
+            )
+        )
+        feats, labels = batch_dataset.collate_fn(
+            [batch_dataset[i] for i in range(3)]
+        )
+        self.assertEqual(feats.shape[0], 3)
+        self.assertEqual(feats.shape[1], 32)
+        np.testing.assert_array_equal(labels.numpy(), self.labels)
+        for i in range(2):
+            np.testing.assert_allclose(
+                feats[i].numpy(), dataset[i][0].numpy(), rtol=1e-5, atol=1e-6
+            )
+
+    def test_feat_cache(self):
+        cache_dir = os.path.join(self.temp_dir.name, 'feat_cache')
+        dataset = paddle.audio.datasets.dataset.AudioClassificationDataset(
+            self.files,
+            self.labels,
+            feat_type='mfcc',
+            feat_cache_dir=cache_dir,
+            n_mfcc=20,
+        )
+        expected = [dataset[i][0].numpy() for i in range(3)]
+        config_dirs = os.listdir(cache_dir)
+        self.assertEqual(len(config_dirs), 1)
+        self.assertEqual(
+            len(os.listdir(os.path.join(cache_dir, config_dirs[0]))), 3
+        )
+
+        # features are read from cache instead of extracted again
+        with unittest.mock.patch.object(
+            paddle.audio, 'load', side_effect=AssertionError("cache missed")
+        ):
+            for i in range(3):
+                feat, label = dataset[i]
+                np.testing.assert_array_equal(feat.numpy(), expected[i])
+                self.assertEqual(label, self.labels[i])
+
+        # different feature config does not share the cache
+        paddle.audio.datasets.dataset.AudioClassificationDataset(
+            self.files,
+            self.labels,
+            feat_type='mfcc',
+            feat_cache_dir=cache_dir,
+            n_mfcc=40,
+        )[0]
+        self.assertEqual(len(os.listdir(cache_dir)), 2)
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,151 @@
+# Copyright (c) 2024 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import sys
+import unittest
+
+import numpy as np
+
+import paddle
+from paddle.io import DataLoader, Dataset
+from paddle.io.dataloader.batch_slab import (
+    _BatchSlabWriter,
+    _read_slab_batch,
+)
+
+IMAGE_SHAPE = [3, 8, 8]
+SAMPLE_NUM = 50
+BATCH_SIZE = 8
+
+
+class RandomDataset(Dataset):
+    def __init__(self, sample_num):
+        self.sample_num = sample_num
+
+    def __getitem__(self, idx):
+        np.random.seed(idx)
+        image = np.random.random(IMAGE_SHAPE).astype('float32')
+        return {'image': image, 'label': [idx, float(idx) / 2]}
+
+    def __len__(self):
+        return self.sample_num
+
+
+class TestBatchSlabWriterReader(unittest.TestCase):
+    def test_write_read(self):
+        dataset = RandomDataset(SAMPLE_NUM)
+        writer = _BatchSlabWriter(0, 2)
+        try:
+            for start in range(0, SAMPLE_NUM, BATCH_SIZE):
+                samples = [
+                    dataset[i]
+                    for i in range(start, min(start + BATCH_SIZE, SAMPLE_NUM))
+                ]
+                slab_batch = writer.write(samples)
+                self.assertIsNotNone(slab_batch)
+                tensors = _read_slab_batch(slab_batch)
+                self.assertEqual(len(tensors), 3)
+                np.testing.assert_array_equal(
+                    np.array(tensors[0]),
+                    np.stack([s['image'] for s in samples]),
+                )
+                np.testing.assert_array_equal(
+                    np.array(tensors[1]),
+                    np.array([s['label'][0] for s in samples]),
+                )
+                np.testing.assert_allclose(
+                    np.array(tensors[2]),
+                    np.array([s['label'][1] for s in samples]),
+                )
+        finally:
+            writer.close()
+
+    def test_slab_released_with_tensor(self):
+        samples = [np.full([2, 2], i, 'float32') for i in range(4)]
+        writer = _BatchSlabWriter(0, 2)
+        try:
+            tensors = _read_slab_batch(writer.write(samples))
+            # the wrapped tensor shares memory with the slab
+            np.testing.assert_array_equal(np.array(tensors[0]), samples)
+            other = _read_slab_batch(writer.write(samples[::-1]))
+            # all slabs are held by the wrapped tensors
+            self.assertIsNone(writer.write(samples))
+            np.testing.assert_array_equal(np.array(tensors[0]), samples)
+            np.testing.assert_array_equal(np.array(other[0]), samples[::-1])
+
+            # the slab can be reused after the tensors are released
+            del tensors
+            slab_batch = writer.write(samples[::-1])
+            self.assertIsNotNone(slab_batch)
+            self.assertEqual(slab_batch.slot, 0)
+            tensors = _read_slab_batch(slab_batch)
+            np.testing.assert_array_equal(np.array(tensors[0]), samples[::-1])
+        finally:
+            writer.close()
+
+    def test_fallback(self):
+        writer = _BatchSlabWriter(0, 1)
+        try:
+            samples = [np.ones([2, 2], 'float32') for _ in range(4)]
+            slab_batch = writer.write(samples)
+            self.assertIsNotNone(slab_batch)
+            _read_slab_batch(slab_batch)
+            # shape different from the planned layout
+            samples = [np.ones([3, 2], 'float32') for _ in range(4)]
+            self.assertIsNone(writer.write(samples))
+            # more samples than the planned batch size
+            samples = [np.ones([2, 2], 'float32') for _ in range(5)]
+            self.assertIsNone(writer.write(samples))
+        finally:
+            writer.close()
+
+        # str fields cannot be assembled into slab
+        writer = _BatchSlabWriter(0, 1)
+        self.assertIsNone(writer.write(['a', 'b']))
+        writer.close()
+
+
+class TestDataLoaderWithBatchSlab(unittest.TestCase):
+    def run_main(self, num_workers):
+        paddle.set_device('cpu')
+        dataset = RandomDataset(SAMPLE_NUM)
+        loader = DataLoader(
+            dataset,
+            batch_size=BATCH_SIZE,
+            num_workers=num_workers,
+            use_shared_memory=True,
+        )
+        images, labels = [], []
+        for data in loader:
+            images.append(data['image'].numpy())
+            labels.append(data['label'][0].numpy())
+        return np.concatenate(images), np.concatenate(labels)
+
+    def test_main(self):
+        # DataLoader with multi-process mode is not supported on MacOs and Windows currently
+        if sys.platform == 'darwin' or sys.platform == 'win32':
+            return
+        os.environ['FLAGS_dataloader_use_batch_slab'] = '1'
+        try:
+            slab_images, slab_labels = self.run_main(2)
+        finally:
+            del os.environ['FLAGS_dataloader_use_batch_slab']
+        images, labels = self.run_main(0)
+        np.testing.assert_array_equal(slab_images, images)
+        np.testing.assert_array_equal(slab_labels, labels)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,106 @@
+# Copyright (c) 2024 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+
+import numpy as np
+
+import paddle
+from paddle.io import DataLoader, Dataset
+from paddle.io.dataloader.collate import CollateEngine, default_collate_fn
+
+
+def random_sample(idx):
+    return {
+        'image': np.random.random([3, 4]).astype('float32'),
+        'fields': [idx, float(idx) / 3, f'text_{idx}'],
+        'mask': np.ones([5], dtype='int64'),
+        'flag': idx % 2 == 0,
+    }
+
+
+class VarLenDataset(Dataset):
+    def __getitem__(self, idx):
+        ids = np.arange(idx % 5 + 1).astype('int64')
+        return {'input_ids': ids, 'label': idx % 2}
+
+    def __len__(self):
+        return 20
+
+
+class TestCollateEngine(unittest.TestCase):
+    def assert_same(self, out, ref):
+        self.assertEqual(type(out), type(ref))
+        if isinstance(ref, dict):
+            self.assertEqual(list(out.keys()), list(ref.keys()))
+            for k in ref:
+                self.assert_same(out[k], ref[k])
+        elif isinstance(ref, (list, tuple)):
+            self.assertEqual(len(out), len(ref))
+            for o, r in zip(out, ref):
+                self.assert_same(o, r)
+        elif isinstance(ref, np.ndarray):
+            self.assertEqual(out.dtype, ref.dtype)
+            np.testing.assert_array_equal(out, ref)
+        else:
+            self.assertEqual(out, ref)
+
+    def test_same_as_default(self):
+        engine = CollateEngine()
+        for i in range(5):
+            batch = [random_sample(i * 4 + j) for j in range(4)]
+            self.assert_same(engine(batch), default_collate_fn(batch))
+
+    def test_structure_changed(self):
+        engine = CollateEngine()
+        batch = [random_sample(j) for j in range(4)]
+        self.assert_same(engine(batch), default_collate_fn(batch))
+        batch = [(np.ones([2]), j) for j in range(3)]
+        self.assert_same(engine(batch), default_collate_fn(batch))
+
+    def test_tensor_field(self):
+        engine = CollateEngine()
+        batch = [paddle.ones([2, 3]) * j for j in range(4)]
+        out = engine(batch)
+        np.testing.assert_array_equal(
+            out.numpy(), default_collate_fn(batch).numpy()
+        )
+
+    def test_padding(self):
+        engine = CollateEngine(padding_value=-1)
+        batch = [np.arange(j + 1) for j in range(3)]
+        out = engine(batch)
+        np.testing.assert_array_equal(
+            out, np.array([[0, -1, -1], [0, 1, -1], [0, 1, 2]])
+        )
+        # fixed-length field in first batch becomes variable-length
+        engine = CollateEngine(padding_value=0)
+        out = engine([np.arange(2) for _ in range(2)])
+        np.testing.assert_array_equal(out, np.array([[0, 1], [0, 1]]))
+        out = engine([np.arange(1), np.arange(3)])
+        np.testing.assert_array_equal(out, np.array([[0, 0, 0], [0, 1, 2]]))
+
+    def test_dataloader(self):
+        loader = DataLoader(
+            VarLenDataset(),
+            batch_size=5,
+            collate_fn=CollateEngine(padding_value=0),
+        )
+        for data in loader:
+            self.assertEqual(data['input_ids'].shape, [5, 5])
+            self.assertEqual(data['label'].shape, [5])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,95 @@
+# Copyright (c) 2024 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import sys
+import unittest
+
+import numpy as np
+
+import paddle
+from paddle.io import DataLoader, Dataset
+from paddle.io.reader import set_prefetch_config
+
+SAMPLE_NUM = 40
+BATCH_SIZE = 4
+
+
+class RandomDataset(Dataset):
+    def __getitem__(self, idx):
+        image = np.full([2, 3], idx, dtype='float32')
+        return {'image': image, 'label': np.array([idx], dtype='int64')}
+
+    def __len__(self):
+        return SAMPLE_NUM
+
+
+class TestDataLoaderPrefetch(unittest.TestCase):
+    def run_main(
+        self, num_workers, prefetch_depth, break_at=None, pipeline_stats=True
+    ):
+        set_prefetch_config(prefetch_depth, pipeline_stats)
+        try:
+            loader = DataLoader(
+                RandomDataset(),
+                batch_size=BATCH_SIZE,
+                num_workers=num_workers,
+            )
+        finally:
+            set_prefetch_config(0)
+        labels = []
+        for i, data in enumerate(loader):
+            if break_at is not None and i == break_at:
+                break
+            np.testing.assert_array_equal(
+                data['image'].numpy()[:, 0, 0],
+                data['label'].numpy()[:, 0].astype('float32'),
+            )
+            labels.append(data['label'].numpy())
+        return loader, np.concatenate(labels)
+
+    def test_main(self):
+        paddle.disable_static()
+        worker_nums = [0]
+        # DataLoader with multi-process mode is not supported on MacOs and Windows currently
+        if sys.platform != 'darwin' and sys.platform != 'win32':
+            worker_nums.append(2)
+        for num_workers in worker_nums:
+            _, expected = self.run_main(num_workers, 0)
+            loader, labels = self.run_main(num_workers, 3)
+            np.testing.assert_array_equal(labels, expected)
+
+            stats = loader.pipeline_stats()
+            self.assertEqual(
+                set(stats.keys()), {'fetch', 'push', 'restore', 'output'}
+            )
+            self.assertEqual(
+                stats['output']['count'], SAMPLE_NUM // BATCH_SIZE + 1
+            )
+            self.assertGreaterEqual(stats['restore']['stall_time'], 0.0)
+
+    def test_pipeline_stats_disabled(self):
+        paddle.disable_static()
+        loader, _ = self.run_main(0, 3, pipeline_stats=False)
+        for stage_stats in loader.pipeline_stats().values():
+            self.assertEqual(stage_stats['count'], 0)
+            self.assertEqual(stage_stats['stall_time'], 0.0)
+
+    def test_break(self):
+        paddle.disable_static()
+        _, labels = self.run_main(0, 2, break_at=3)
+        self.assertEqual(len(labels), 3 * BATCH_SIZE)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,145 @@
+# Copyright (c) 2024 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import sys
+import unittest
+
+import numpy as np
+
+import paddle
+from paddle.io import (
+    BatchSampler,
+    DataLoader,
+    Dataset,
+    DistributedBatchSampler,
+    RandomSampler,
+)
+
+SAMPLE_NUM = 37
+BATCH_SIZE = 4
+
+
+class IndexDataset(Dataset):
+    def __getitem__(self, idx):
+        return np.array([idx]).astype('int64')
+
+    def __len__(self):
+        return SAMPLE_NUM
+
+
+class TestBatchSamplerStateDict(unittest.TestCase):
+    def check_resume(self, create_sampler, resume_at):
+        sampler = create_sampler()
+        expected = []
+        state = None
+        for i, indices in enumerate(sampler):
+            if i == resume_at:
+                state = sampler.state_dict()
+            expected.append(list(indices))
+
+        new_sampler = create_sampler()
+        new_sampler.load_state_dict(state)
+        resumed = [list(indices) for indices in new_sampler]
+        self.assertEqual(resumed, expected[resume_at + 1 :])
+
+    def test_batch_sampler(self):
+        np.random.seed(2024)
+        for shuffle in [False, True]:
+            self.check_resume(
+                lambda: BatchSampler(
+                    IndexDataset(), batch_size=BATCH_SIZE, shuffle=shuffle
+                ),
+                3,
+            )
+
+    def test_random_sampler_with_replacement(self):
+        self.check_resume(
+            lambda: BatchSampler(
+                sampler=RandomSampler(
+                    IndexDataset(), replacement=True, num_samples=20
+                ),
+                batch_size=BATCH_SIZE,
+            ),
+            2,
+        )
+
+    def test_random_sampler_with_generator(self):
+        sampler = BatchSampler(
+            sampler=RandomSampler(
+                IndexDataset(), generator=iter(range(SAMPLE_NUM))
+            ),
+            batch_size=BATCH_SIZE,
+        )
+        next(iter(sampler))
+        with self.assertRaises(ValueError):
+            sampler.state_dict()
+
+    def test_distributed_batch_sampler(self):
+        for shuffle in [False, True]:
+            self.check_resume(
+                lambda: DistributedBatchSampler(
+                    IndexDataset(),
+                    batch_size=BATCH_SIZE,
+                    num_replicas=2,
+                    rank=1,
+                    shuffle=shuffle,
+                ),
+                1,
+            )
+
+
+class TestDataLoaderStateDict(unittest.TestCase):
+    def run_resume(self, num_workers, resume_at):
+        np.random.seed(2024)
+        loader = DataLoader(
+            IndexDataset(),
+            batch_size=BATCH_SIZE,
+            shuffle=True,
+            num_workers=num_workers,
+        )
+        expected = []
+        state = None
+        for i, data in enumerate(loader):
+            if i == resume_at:
+                state = loader.state_dict()
+            expected.append(data.numpy().reshape([-1]).tolist())
+        self.assertEqual(state['num_yielded'], resume_at + 1)
+
+        new_loader = DataLoader(
+            IndexDataset(),
+            batch_size=BATCH_SIZE,
+            shuffle=True,
+            num_workers=num_workers,
+        )
+        new_loader.load_state_dict(state)
+        resumed = [data.numpy().reshape([-1]).tolist() for data in new_loader]
+        self.assertEqual(resumed, expected[resume_at + 1 :])
+
+        # the following epoch iterates from the beginning
+        self.assertEqual(len(list(new_loader)), len(expected))
+
+    def test_single_process(self):
+        paddle.disable_static()
+        self.run_resume(0, 4)
+
+    def test_multi_process(self):
+        # DataLoader with multi-process mode is not supported on MacOs and Windows currently
+        if sys.platform == 'darwin' or sys.platform == 'win32':
+            return
+        paddle.disable_static()
+        self.run_resume(2, 5)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -28,6 +28,8 @@ from paddle.vision.datasets import (
     FashionMNIST,
     Flowers,
     ImageFolder,
+    ImageRecordDataset,
+    write_image_records,
 )
 
 
@@ -45,6 +47,7 @@ class TestFolderDatasets(unittest.TestCase):
 
     def tearDown(self):
         shutil.rmtree(self.data_dir)
+        shutil.rmtree(self.empty_dir)
 
     def test_dataset(self):
         dataset_folder = DatasetFolder(self.data_dir)
@@ -71,6 +74,39 @@ class TestFolderDatasets(unittest.TestCase):
 
         assert len(loader) == 4
 
+    def test_index_file(self):
+        index_file = os.path.join(self.empty_dir, 'index.pkl')
+        dataset_folder = DatasetFolder(
+            self.data_dir, num_workers=2, index_file=index_file
+        )
+        self.assertTrue(os.path.isfile(index_file))
+        self.assertEqual(
+            dataset_folder.samples, DatasetFolder(self.data_dir).samples
+        )
+        self.assertEqual(
+            DatasetFolder(self.data_dir, index_file=index_file).samples,
+            dataset_folder.samples,
+        )
+
+        # the changed directory is scanned again
+        sub_dir = os.path.join(self.data_dir, 'class_1', 'sub_dir')
+        os.makedirs(sub_dir)
+        fake_img = (np.random.random((32, 32, 3)) * 255).astype('uint8')
+        cv2.imwrite(os.path.join(sub_dir, '0.jpg'), fake_img)
+        dataset_folder = DatasetFolder(self.data_dir, index_file=index_file)
+        self.assertEqual(len(dataset_folder), 5)
+        self.assertEqual(
+            dataset_folder.samples[-1], (os.path.join(sub_dir, '0.jpg'), 1)
+        )
+
+        image_index_file = os.path.join(self.empty_dir, 'image_index.pkl')
+        loader = ImageFolder(self.data_dir, index_file=image_index_file)
+        self.assertEqual(
+            ImageFolder(self.data_dir, index_file=image_index_file).samples,
+            loader.samples,
+        )
+        self.assertEqual(len(loader), 5)
+
     def test_transform(self):
         def fake_transform(img):
             return img
@@ -95,6 +131,58 @@ class TestFolderDatasets(unittest.TestCase):
             _check_exists_and_download('temp_paddle', None, None, None, False)
 
 
+class TestImageRecordDataset(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.images = []
+        samples = []
+        for i in range(7):
+            image = (np.random.random((16, 8, 3)) * 255).astype('uint8')
+            self.images.append(image)
+            path = os.path.join(self.temp_dir.name, str(i) + '.png')
+            cv2.imwrite(path, image)
+            samples.append((path, i))
+        self.record_files = write_image_records(
+            samples, os.path.join(self.temp_dir.name, 'records', 'train'), 3
+        )
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_dataset(self):
+        self.assertEqual(len(self.record_files), 3)
+        for use_mmap in [True, False]:
+            dataset = ImageRecordDataset(
+                self.record_files, backend='cv2', use_mmap=use_mmap
+            )
+            self.assertEqual(len(dataset), 7)
+            for i in range(7):
+                image, label = dataset[i]
+                self.assertEqual(label, i)
+                np.testing.assert_array_equal(
+                    image, cv2.cvtColor(self.images[i], cv2.COLOR_BGR2RGB)
+                )
+
+        dataset = ImageRecordDataset(
+            self.record_files, backend='pil', transform=T.ToTensor()
+        )
+        image, _ = dataset[6]
+        self.assertEqual(image.shape, [3, 16, 8])
+
+    def test_shard_split(self):
+        targets = []
+        for rank in range(2):
+            dataset = ImageRecordDataset(
+                self.record_files, backend='cv2', num_replicas=2, rank=rank
+            )
+            self.assertEqual(len(dataset), 4)
+            targets.append(dataset.targets)
+        self.assertEqual(targets, [[0, 1, 2, 6], [3, 4, 5, 3]])
+
+        with self.assertRaises(ValueError):
+            ImageRecordDataset(self.record_files, num_replicas=4, rank=0)
+
+
 class TestMNISTTest(unittest.TestCase):
     def test_main(self):
         transform = T.Transpose()
@@ -17,6 +17,8 @@ import sys
 import time
 import unittest
 
+import numpy as np
+
 import paddle.reader
 
 __all__ = []
@@ -152,6 +154,80 @@ class TestXmap(unittest.TestCase):
                         for idx, e in enumerate(result):
                             self.assertEqual(e, mapper(idx))
 
+    def test_xmap_chunk(self):
+        def mapper(x):
+            return x + 1
+
+        for order in (True, False):
+            for chunk_size in (1, 3, 16):
+                reader = paddle.reader.xmap_readers(
+                    mapper,
+                    reader_creator_10(0),
+                    4,
+                    2,
+                    order,
+                    chunk_size=chunk_size,
+                )
+                result = list(reader())
+                if not order:
+                    result.sort()
+                self.assertEqual(result, [mapper(i) for i in range(10)])
+
+    def test_xmap_process(self):
+        if sys.platform == 'win32':
+            return
+
+        def mapper(x):
+            return x, np.full([128, 128], x, dtype='float32')
+
+        for order in (True, False):
+            reader = paddle.reader.xmap_readers(
+                mapper, reader_creator_10(0), 3, 2, order, True, 2
+            )
+            result = list(reader())
+            if not order:
+                result.sort(key=lambda x: x[0])
+            self.assertEqual([r[0] for r in result], list(range(10)))
+            for idx, array in result:
+                np.testing.assert_array_equal(array, mapper(idx)[1])
+
+    def test_xmap_order_bounded(self):
+        read_count = [0]
+
+        def reader():
+            for i in range(100):
+                read_count[0] += 1
+                yield i
+
+        def mapper(x):
+            # the first sample is mapped slowly, the following samples are
+            # kept in the reorder buffer until it is yielded
+            if x == 0:
+                time.sleep(0.5)
+            return x
+
+        buffer_size = 4
+        xreader = paddle.reader.xmap_readers(
+            mapper, reader, 4, buffer_size, True
+        )()
+        self.assertEqual(next(xreader), 0)
+        # the chunks in flight are limited to buffer_size, the read worker
+        # may read one more sample waiting to be put
+        self.assertLessEqual(read_count[0], buffer_size + 2)
+        self.assertEqual(list(xreader), list(range(1, 100)))
+
+    def test_xmap_error(self):
+        def mapper(x):
+            if x == 5:
+                raise ValueError("mapper error")
+            return x
+
+        reader = paddle.reader.xmap_readers(
+            mapper, reader_creator_10(0), 2, 2, True
+        )
+        with self.assertRaises(RuntimeError):
+            list(reader())
+
 
 class TestMultiProcessReader(unittest.TestCase):
     def setup(self):
@@ -0,0 +1,105 @@
+# Copyright (c) 2024 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import tempfile
+import unittest
+
+import numpy as np
+
+import paddle
+from paddle.distributed.checkpoint.load_state_dict import (
+    load_storage_file,
+    slice_storage_tensor,
+)
+from paddle.distributed.checkpoint.save_state_dict import (
+    split_local_state_dict,
+    write_flat_storage_file,
+)
+from paddle.framework.io_utils import (
+    _is_flat_tensor_file,
+    _mmap_flat_tensor_file,
+    _read_flat_tensor_file,
+)
+
+
+class TestFlatTensorFile(unittest.TestCase):
+    def setUp(self):
+        paddle.disable_static()
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.state_dict = {
+            'w1': paddle.arange(32, dtype='float32').reshape([4, 8]),
+            'w2': paddle.arange(6, dtype='int64').reshape([2, 3]),
+            'b': paddle.to_tensor(np.array(3.0, dtype='float64')),
+        }
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_split(self):
+        buckets = split_local_state_dict(self.state_dict, 2)
+        self.assertEqual(len(buckets), 2)
+        self.assertEqual(buckets[0], ['w1'])
+        self.assertEqual(sorted(buckets[1]), ['b', 'w2'])
+        # empty buckets are dropped
+        self.assertEqual(len(split_local_state_dict(self.state_dict, 8)), 3)
+
+    def test_write_and_read(self):
+        path = os.path.join(self.temp_dir.name, '0_0_0.distcp')
+        write_flat_storage_file(path, ['w2', 'w1', 'b'], self.state_dict)
+        self.assertTrue(_is_flat_tensor_file(path))
+
+        arrays, _ = _read_flat_tensor_file(path, keys=['w1'])
+        self.assertEqual(list(arrays.keys()), ['w1'])
+        np.testing.assert_array_equal(
+            arrays['w1'], self.state_dict['w1'].numpy()
+        )
+
+        mapped, _ = _mmap_flat_tensor_file(path)
+        for key, val in self.state_dict.items():
+            self.assertEqual(mapped[key].dtype, val.numpy().dtype)
+            np.testing.assert_array_equal(mapped[key], val.numpy())
+
+        loaded = load_storage_file(path)
+        for key, val in self.state_dict.items():
+            np.testing.assert_array_equal(loaded[key].numpy(), val.numpy())
+
+    def test_slice(self):
+        path = os.path.join(self.temp_dir.name, '0_0_0.distcp')
+        write_flat_storage_file(path, ['w1', 'w2', 'b'], self.state_dict)
+        mapped = load_storage_file(path, use_mmap=True)
+        self.assertIsInstance(mapped['w1'], np.ndarray)
+
+        chunk = slice_storage_tensor(mapped['w1'], [1, 2], [3, 6])
+        np.testing.assert_array_equal(
+            chunk.numpy(), self.state_dict['w1'].numpy()[1:3, 2:6]
+        )
+        ref = slice_storage_tensor(self.state_dict['w1'], [1, 2], [3, 6])
+        np.testing.assert_array_equal(chunk.numpy(), ref.numpy())
+
+        scalar = slice_storage_tensor(mapped['b'], [], [])
+        self.assertEqual(float(scalar), 3.0)
+
+    def test_pickled_file(self):
+        path = os.path.join(self.temp_dir.name, '0_0.distcp')
+        paddle.save(self.state_dict, path)
+        self.assertFalse(_is_flat_tensor_file(path))
+        loaded = load_storage_file(path, use_mmap=True)
+        np.testing.assert_array_equal(
+            loaded['w2'].numpy(), self.state_dict['w2'].numpy()
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
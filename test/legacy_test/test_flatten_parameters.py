@@ -0,0 +1,209 @@
+# Copyright (c) 2024 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+
+import numpy as np
+
+import paddle
+
+
+class SimpleNet(paddle.nn.Layer):
+    def __init__(self):
+        super().__init__()
+        self.linear1 = paddle.nn.Linear(5, 8)
+        self.linear2 = paddle.nn.Linear(8, 5)
+        self.linear3 = paddle.nn.Linear(5, 3)
+
+    def forward(self, x):
+        x = paddle.nn.functional.relu(self.linear1(x))
+        return self.linear3(paddle.nn.functional.relu(self.linear2(x)))
+
+
+class TestFlattenParameters(unittest.TestCase):
+    def setUp(self):
+        paddle.disable_static()
+
+    def _get_model(self, flatten):
+        paddle.seed(10)
+        model = SimpleNet()
+        storages = []
+        if flatten:
+            storages = paddle.nn.utils.flatten_parameters(model)
+        return model, storages
+
+    def _check_views(self, model, storage):
+        for p in model.parameters():
+            self.assertTrue(storage.param._is_shared_buffer_with(p))
+            if p.grad is not None:
+                self.assertTrue(storage.grad._is_shared_buffer_with(p.grad))
+
+    def test_views(self):
+        model, _ = self._get_model(False)
+        values = [p.numpy() for p in model.parameters()]
+        storages = paddle.nn.utils.flatten_parameters(model)
+        self.assertEqual(len(storages), 1)
+        storage = storages[0]
+        self.assertEqual(storage.params, model.parameters())
+        self.assertEqual(
+            storage.param.shape[0], sum(p.size for p in model.parameters())
+        )
+        for p, value in zip(model.parameters(), values):
+            np.testing.assert_array_equal(p.numpy(), value)
+        np.testing.assert_array_equal(
+            storage.param.numpy(),
+            np.concatenate([value.flatten() for value in values]),
+        )
+        # flattened parameters are not flattened again
+        self.assertEqual(paddle.nn.utils.flatten_parameters(model), [])
+
+        # gradients created by backward become views once set to zero
+        for p in model.parameters():
+            self.assertIsNone(p.grad)
+        loss = paddle.mean(model(paddle.randn([4, 5])))
+        loss.backward()
+        storage.zero_grad()
+        for p in model.parameters():
+            np.testing.assert_array_equal(p.grad.numpy(), np.zeros(p.shape))
+        loss = paddle.mean(model(paddle.randn([4, 5])))
+        loss.backward()
+        self._check_views(model, storage)
+        np.testing.assert_array_equal(
+            storage.grad.numpy(),
+            np.concatenate(
+                [p.grad.numpy().flatten() for p in model.parameters()]
+            ),
+        )
+
+    def test_clear_grad(self):
+        model, storages = self._get_model(True)
+        storage = storages[0]
+        optimizer = paddle.optimizer.SGD(
+            learning_rate=0.1, parameters=model.parameters()
+        )
+        input = paddle.randn([4, 5])
+        for clear_grad in [
+            optimizer.clear_grad,
+            lambda: optimizer.clear_grad(set_to_zero=False),
+            model.clear_gradients,
+            lambda: model.linear1.weight.clear_gradient(False),
+        ]:
+            loss = paddle.mean(model(input))
+            loss.backward()
+            clear_grad()
+            storage.zero_grad()
+            self._check_views(model, storage)
+            np.testing.assert_array_equal(
+                storage.grad.numpy(), np.zeros(storage.grad.shape, 'float32')
+            )
+
+        # clear the gradients of a part of the parameters
+        optimizer = paddle.optimizer.SGD(
+            learning_rate=0.1, parameters=model.linear1.parameters()
+        )
+        loss = paddle.mean(model(input))
+        loss.backward()
+        optimizer.clear_grad()
+        self._check_views(model, storage)
+        for p in model.linear1.parameters():
+            np.testing.assert_array_equal(p.grad.numpy(), np.zeros(p.shape))
+        for p in model.linear2.parameters():
+            self.assertFalse(np.all(p.grad.numpy() == 0))
+
+    def _train(self, flatten, use_multi_tensor, optimizer_cls, clip_cls):
+        model, storages = self._get_model(flatten)
+        optimizer = optimizer_cls(
+            learning_rate=0.1,
+            parameters=model.parameters(),
+            grad_clip=clip_cls(0.1, use_multi_tensor=use_multi_tensor),
+            use_multi_tensor=use_multi_tensor,
+        )
+        paddle.seed(20)
+        for _ in range(5):
+            loss = paddle.mean(model(paddle.randn([4, 5])))
+            loss.backward()
+            optimizer.step()
+            optimizer.clear_grad()
+        for storage in storages:
+            self._check_views(model, storage)
+        return model
+
+    def test_train(self):
+        for optimizer_cls in [paddle.optimizer.SGD, paddle.optimizer.Adagrad]:
+            for clip_cls in [
+                paddle.nn.ClipGradByGlobalNorm,
+                paddle.nn.ClipGradByNorm,
+                paddle.nn.ClipGradByValue,
+            ]:
+                expected = self._train(False, False, optimizer_cls, clip_cls)
+                for use_multi_tensor in [False, True]:
+                    model = self._train(
+                        True, use_multi_tensor, optimizer_cls, clip_cls
+                    )
+                    for p1, p2 in zip(
+                        model.parameters(), expected.parameters()
+                    ):
+                        np.testing.assert_allclose(
+                            p1.numpy(), p2.numpy(), rtol=1e-5, atol=1e-6
+                        )
+
+    def test_unused_parameter(self):
+        def train(flatten, use_multi_tensor):
+            model, _ = self._get_model(flatten)
+            # linear3 is not used, and should not be decayed
+            unused = [p.numpy() for p in model.linear3.parameters()]
+            optimizer = paddle.optimizer.Adagrad(
+                learning_rate=0.1,
+                parameters=model.parameters(),
+                weight_decay=0.1,
+                use_multi_tensor=use_multi_tensor,
+            )
+            paddle.seed(20)
+            for _ in range(3):
+                x = paddle.randn([4, 5])
+                x = model.linear2(paddle.nn.functional.relu(model.linear1(x)))
+                loss = paddle.mean(x)
+                loss.backward()
+                optimizer.step()
+                optimizer.clear_grad()
+            for p, value in zip(model.linear3.parameters(), unused):
+                self.assertIsNone(p.grad)
+                np.testing.assert_array_equal(p.numpy(), value)
+            return model
+
+        expected = train(False, False)
+        for use_multi_tensor in [False, True]:
+            model = train(True, use_multi_tensor)
+            for p1, p2 in zip(model.parameters(), expected.parameters()):
+                np.testing.assert_allclose(
+                    p1.numpy(), p2.numpy(), rtol=1e-5, atol=1e-6
+                )
+
+    def test_state_dict(self):
+        model, storages = self._get_model(True)
+        state_dict = {k: v.numpy() for k, v in model.state_dict().items()}
+        for p in model.parameters():
+            p.set_value(np.zeros(p.shape, 'float32'))
+        np.testing.assert_array_equal(
+            storages[0].param.numpy(),
+            np.zeros(storages[0].param.shape, 'float32'),
+        )
+        model.set_state_dict(state_dict)
+        self._check_views(model, storages[0])
+        for k, v in model.state_dict().items():
+            np.testing.assert_array_equal(v.numpy(), state_dict[k])
+
+
+if __name__ == '__main__':
+    unittest.main()
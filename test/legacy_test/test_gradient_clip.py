@@ -660,6 +660,108 @@ class TestDygraphGradientClipByValue(TestDygraphGradientClip):
             )
 
 
+class TestDygraphGradientClipByGlobalNormMultiTensor(
+    TestDygraphGradientClipByGlobalNorm
+):
+    def setUp(self):
+        self.clip_norm = 0.8
+        self.clip1 = paddle.nn.ClipGradByGlobalNorm(
+            clip_norm=self.clip_norm, use_multi_tensor=True
+        )
+        self.clip2 = paddle.nn.ClipGradByGlobalNorm(
+            clip_norm=self.clip_norm, use_multi_tensor=True
+        )
+
+
+class TestDygraphGradientClipByNormMultiTensor(TestDygraphGradientClipByNorm):
+    def setUp(self):
+        self.clip_norm = 0.8
+        self.clip = paddle.nn.ClipGradByNorm(
+            clip_norm=self.clip_norm, use_multi_tensor=True
+        )
+
+
+class TestDygraphGradientClipByValueMultiTensor(TestDygraphGradientClipByValue):
+    def setUp(self):
+        self.max = 0.2
+        self.min = 0.1
+        self.clip = paddle.nn.ClipGradByValue(
+            max=self.max, min=self.min, use_multi_tensor=True
+        )
+
+
+class TestDygraphMultiTensorGradientClip(unittest.TestCase):
+    def get_params_grads(self):
+        params_grads = []
+        for i, shape in enumerate([[3, 4], [4], [3, 4], [5], [2, 2], [4]]):
+            param = paddle.create_parameter(shape, 'float32')
+            grad = paddle.uniform(shape, min=-2.0, max=2.0)
+            if i == 4:
+                param.need_clip = False
+            if i == 5:
+                grad = None
+            params_grads.append((param, grad))
+        return params_grads
+
+    def test_main(self):
+        paddle.disable_static()
+        clips = [
+            lambda use_multi_tensor: paddle.nn.ClipGradByGlobalNorm(
+                1.0, use_multi_tensor=use_multi_tensor
+            ),
+            lambda use_multi_tensor: paddle.nn.ClipGradByGlobalNorm(
+                100.0, auto_skip_clip=True, use_multi_tensor=use_multi_tensor
+            ),
+            lambda use_multi_tensor: paddle.nn.ClipGradByNorm(
+                1.0, use_multi_tensor=use_multi_tensor
+            ),
+            lambda use_multi_tensor: paddle.nn.ClipGradByValue(
+                0.5, use_multi_tensor=use_multi_tensor
+            ),
+        ]
+        for clip in clips:
+            params_grads = self.get_params_grads()
+            grads = [None if g is None else g.numpy() for _, g in params_grads]
+            data_ptrs = [
+                None if g is None else g.data_ptr() for _, g in params_grads
+            ]
+            expected = clip(False)(params_grads)
+            actual = clip(True)(params_grads)
+            self.assertEqual(len(actual), len(expected))
+            for (p1, g1), (p2, g2) in zip(expected, actual):
+                self.assertIs(p1, p2)
+                self.assertEqual(g1.shape, g2.shape)
+                np.testing.assert_allclose(
+                    g1.numpy(), g2.numpy(), rtol=1e-6, atol=1e-7
+                )
+            # the input gradients are not changed, nor moved to new buffers
+            for (_, g), grad, data_ptr in zip(params_grads, grads, data_ptrs):
+                if g is not None:
+                    np.testing.assert_array_equal(g.numpy(), grad)
+                    self.assertEqual(g.data_ptr(), data_ptr)
+
+    def test_float16_global_norm(self):
+        if not paddle.is_compiled_with_cuda():
+            return
+        paddle.disable_static()
+        # the squares of the gradients sum up beyond the range of float16
+        params_grads = [
+            (
+                paddle.create_parameter([1024], 'float16'),
+                paddle.full([1024], 100.0, 'float16'),
+            )
+            for _ in range(4)
+        ]
+        clip = paddle.nn.ClipGradByGlobalNorm(1.0, use_multi_tensor=True)
+        for _, g in clip(params_grads):
+            self.assertTrue(np.all(np.isfinite(g.numpy())))
+            np.testing.assert_allclose(
+                g.astype('float32').numpy(),
+                np.full([1024], 1.0 / 64, 'float32'),
+                rtol=1e-3,
+            )
+
+
 class SimpleNet(paddle.nn.Layer):
     def __init__(self):
         super().__init__()
@@ -108,6 +108,28 @@ class TestAccuracy(unittest.TestCase):
     def test_1d_label(self):
         self.test_acc(True)
 
+    def test_on_device(self):
+        x = paddle.to_tensor(np.random.rand(16, 5).astype('float32'))
+        y = paddle.to_tensor(np.random.randint(5, size=(16, 1)))
+
+        m = paddle.metric.Accuracy(topk=(1, 3), accumulate_on_device=True)
+        m_host = paddle.metric.Accuracy(topk=(1, 3))
+        for _ in range(2):
+            correct = m.compute(x, y)
+            accs = m.update(correct)
+            self.assertIsInstance(accs[0], paddle.Tensor)
+            host_accs = m_host.update(correct)
+            np.testing.assert_allclose(
+                [float(acc) for acc in accs], host_accs, rtol=1e-6
+            )
+        np.testing.assert_allclose(
+            m.accumulate(), m_host.accumulate(), rtol=1e-6
+        )
+        self.assertEqual(m.count, [32, 32])
+
+        m.reset()
+        self.assertEqual(m.accumulate(), [0.0, 0.0])
+
     def compare(self, x_np, y_np, k=(1,)):
         x = paddle.to_tensor(x_np)
         y = paddle.to_tensor(y_np)
@@ -284,6 +306,27 @@ class TestPrecision(unittest.TestCase):
         self.assertEqual(m.fp, 0.0)
         self.assertEqual(m.accumulate(), 0.0)
 
+    def test_on_device(self):
+        x = paddle.to_tensor(np.array([0.1, 0.5, 0.6, 0.7]).reshape(-1, 1))
+        y = paddle.to_tensor(np.array([1, 0, 1, 1]).reshape(-1, 1))
+
+        m = paddle.metric.Precision(accumulate_on_device=True)
+        m.update(x, y)
+        self.assertIsInstance(m.tp, paddle.Tensor)
+        self.assertAlmostEqual(m.accumulate(), 2.0 / 3.0)
+
+        x = paddle.to_tensor(np.array([0.1, 0.5, 0.6, 0.7, 0.2]))
+        y = paddle.to_tensor(np.array([1.0, 0.0, 1.0, 1.0, 1.0]))
+        m.update(x, y)
+        self.assertAlmostEqual(m.accumulate(), 4.0 / 6.0)
+
+        # numpy inputs are accumulated on host
+        m.update(np.array([0.9]), np.array([0]))
+        self.assertAlmostEqual(m.accumulate(), 4.0 / 7.0)
+
+        m.reset()
+        self.assertEqual(m.accumulate(), 0.0)
+
 
 class TestRecall(unittest.TestCase):
     def test_1d(self):
@@ -307,6 +350,22 @@ class TestRecall(unittest.TestCase):
         self.assertEqual(m.fn, 0.0)
         self.assertEqual(m.accumulate(), 0.0)
 
+    def test_on_device(self):
+        x = paddle.to_tensor(np.array([0.1, 0.5, 0.6, 0.7, 1.5]))
+        y = paddle.to_tensor(np.array([1, 0, 1, 1, 1]))
+
+        m = paddle.metric.Recall(accumulate_on_device=True)
+        m.update(x, y)
+        self.assertIsInstance(m.tp, paddle.Tensor)
+
+        m_host = paddle.metric.Recall()
+        m_host.update(x.numpy(), y.numpy())
+        self.assertAlmostEqual(m.accumulate(), m_host.accumulate())
+        self.assertAlmostEqual(m.accumulate(), 2.0 / 4.0)
+
+        m.reset()
+        self.assertEqual(m.accumulate(), 0.0)
+
 
 class TestAuc(unittest.TestCase):
     def test_auc_numpy(self):
@@ -355,6 +414,77 @@ class TestAuc(unittest.TestCase):
         m.reset()
         self.assertEqual(m.accumulate(), 0.0)
 
+    def test_auc_large_batch(self):
+        np.random.seed(2024)
+        num_thresholds = 200
+        x = np.random.random((100000, 2)).astype('float32')
+        y = np.random.randint(0, 2, (100000, 1))
+        m = paddle.metric.Auc(num_thresholds=num_thresholds)
+        m.update(x, y)
+
+        bin_idx = (x[:, 1] * num_thresholds).astype('int64')
+        stat_pos = np.zeros(num_thresholds + 1)
+        stat_neg = np.zeros(num_thresholds + 1)
+        np.add.at(stat_pos, bin_idx[y[:, 0] == 1], 1)
+        np.add.at(stat_neg, bin_idx[y[:, 0] == 0], 1)
+        np.testing.assert_array_equal(m._stat_pos, stat_pos)
+        np.testing.assert_array_equal(m._stat_neg, stat_neg)
+
+        tot_pos, tot_neg, auc = 0.0, 0.0, 0.0
+        for idx in range(num_thresholds, -1, -1):
+            tot_pos_prev, tot_neg_prev = tot_pos, tot_neg
+            tot_pos += stat_pos[idx]
+            tot_neg += stat_neg[idx]
+            auc += (tot_neg - tot_neg_prev) * (tot_pos + tot_pos_prev) / 2.0
+        self.assertAlmostEqual(m.accumulate(), auc / tot_pos / tot_neg)
+
+    def test_auc_merge(self):
+        np.random.seed(2024)
+        x = np.random.random((1000, 2)).astype('float32')
+        y = np.random.randint(0, 2, (1000, 1))
+        m = paddle.metric.Auc()
+        m.update(x, y)
+
+        m0 = paddle.metric.Auc()
+        m0.update(x[:300], y[:300])
+        m1 = paddle.metric.Auc()
+        m1.update(x[300:], y[300:])
+        m0.merge(m1)
+        self.assertAlmostEqual(m0.accumulate(), m.accumulate())
+
+        self.assertRaises(
+            ValueError, m0.merge, paddle.metric.Auc(num_thresholds=10)
+        )
+        self.assertRaises(TypeError, m0.merge, paddle.metric.Precision())
+
+    def test_auc_pr(self):
+        x = np.array([[0.9, 0.1], [0.8, 0.2], [0.3, 0.7], [0.1, 0.9]])
+        y = np.array([[0], [0], [1], [1]])
+        m = paddle.metric.Auc(curve='PR')
+        m.update(x, y)
+        self.assertAlmostEqual(m.accumulate(), 1.0)
+
+        # the positive instances are ranked 1st and 3rd
+        y = np.array([[0], [1], [0], [1]])
+        m.reset()
+        m.update(x, y)
+        precision = [1.0, 1.0, 0.5, 2.0 / 3, 0.5]
+        recall = [0.0, 0.5, 0.5, 1.0, 1.0]
+        expected = sum(
+            (recall[i + 1] - recall[i]) * (precision[i + 1] + precision[i]) / 2
+            for i in range(4)
+        )
+        self.assertAlmostEqual(m.accumulate(), expected)
+
+        # the PR-AUC of all positive instances is 1, and ROC-AUC is undefined
+        y = np.array([[1], [1], [1], [1]])
+        m.reset()
+        m.update(x, y)
+        self.assertAlmostEqual(m.accumulate(), 1.0)
+        m = paddle.metric.Auc()
+        m.update(x, y)
+        self.assertEqual(m.accumulate(), 0.0)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -953,6 +953,155 @@ class TestModelFunction(unittest.TestCase):
             np.testing.assert_almost_equal(losses[0], losses[1], decimal=4)
             np.testing.assert_almost_equal(losses[0], losses[2], decimal=4)
 
+    def test_fit_sync_free(self):
+        class LogsRecorder(paddle.callbacks.Callback):
+            def __init__(self):
+                self.batch_logs = []
+                self.epoch_logs = []
+
+            def on_train_batch_end(self, step, logs=None):
+                self.batch_logs.append(dict(logs))
+
+            def on_epoch_end(self, epoch, logs=None):
+                self.epoch_logs.append(dict(logs))
+
+        data = np.random.random(size=(40, 20)).astype(np.float32)
+        label = np.random.randint(0, 10, size=(40, 1)).astype(np.int64)
+        dataset = paddle.io.TensorDataset(
+            [paddle.to_tensor(data), paddle.to_tensor(label)]
+        )
+        inputs = [InputSpec([None, 20], 'float32', 'x')]
+        labels = [InputSpec([None, 1], 'int64', 'label')]
+
+        results = []
+        for sync_free in [False, True]:
+            paddle.seed(2024)
+            net = MyModel()
+            optim = paddle.optimizer.SGD(
+                learning_rate=0.001, parameters=net.parameters()
+            )
+            model = Model(net, inputs, labels)
+            model.prepare(
+                optim,
+                loss=CrossEntropyLoss(reduction="sum"),
+                metrics=Accuracy(accumulate_on_device=True),
+            )
+            recorder = LogsRecorder()
+            model.fit(
+                dataset,
+                batch_size=4,
+                epochs=2,
+                log_freq=3,
+                shuffle=False,
+                verbose=0,
+                callbacks=[recorder],
+                sync_free=sync_free,
+            )
+            results.append(recorder)
+
+        expected, actual = results
+        self.assertEqual(len(actual.batch_logs), 20)
+        for epoch in range(2):
+            for step in range(10):
+                # logs are only updated every log_freq steps
+                logged_step = step // 3 * 3 - 1
+                if (step + 1) % 3 == 0:
+                    logged_step = step
+                if logged_step < 0:
+                    continue
+                logs = actual.batch_logs[epoch * 10 + step]
+                expected_logs = expected.batch_logs[epoch * 10 + logged_step]
+                np.testing.assert_allclose(
+                    logs['loss'], expected_logs['loss'], rtol=1e-5
+                )
+                np.testing.assert_allclose(logs['acc'], expected_logs['acc'])
+        for expected_logs, logs in zip(expected.epoch_logs, actual.epoch_logs):
+            np.testing.assert_allclose(
+                logs['loss'], expected_logs['loss'], rtol=1e-5
+            )
+            self.assertIsInstance(logs['acc'], float)
+            np.testing.assert_allclose(logs['acc'], expected_logs['acc'])
+
+        class ErrorCallback(paddle.callbacks.Callback):
+            def on_train_batch_end(self, step, logs=None):
+                raise RuntimeError("callback error")
+
+        # sync free logging is turned off even if fit fails
+        with self.assertRaises(RuntimeError):
+            model.fit(
+                dataset,
+                batch_size=4,
+                epochs=1,
+                verbose=0,
+                callbacks=[ErrorCallback()],
+                sync_free=True,
+            )
+        self.assertIsNone(model._sync_free_log_freq)
+
+    def test_predict_iter(self):
+        class ArrayDataset(Dataset):
+            def __init__(self, data):
+                self.data = data
+
+            def __getitem__(self, idx):
+                return self.data[idx]
+
+            def __len__(self):
+                return len(self.data)
+
+        dataset = ArrayDataset(
+            np.random.random(size=(42, 20)).astype(np.float32)
+        )
+        temp_dir = tempfile.TemporaryDirectory()
+        for dynamic in [True, False]:
+            paddle.disable_static() if dynamic else paddle.enable_static()
+            self.set_seed()
+            net = MyModel()
+            inputs = [InputSpec([None, 20], 'float32', 'x')]
+            model = Model(net, inputs)
+            model.prepare()
+            expected = model.predict(
+                dataset, batch_size=8, stack_outputs=True, verbose=0
+            )
+
+            outputs = list(model.predict_iter(dataset, batch_size=8, verbose=0))
+            self.assertEqual(len(outputs), 6)
+            self.assertEqual(outputs[-1][0].shape, (2, 10))
+            np.testing.assert_allclose(
+                np.concatenate([out[0] for out in outputs]),
+                expected[0],
+                rtol=1e-6,
+            )
+
+            class EndRecorder(paddle.callbacks.Callback):
+                def __init__(self):
+                    super().__init__()
+                    self.ended = False
+
+                def on_predict_end(self, logs=None):
+                    self.ended = True
+
+            # the predict callbacks are ended if the iteration is stopped
+            recorder = EndRecorder()
+            for _ in model.predict_iter(
+                dataset, batch_size=8, verbose=0, callbacks=recorder
+            ):
+                break
+            self.assertTrue(recorder.ended)
+
+            output_dir = os.path.join(temp_dir.name, str(dynamic))
+            outputs = model.predict(
+                dataset, batch_size=8, verbose=0, output_dir=output_dir
+            )
+            self.assertTrue(
+                os.path.exists(os.path.join(output_dir, 'output_0.npy'))
+            )
+            self.assertEqual(outputs[0].shape, (42, 10))
+            np.testing.assert_allclose(outputs[0], expected[0], rtol=1e-6)
+            del outputs
+            paddle.disable_static()
+        temp_dir.cleanup()
+
 
 class TestModelWithLRScheduler(unittest.TestCase):
     def test_fit_by_step(self):
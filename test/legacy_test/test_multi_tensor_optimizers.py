@@ -0,0 +1,198 @@
+# Copyright (c) 2024 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+
+import numpy as np
+
+import paddle
+
+
+class SimpleNet(paddle.nn.Layer):
+    def __init__(self, use_param_attr=False):
+        super().__init__()
+        weight_attr = None
+        if use_param_attr:
+            weight_attr = paddle.ParamAttr(
+                learning_rate=0.5,
+                regularizer=paddle.regularizer.L2Decay(1.0),
+            )
+        self.linear1 = paddle.nn.Linear(5, 8, weight_attr)
+        self.linear2 = paddle.nn.Linear(8, 5)
+        # an unused parameter without gradient
+        self.unused = paddle.nn.Linear(5, 5)
+
+    def forward(self, x):
+        return self.linear2(paddle.nn.functional.relu(self.linear1(x)))
+
+
+OPTIMIZERS = [
+    (paddle.optimizer.SGD, {'learning_rate': 0.1}),
+    (paddle.optimizer.Adagrad, {'learning_rate': 0.1}),
+    (paddle.optimizer.RMSProp, {'learning_rate': 0.01, 'momentum': 0.9}),
+    (paddle.optimizer.Adadelta, {'learning_rate': 0.1}),
+    (paddle.optimizer.Adamax, {'learning_rate': 0.01}),
+    (paddle.optimizer.Rprop, {'learning_rate': 0.01}),
+]
+
+
+class TestFlatMultiTensorOptimizer(unittest.TestCase):
+    def setUp(self):
+        paddle.disable_static()
+
+    def _get_places(self):
+        places = ['cpu']
+        if paddle.is_compiled_with_cuda():
+            places.append('gpu')
+        return places
+
+    def _optimize(
+        self,
+        optimizer_cls,
+        kwargs,
+        use_multi_tensor,
+        use_param_attr=False,
+        use_param_group=False,
+        steps=5,
+    ):
+        paddle.seed(10)
+        input = paddle.randn((4, 5))
+        model = SimpleNet(use_param_attr)
+        kwargs = dict(kwargs)
+        if optimizer_cls is not paddle.optimizer.Rprop:
+            kwargs['weight_decay'] = 0.01
+        if use_param_group:
+            parameters = list(model.parameters())
+            parameters = [
+                {'params': parameters[:2], 'learning_rate': 0.5},
+                {'params': parameters[2:]},
+            ]
+        else:
+            parameters = model.parameters()
+        optimizer = optimizer_cls(
+            parameters=parameters, use_multi_tensor=use_multi_tensor, **kwargs
+        )
+        for _ in range(steps):
+            loss = paddle.mean(model(input))
+            loss.backward()
+            optimizer.step()
+            optimizer.clear_grad()
+        return model, optimizer
+
+    def _check(self, optimizer_cls, kwargs, **config):
+        model1, _ = self._optimize(optimizer_cls, kwargs, True, **config)
+        model2, _ = self._optimize(optimizer_cls, kwargs, False, **config)
+        for param1, param2 in zip(model1.parameters(), model2.parameters()):
+            np.testing.assert_allclose(
+                param1.numpy(), param2.numpy(), rtol=1e-5, atol=1e-6
+            )
+
+    def test_main(self):
+        for place in self._get_places():
+            paddle.set_device(place)
+            for optimizer_cls, kwargs in OPTIMIZERS:
+                self._check(optimizer_cls, kwargs)
+                self._check(optimizer_cls, kwargs, use_param_attr=True)
+                self._check(optimizer_cls, kwargs, use_param_group=True)
+
+    def test_state_dict(self):
+        for optimizer_cls, kwargs in OPTIMIZERS:
+            model1, optimizer1 = self._optimize(optimizer_cls, kwargs, True)
+            model2, optimizer2 = self._optimize(optimizer_cls, kwargs, False)
+            state_dict1 = optimizer1.state_dict()
+            state_dict2 = optimizer2.state_dict()
+            self.assertEqual(len(state_dict1), len(state_dict2))
+            for value1, value2 in zip(
+                state_dict1.values(), state_dict2.values()
+            ):
+                np.testing.assert_allclose(
+                    value1.numpy(), value2.numpy(), rtol=1e-5, atol=1e-6
+                )
+
+            # continue training from the loaded states
+            optimizer1.set_state_dict(state_dict1)
+            optimizer2.set_state_dict(state_dict2)
+            input = paddle.randn((4, 5))
+            for model, optimizer in [
+                (model1, optimizer1),
+                (model2, optimizer2),
+            ]:
+                loss = paddle.mean(model(input))
+                loss.backward()
+                optimizer.step()
+                optimizer.clear_grad()
+            for param1, param2 in zip(model1.parameters(), model2.parameters()):
+                np.testing.assert_allclose(
+                    param1.numpy(), param2.numpy(), rtol=1e-5, atol=1e-6
+                )
+
+    def test_regularizer_group(self):
+        linears = [
+            paddle.nn.Linear(
+                5,
+                5,
+                paddle.ParamAttr(regularizer=paddle.regularizer.L2Decay(0.5)),
+            )
+            for _ in range(2)
+        ]
+        parameters = [p for linear in linears for p in linear.parameters()]
+        optimizer = paddle.optimizer.SGD(
+            learning_rate=0.1, parameters=parameters, use_multi_tensor=True
+        )
+        input = paddle.randn((4, 5))
+        loss = paddle.mean(linears[1](linears[0](input)))
+        loss.backward()
+        optimizer.step()
+        # the weights with equal regularizers are in one group, and the
+        # biases in another
+        self.assertEqual(len(optimizer._flat_multi_tensor_groups[0]), 2)
+
+    def test_partial_group(self):
+        # the parameters of linear2 have no gradient after the first step,
+        # so the powers of beta of Adamax are only updated for linear1
+        results = []
+        for use_multi_tensor in [True, False]:
+            paddle.seed(10)
+            input = paddle.randn((4, 5))
+            model = SimpleNet()
+            optimizer = paddle.optimizer.Adamax(
+                learning_rate=0.01,
+                parameters=model.parameters(),
+                use_multi_tensor=use_multi_tensor,
+            )
+            for step in range(4):
+                out = model.linear1(input)
+                if step == 0:
+                    out = model.linear2(out)
+                loss = paddle.mean(out)
+                loss.backward()
+                optimizer.step()
+                optimizer.clear_grad(set_to_zero=False)
+            results.append((model, optimizer))
+
+        (model1, optimizer1), (model2, optimizer2) = results
+        for param1, param2 in zip(model1.parameters(), model2.parameters()):
+            np.testing.assert_allclose(
+                param1.numpy(), param2.numpy(), rtol=1e-5, atol=1e-6
+            )
+        for value1, value2 in zip(
+            optimizer1.state_dict().values(), optimizer2.state_dict().values()
+        ):
+            np.testing.assert_allclose(
+                value1.numpy(), value2.numpy(), rtol=1e-5, atol=1e-6
+            )
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -14,6 +14,7 @@
 
 import os
 import tempfile
+import time
 import unittest
 from io import BytesIO
 
@@ -1111,6 +1112,28 @@ class TestAsyncSaveLoad(unittest.TestCase):
         self.check_load_state_dict(layer_state_dict, load_layer_state_dict)
         self.check_load_state_dict(opt_state_dict, load_opt_state_dict)
 
+        # the snapshot is taken when async_save is called
+        tensor_save_path = os.path.join(
+            self.temp_dir.name, "test_paddle_async_save_load.tensor"
+        )
+        tensor = paddle.ones([4, 4])
+        futures = [paddle.async_save(tensor, tensor_save_path)]
+        tensor.set_value(np.zeros([4, 4], dtype='float32'))
+        for i in range(4):
+            futures.append(
+                paddle.async_save(layer_state_dict, layer_save_path + f".{i}")
+            )
+        paddle.clear_async_save_task_queue()
+        for future in futures:
+            self.assertTrue(future.done())
+        self.assertEqual(futures[0].result(), tensor_save_path)
+        np.testing.assert_array_equal(
+            paddle.load(tensor_save_path).numpy(), np.ones([4, 4])
+        )
+        self.assertFalse(
+            any(".tmp." in name for name in os.listdir(self.temp_dir.name))
+        )
+
         # test assertion on illegal object
         some_tuple_obj = (1, 2, 3)
         tuple_save_path = os.path.join(
@@ -1119,6 +1142,18 @@ class TestAsyncSaveLoad(unittest.TestCase):
         with self.assertRaises(TypeError):
             paddle.async_save(some_tuple_obj, tuple_save_path)
 
+        # errors of failed tasks are re-raised after all tasks are done
+        failed = paddle.async_save(
+            {'fn': lambda: None}, tuple_save_path + ".failed"
+        )
+        while not failed.done():
+            time.sleep(0.01)
+        future = paddle.async_save(layer_state_dict, layer_save_path)
+        with self.assertRaises(Exception):
+            paddle.clear_async_save_task_queue()
+        self.assertEqual(future.result(), layer_save_path)
+        paddle.clear_async_save_task_queue()
+
         # test assertion on static graph
         paddle.enable_static()
         static_save_path = os.path.join(
@@ -1129,6 +1164,98 @@ class TestAsyncSaveLoad(unittest.TestCase):
             paddle.async_save(layer_state_dict, static_save_path)
 
 
+class TestSaveLoadFlatFormat(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def build_state_dict(self):
+        paddle.disable_static()
+        layer = LinearNet()
+        state_dict = layer.state_dict()
+        state_dict['extra'] = {
+            'step': 10,
+            'lr': 0.1,
+            'array': np.arange(6).reshape([2, 3]).astype('int32'),
+        }
+        return state_dict
+
+    def check_state_dict(self, load_dict, save_dict, return_numpy=False):
+        self.assertEqual(list(load_dict.keys()), list(save_dict.keys()))
+        for key, value in save_dict.items():
+            if isinstance(value, dict):
+                self.check_state_dict(load_dict[key], value, return_numpy)
+            elif isinstance(value, paddle.Tensor):
+                load_value = load_dict[key]
+                if not return_numpy:
+                    self.assertEqual(load_value.dtype, value.dtype)
+                    self.assertEqual(load_value.name, value.name)
+                    load_value = load_value.numpy()
+                np.testing.assert_array_equal(load_value, value.numpy())
+            elif isinstance(value, np.ndarray):
+                np.testing.assert_array_equal(load_dict[key], value)
+            else:
+                self.assertEqual(load_dict[key], value)
+
+    def test_save_load(self):
+        save_dict = self.build_state_dict()
+        path = os.path.join(self.temp_dir.name, "flat", "layer.pdparams")
+        paddle.save(save_dict, path, use_flat_format=True)
+        for mmap in [False, True]:
+            for return_numpy in [False, True]:
+                load_dict = paddle.load(
+                    path, mmap=mmap, return_numpy=return_numpy
+                )
+                self.check_state_dict(load_dict, save_dict, return_numpy)
+
+    def test_selective_keys(self):
+        save_dict = self.build_state_dict()
+        path = os.path.join(self.temp_dir.name, "layer.pdparams")
+        paddle.save(save_dict, path, use_flat_format=True)
+        weight_key = list(save_dict.keys())[0]
+        for mmap in [False, True]:
+            load_dict = paddle.load(path, mmap=mmap, keys=[weight_key])
+            self.assertEqual(list(load_dict.keys()), [weight_key])
+            np.testing.assert_array_equal(
+                load_dict[weight_key].numpy(), save_dict[weight_key].numpy()
+            )
+        with self.assertRaises(ValueError):
+            paddle.load(path, keys=['not_exist'])
+
+    def test_memory_buffer(self):
+        save_dict = self.build_state_dict()
+        tensor = paddle.randn([2, 3])
+        byio = BytesIO()
+        paddle.save(save_dict, byio, use_flat_format=True)
+        paddle.save(tensor, byio)
+        byio.seek(0)
+        self.check_state_dict(paddle.load(byio), save_dict)
+        np.testing.assert_array_equal(paddle.load(byio).numpy(), tensor.numpy())
+
+        byio.seek(0)
+        with self.assertRaises(ValueError):
+            paddle.load(byio, mmap=True)
+
+    def test_illegal_input(self):
+        paddle.disable_static()
+        path = os.path.join(self.temp_dir.name, "illegal.pdparams")
+        with self.assertRaises(TypeError):
+            paddle.save(paddle.randn([2, 3]), path, use_flat_format=True)
+        with self.assertRaises(TypeError):
+            paddle.save({'a': (1, 2)}, path, use_flat_format=True)
+        with self.assertRaises(TypeError):
+            paddle.save({1: paddle.randn([2])}, path, use_flat_format=True)
+        with self.assertRaises(TypeError):
+            paddle.save({}, path, use_flat_format=1)
+
+        # mmap and keys are not supported for pickle format
+        paddle.save({'a': paddle.randn([2])}, path)
+        with self.assertRaises(ValueError):
+            paddle.load(path, mmap=True)
+
+
 class TestSaveLoadProgram(unittest.TestCase):
     def test_save_load_program(self):
         paddle.enable_static()
@@ -1237,6 +1237,97 @@ class TestFunctional(unittest.TestCase):
 
         self.assertTrue(test_adjust_hue(batch_tensor))
 
+    def test_batch_transforms(self):
+        paddle.seed(777)
+        np.random.seed(777)
+        batch_tensor = paddle.rand((4, 3, 16, 12), dtype=paddle.float32)
+
+        affine = transforms.BatchRandomAffine(
+            45,
+            translate=[0.2, 0.2],
+            scale=[0.5, 1.5],
+            shear=[-10, 10, -5, 5],
+            interpolation='bilinear',
+        )
+        batch_result = affine(batch_tensor)
+        self.assertEqual(batch_result.shape, [4, 3, 16, 12])
+        for i, img in enumerate(paddle.unbind(batch_tensor, axis=0)):
+            target_result = F.affine(
+                img,
+                float(affine.params['angle'][i]),
+                translate=affine.params['translate'][i].tolist(),
+                scale=float(affine.params['scale'][i]),
+                shear=affine.params['shear'][i].tolist(),
+                interpolation='bilinear',
+                fill=0,
+            )
+            np.testing.assert_allclose(
+                batch_result[i].numpy(), target_result.numpy(), atol=1e-5
+            )
+
+        perspective = transforms.BatchRandomPerspective(
+            prob=0.5, distortion_scale=0.5, interpolation='bilinear'
+        )
+        batch_result = perspective(batch_tensor)
+        self.assertEqual(batch_result.shape, [4, 3, 16, 12])
+        for i, img in enumerate(paddle.unbind(batch_tensor, axis=0)):
+            target_result = F.perspective(
+                img,
+                perspective.params['startpoints'][i].tolist(),
+                perspective.params['endpoints'][i].tolist(),
+                interpolation='bilinear',
+                fill=0,
+            )
+            # coefficients are solved by np.linalg.solve instead of lstsq
+            np.testing.assert_allclose(
+                batch_result[i].numpy(), target_result.numpy(), atol=1e-4
+            )
+
+        # affine composed with identity perspective is the same as affine
+        perspective = transforms.BatchRandomPerspective(
+            prob=0.0, interpolation='bilinear', affine=affine
+        )
+        batch_result = perspective(batch_tensor)
+        affine_params = perspective.params['affine']
+        for i, img in enumerate(paddle.unbind(batch_tensor, axis=0)):
+            target_result = F.affine(
+                img,
+                float(affine_params['angle'][i]),
+                translate=affine_params['translate'][i].tolist(),
+                scale=float(affine_params['scale'][i]),
+                shear=affine_params['shear'][i].tolist(),
+                interpolation='bilinear',
+                fill=0,
+            )
+            np.testing.assert_allclose(
+                batch_result[i].numpy(), target_result.numpy(), atol=1e-4
+            )
+
+        color_jitter = transforms.BatchColorJitter(0.4, 0.4, 0.4, 0.2)
+        batch_result = color_jitter(batch_tensor)
+        self.assertEqual(batch_result.shape, [4, 3, 16, 12])
+        for i, img in enumerate(paddle.unbind(batch_tensor, axis=0)):
+            target_result = F.adjust_brightness(
+                img, color_jitter.params['brightness'][i]
+            )
+            target_result = F.adjust_contrast(
+                target_result, color_jitter.params['contrast'][i]
+            )
+            target_result = F.adjust_saturation(
+                target_result, color_jitter.params['saturation'][i]
+            )
+            target_result = F.adjust_hue(
+                target_result, color_jitter.params['hue'][i]
+            )
+            np.testing.assert_allclose(
+                batch_result[i].numpy(), target_result.numpy(), atol=1e-5
+            )
+
+        uint8_tensor = (batch_tensor * 255).astype(paddle.uint8)
+        self.assertEqual(affine(uint8_tensor).dtype, paddle.uint8)
+        self.assertEqual(perspective(uint8_tensor).dtype, paddle.uint8)
+        self.assertEqual(color_jitter(uint8_tensor).dtype, paddle.uint8)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,106 @@
+# Copyright (c) 2024 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+
+import numpy as np
+
+from paddle.static.quantization.cal_kl_threshold import (
+    cal_kl_threshold,
+    cal_kl_thresholds,
+    expand_quantized_bins,
+    safe_entropy,
+)
+
+
+def cal_kl_threshold_ref(hist, bin_width, bits):
+    hist_bins = hist.shape[0]
+    starting_iter = int((hist_bins - 1) * 0.5)
+    quant_range = 2 ** (bits - 1) - 1
+    P_sum = np.sum(hist)
+    min_kl_divergence = None
+    min_kl_index = 0
+    for i in range(starting_iter, hist_bins):
+        reference_distr_P = hist[0:i].tolist()
+        if reference_distr_P[i - 1] == 0:
+            continue
+        reference_distr_P[i - 1] += sum(hist[i:])
+        num_merged_bins = int(i / quant_range)
+        candidate_distr_Q_quantized = [0] * quant_range
+        j_start = 0
+        j_end = num_merged_bins
+        for idx in range(quant_range):
+            candidate_distr_Q_quantized[idx] = sum(hist[j_start:j_end])
+            j_start += num_merged_bins
+            j_end += num_merged_bins
+            if (idx + 1) == quant_range - 1:
+                j_end = i
+        candidate_distr_Q = expand_quantized_bins(
+            candidate_distr_Q_quantized, reference_distr_P
+        )
+        kl_divergence = safe_entropy(
+            reference_distr_P, P_sum, candidate_distr_Q, sum(candidate_distr_Q)
+        )
+        if min_kl_divergence is None or kl_divergence < min_kl_divergence:
+            min_kl_divergence = kl_divergence
+            min_kl_index = i
+    if min_kl_index == 0:
+        while starting_iter > 0 and hist[starting_iter] == 0:
+            starting_iter -= 1
+        min_kl_index = starting_iter
+    return (min_kl_index + 0.5) * bin_width
+
+
+class TestCalKLThreshold(unittest.TestCase):
+    def setUp(self):
+        np.random.seed(2024)
+
+    def get_hist(self, bins, sparse=False):
+        data = np.abs(np.random.randn(20000) * np.random.uniform(0.1, 3))
+        hist, _ = np.histogram(
+            data, bins=bins, range=(0, data.max() * np.random.uniform(1, 3))
+        )
+        if sparse:
+            hist[np.random.randint(0, bins, bins // 3)] = 0
+        return hist
+
+    def test_compare_with_reference(self):
+        for bins, bits in [(64, 4), (300, 8), (2048, 8)]:
+            for sparse in [False, True]:
+                hist = self.get_hist(bins, sparse)
+                self.assertEqual(
+                    cal_kl_threshold(hist, 0.1, bits),
+                    cal_kl_threshold_ref(hist, 0.1, bits),
+                )
+
+    def test_zero_hist(self):
+        hist = np.zeros([16], dtype='int64')
+        self.assertEqual(cal_kl_threshold(hist, 1.0, 8), 0.5)
+
+    def test_parallel(self):
+        hists = [self.get_hist(bins) for bins in [128, 256, 2048]]
+        bin_widths = [0.1, 0.2, 0.3]
+        expected = [
+            cal_kl_threshold(hist, bin_width, 8)
+            for hist, bin_width in zip(hists, bin_widths)
+        ]
+        for num_workers in [None, 1, 4]:
+            self.assertEqual(
+                cal_kl_thresholds(hists, bin_widths, 8, num_workers),
+                expected,
+            )
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -29,6 +29,16 @@ from paddle.jit.sot.opcode_translator.custom_code import CustomCode
 from paddle.jit.sot.opcode_translator.executor.executor_cache import (
     OpcodeExecutorCache,
 )
+from paddle.jit.sot.opcode_translator.executor.guard import (
+    StringifyExpression,
+    make_guard,
+)
+from paddle.jit.sot.utils import (
+    ENV_SOT_CACHE_POLICY,
+    ENV_SOT_MAX_CACHE_SIZE,
+    tmp_name_guard,
+)
+from paddle.utils.environments import EnvironmentVariableGuard
 
 
 def fake_frames() -> (
@@ -149,6 +159,163 @@ class TestOpcodeExecutorCache(unittest.TestCase):
             self.assertEqual(translated_code_2.code, FRAME_4.f_code)
             self.assertEqual(ctx.translate_count, 2)
 
+    @patch(
+        "paddle.jit.sot.opcode_translator.executor.executor_cache.start_translate",
+        mock_start_translate,
+    )
+    def test_cache_stats(self):
+        with test_instruction_translator_cache_context() as ctx:
+            for _ in range(3):
+                OpcodeExecutorCache()(FRAME_1)
+            stats = ctx.stats[FRAME_1.f_code]
+            self.assertEqual(stats.hits, 2)
+            self.assertEqual(stats.misses, 1)
+            self.assertEqual(stats.evictions, 0)
+
+    @patch(
+        "paddle.jit.sot.opcode_translator.executor.executor_cache.start_translate",
+        mock_start_translate,
+    )
+    def test_cache_lru_eviction(self):
+        with EnvironmentVariableGuard(ENV_SOT_MAX_CACHE_SIZE, 2):
+            with test_instruction_translator_cache_context() as ctx:
+                for _ in range(5):
+                    translated_code = OpcodeExecutorCache()(FRAME_3)
+                    self.assertEqual(translated_code.code, FRAME_4.f_code)
+                self.assertEqual(ctx.translate_count, 5)
+                self.assertEqual(len(ctx.cache[FRAME_3.f_code]), 2)
+                stats = ctx.stats[FRAME_3.f_code]
+                self.assertEqual(stats.misses, 5)
+                self.assertEqual(stats.evictions, 3)
+
+    @patch(
+        "paddle.jit.sot.opcode_translator.executor.executor_cache.start_translate",
+        mock_start_translate,
+    )
+    def test_cache_fallback_policy(self):
+        with EnvironmentVariableGuard(
+            ENV_SOT_MAX_CACHE_SIZE, 2
+        ), EnvironmentVariableGuard(ENV_SOT_CACHE_POLICY, "fallback"):
+            with test_instruction_translator_cache_context() as ctx:
+                for _ in range(5):
+                    translated_code = OpcodeExecutorCache()(FRAME_3)
+                self.assertIsNone(translated_code.code)
+                self.assertEqual(ctx.translate_count, 2)
+                stats = ctx.stats[FRAME_3.f_code]
+                self.assertEqual(stats.misses, 2)
+                self.assertEqual(stats.fallbacks, 3)
+
+
+class TestSharedSubGuards(unittest.TestCase):
+    def test_shared_sub_guards(self):
+        call_count = [0]
+
+        def count():
+            call_count[0] += 1
+            return True
+
+        def make_frame(a, b):
+            frame = inspect.currentframe()
+            assert frame is not None
+            return frame
+
+        with tmp_name_guard():
+            shared = StringifyExpression(
+                "count() and frame.f_locals['a'] == 1", [], {"count": count}
+            )
+            guard_1 = make_guard(
+                [
+                    shared,
+                    StringifyExpression("frame.f_locals['b'] == 1", [], {}),
+                ]
+            )
+        with tmp_name_guard():
+            guard_2 = make_guard(
+                [
+                    StringifyExpression(
+                        "count() and frame.f_locals['a'] == 1",
+                        [],
+                        {"count": count},
+                    ),
+                    StringifyExpression("frame.f_locals['b'] == 2", [], {}),
+                ]
+            )
+
+        frame = make_frame(1, 2)
+        # the sub guards are made only when they are used
+        self.assertFalse(hasattr(guard_1, "sub_guards"))
+        sub_guard_results = {}
+        self.assertFalse(
+            OpcodeExecutorCache.check_guard(guard_1, frame, sub_guard_results)
+        )
+        self.assertTrue(
+            OpcodeExecutorCache.check_guard(guard_2, frame, sub_guard_results)
+        )
+        # the shared sub guard is evaluated only once
+        self.assertEqual(call_count[0], 1)
+        self.assertEqual(guard_2(frame), True)
+
+    def test_lookup_hit_path(self):
+        call_count = [0]
+
+        def count():
+            call_count[0] += 1
+            return True
+
+        def make_frame(a, b):
+            frame = inspect.currentframe()
+            assert frame is not None
+            return frame
+
+        guarded_fns = []
+        for b in range(3):
+            with tmp_name_guard():
+                guard = make_guard(
+                    [
+                        StringifyExpression(
+                            "count() and frame.f_locals['a'] == 1",
+                            [],
+                            {"count": count},
+                        ),
+                        StringifyExpression(
+                            f"frame.f_locals['b'] == {b}", [], {}
+                        ),
+                    ]
+                )
+            guarded_fns.append((CustomCode(None, False), guard))
+        guards = [guard for _, guard in guarded_fns]
+        cache = OpcodeExecutorCache()
+
+        # the most recently used entry is hit by its fused guard function,
+        # without making sub guards
+        cache.lookup(make_frame(1, 0), guarded_fns)
+        self.assertEqual(call_count[0], 1)
+        for guard in guards:
+            self.assertFalse(hasattr(guard, "sub_guards"))
+
+        # after a miss of the fused guard function, the sub guards shared
+        # by the other entries are evaluated only once
+        call_count[0] = 0
+        cache.lookup(make_frame(1, 2), guarded_fns)
+        self.assertEqual(call_count[0], 2)
+        self.assertFalse(hasattr(guards[0], "sub_guards"))
+        self.assertTrue(hasattr(guards[1], "sub_guards"))
+        self.assertIs(guarded_fns[0][1], guards[2])
+
+    def test_sub_guard_error(self):
+        def make_frame(a):
+            frame = inspect.currentframe()
+            assert frame is not None
+            return frame
+
+        with tmp_name_guard():
+            guard = make_guard(
+                [StringifyExpression("frame.f_locals['b'] == 1", [], {})]
+            )
+        # the error of a sub guard is not taken as a failed guard silently
+        with self.assertRaises(KeyError):
+            OpcodeExecutorCache.check_guard(guard, make_frame(1), {})
+
 
 def foo(x):
     return x + 1